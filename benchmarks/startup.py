@@ -0,0 +1,56 @@
+"""Measure how much llm-consortium adds to `llm` startup.
+
+Every `llm` command imports installed plugins and calls their `register_models`
+hook, so this is paid even by invocations that never use a consortium. Each
+measurement runs in a fresh interpreter and the median of several runs is
+reported:
+
+    python benchmarks/startup.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    "import llm": "import llm",
+    "import llm_consortium": "import llm; import llm_consortium",
+    "register_models": (
+        "import llm; import llm_consortium; "
+        "llm_consortium.register_models(lambda model, aliases=None: None)"
+    ),
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+"""
+
+
+def time_snippet(snippet: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(snippet=snippet)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=10, help="Interpreter launches per measurement")
+    args = parser.parse_args()
+
+    time_snippet("import llm; import llm_consortium", 1)  # Warm the bytecode cache
+    results = {name: time_snippet(snippet, args.runs) for name, snippet in SNIPPETS.items()}
+    for name, ms in results.items():
+        print(f"{name:<24}{ms:8.1f} ms")
+    print(f"{'plugin overhead':<24}{results['register_models'] - results['import llm']:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
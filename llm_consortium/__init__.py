@@ -1,13 +1,14 @@
 import click
 import json
 import llm
-from llm.cli import load_conversation  # Import from llm.cli instead of llm
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple, Union
 from datetime import datetime
+import functools
 import logging
 import sys
 import re
 import os
+import math
 import pathlib
 import sqlite_utils
 from pydantic import BaseModel
@@ -15,57 +16,40 @@ import time  # added import for time
 import concurrent.futures  # Add concurrent.futures for parallel processing
 import threading  # Add threading for thread-local storage
 import secrets
+import multiprocessing
 import uuid  # Add uuid import
-
-
-# Read system prompt from file
-def _read_system_prompt() -> str:
+from .scheduler import DispatchScheduler, dispatch_stats, estimate_tokens, provider_for
+from .rate_limit import CallCancelled, configure_limits, get_limiter, is_rate_limit_error, limiter_key, limiter_stats
+from .latency import hedge_budget, latency_tracker
+from .streaming import SynthesisStreamer
+from .cache import cache_key, get_cache
+from .db_writer import get_log_writer, writer_stats as log_writer_stats
+from .templates import TemplateError, get_template, register_template_dir
+from .model_pool import clear_models, pool_stats as model_pool_stats, resolve_async_model, resolve_model, warm as warm_models
+from . import batch as batch_runner
+from . import jobs as job_queue
+from .orchestrator_cache import config_key, get_orchestrator_cache, orchestrator_cache_stats
+from .singleflight import coalescing_stats, flight_key, get_singleflight
+from .strategies import ConsortiumStrategy, create_strategy
+from .parsing import ARBITER_PATTERNS, ARBITER_TAGS, MEMBER_CONFIDENCE_PATTERNS, PICK_ONE_PATTERNS, scan
+import asyncio
+import queue
+
+
+@functools.lru_cache(maxsize=None)
+def _default_system_prompt() -> str:
+    """The bundled system prompt, read on first use rather than at import."""
     try:
-        file_path = pathlib.Path(__file__).parent / "system_prompt.txt"
-        with open(file_path, "r") as f:
-            return f.read().strip()
+        return (pathlib.Path(__file__).parent / "system_prompt.txt").read_text().strip()
     except Exception as e:
         logger.error(f"Error reading system prompt file: {e}")
         return ""
 
-def _read_arbiter_prompt() -> str:
-    try:
-        file_path = pathlib.Path(__file__).parent / "arbiter_prompt.xml"
-        with open(file_path, "r") as f:
-            return f.read().strip()
-    except Exception as e:
-        logger.error(f"Error reading arbiter prompt file: {e}")
-        return ""
-
-def _read_iteration_prompt() -> str:
-    try:
-        file_path = pathlib.Path(__file__).parent / "iteration_prompt.txt"
-        with open(file_path, "r") as f:
-            return f.read().strip()
-    except Exception as e:
-        logger.error(f"Error reading iteration prompt file: {e}")
-        return ""
-
-
-def _read_pick_one_prompt() -> str:
-    try:
-        file_path = pathlib.Path(__file__).parent / "pick_one_prompt.xml"
-        with open(file_path, "r") as f:
-            return f.read().strip()
-    except Exception as e:
-        logger.error(f"Error reading pick_one_prompt.xml file: {e}")
-        return ""
-
-def _read_rank_prompt() -> str:
-    try:
-        file_path = pathlib.Path(__file__).parent / "rank_prompt.xml"
-        with open(file_path, "r") as f:
-            return f.read().strip()
-    except Exception as e:
-        logger.error(f"Error reading rank_prompt.xml file: {e}")
-        return ""
-
-DEFAULT_SYSTEM_PROMPT = _read_system_prompt()
+def __getattr__(name: str) -> Any:
+    # DEFAULT_SYSTEM_PROMPT stays importable without reading the file on every `llm` startup
+    if name == "DEFAULT_SYSTEM_PROMPT":
+        return _default_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def user_dir() -> pathlib.Path:
     """Get or create user directory for storing application data."""
@@ -76,8 +60,18 @@ def logs_db_path() -> pathlib.Path:
     """Get path to logs database."""
     return user_dir() / "logs.db"
 
+_logging_configured = False
+
 def setup_logging() -> None:
-    """Configure logging to write to both file and console."""
+    """Configure logging to write to both file and console.
+
+    Called when a consortium is first used rather than at import, since every
+    `llm` invocation imports this plugin. Safe to call more than once.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
     log_path = user_dir() / "consortium.log"
 
     # Create a formatter
@@ -98,8 +92,6 @@ def setup_logging() -> None:
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
 
-# Replace existing logging setup with new setup
-setup_logging()
 logger = logging.getLogger(__name__)
 logger.debug("llm_karpathy_consortium module is being imported")
 
@@ -131,12 +123,113 @@ def _get_finish_reason(response_json: Dict[str, Any]) -> Optional[str]:
 
     return None
 
+# Plain-text confidence fallback for member responses without a <confidence> tag
+_CONFIDENCE_LINE = re.compile(r"^.*confidence(?: level)?:.*$", re.IGNORECASE | re.MULTILINE)
+_CONFIDENCE_NUMBER = re.compile(r"(\d*\.?\d+)%?")
+
+def _usage_tokens(response) -> Optional[int]:
+    """Total tokens reported by a completed response, if the model reports usage."""
+    input_tokens = getattr(response, "input_tokens", None)
+    output_tokens = getattr(response, "output_tokens", None)
+    if not isinstance(input_tokens, int) and not isinstance(output_tokens, int):
+        return None
+    return (input_tokens if isinstance(input_tokens, int) else 0) + (output_tokens if isinstance(output_tokens, int) else 0)
+
+_HEDGE_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_HEDGE_EXECUTOR_LOCK = threading.Lock()
+
+def _hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared pool running hedged member calls (primary and duplicate)."""
+    global _HEDGE_EXECUTOR
+    with _HEDGE_EXECUTOR_LOCK:
+        if _HEDGE_EXECUTOR is None:
+            _HEDGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=64, thread_name_prefix="consortium-hedge")
+        return _HEDGE_EXECUTOR
+
+def _run_in_thread(fn: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+    """Run ``fn`` at once in its own daemon thread.
+
+    Used for arbiter calls under a time limit: they never queue behind pooled
+    member calls, and one abandoned at its limit holds no pool slot.
+    """
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name="consortium-arbiter", daemon=True).start()
+    return future
+
+
+class _StreamGate:
+    """Forwards synthesis chunks to ``on_chunk`` until revoked.
+
+    An arbiter call abandoned at its time limit keeps running in its thread; once
+    its gate is revoked, nothing it streams reaches the caller any more.
+    """
+
+    def __init__(self, on_chunk: Callable[[str], None]):
+        self._on_chunk = on_chunk
+        self._lock = threading.Lock()
+        self._revoked = False
+        self.forwarded = False
+
+    def __call__(self, chunk: str) -> None:
+        with self._lock:
+            if not self._revoked:
+                self.forwarded = True
+                self._on_chunk(chunk)
+
+    def revoke(self) -> bool:
+        """Stop forwarding chunks; returns whether any were forwarded before."""
+        with self._lock:
+            self._revoked = True
+            return self.forwarded
+
+
+class _EitherEvent:
+    """Reads as set once either of two events is; lets one call be cancelled apart from its whole run."""
+
+    def __init__(self, first: threading.Event, second: threading.Event):
+        self.first = first
+        self.second = second
+
+    def is_set(self) -> bool:
+        return self.first.is_set() or self.second.is_set()
+
+
+def _model_calls(result: Dict[str, Any]) -> int:
+    """Upstream model calls made by the run that produced ``result``."""
+    return result.get("metadata", {}).get("model_calls", 0)
+
+
+def _call_once(callback: Callable[[], None]) -> Callable[[], None]:
+    """Wrap a callback so that only its first invocation has an effect."""
+    lock = threading.Lock()
+    called = False
+
+    def wrapper():
+        nonlocal called
+        with lock:
+            if called:
+                return
+            called = True
+        callback()
+    return wrapper
+
 def log_response(response, model):
-    """Log model response to database and log file."""
+    """Queue a model response for logging to the database, and log truncation to the log file.
+
+    The database write happens on a background writer thread (see ``db_writer``),
+    so callers never touch SQLite themselves.
+    """
     try:
-        db = DatabaseConnection.get_connection()
-        response.log_to_db(db)
-        logger.debug(f"Response from {model} logged to database")
+        get_log_writer(logs_db_path()).submit(response, model)
 
         # Check for truncation in various formats
         if response.response_json:
@@ -150,9 +243,93 @@ def log_response(response, model):
         logger.error(f"Error logging to database: {e}")
 
 class IterationContext:
-    def __init__(self, synthesis: Dict[str, Any], model_responses: List[Dict[str, Any]]):
+    def __init__(self, synthesis: Dict[str, Any], model_responses: List[Dict[str, Any]],
+                 iteration: Optional[int] = None):
         self.synthesis = synthesis
         self.model_responses = model_responses
+        self.iteration = iteration
+        # Rendered <iteration> XML keyed by (number, compact); an iteration never changes once recorded
+        self._rendered: Dict[Tuple[int, bool], str] = {}
+
+    def render(self, number: int, compact: bool = False) -> str:
+        """The ``<iteration>`` element for the arbiter prompt, rendered once and reused.
+
+        The compact form leaves out member responses and keeps only the synthesis,
+        its confidence and the refinement areas.
+        """
+        key = (number, compact)
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            rendered = self._rendered[key] = self._render(number, compact)
+        return rendered
+
+    def _render(self, number: int, compact: bool) -> str:
+        refinement_areas = "\n                ".join(
+            f"<area>{area}</area>" for area in self.synthesis.get('refinement_areas', []))
+        if compact:
+            return f"""<iteration compact="true">
+            <iteration_number>{number}</iteration_number>
+            <synthesis>{self.synthesis.get('synthesis','Error')}</synthesis>
+            <confidence>{self.synthesis.get('confidence',0.0)}</confidence>
+            <refinement_areas>
+                {refinement_areas}
+            </refinement_areas>
+        </iteration>"""
+        model_responses = "\n".join(
+            f"<model_response>{r['model']}: {r.get('response', 'Error')}</model_response>"
+            for r in self.model_responses
+        )
+        return f"""<iteration>
+            <iteration_number>{number}</iteration_number>
+            <model_responses>
+                {model_responses}
+            </model_responses>
+            <synthesis>{self.synthesis.get('synthesis','Error')}</synthesis>
+            <confidence>{self.synthesis.get('confidence',0.0)}</confidence>
+            <refinement_areas>
+                {refinement_areas}
+            </refinement_areas>
+        </iteration>"""
+
+class RunContext:
+    """Mutable state of a single ``orchestrate`` call.
+
+    The orchestrator itself only holds configuration, so one instance can serve
+    any number of concurrent runs; everything a run accumulates lives here and
+    is released with it.
+    """
+
+    def __init__(self, consortium_id: Optional[str] = None, max_iterations: int = 1,
+                 deadline: Optional[float] = None):
+        self.consortium_id = consortium_id
+        # Effective iteration limit: pick-one and rank always run a single iteration
+        self.max_iterations = max_iterations
+        self.started = time.monotonic()
+        # Monotonic time by which the run must finish, if it has a deadline
+        self.deadline = None if deadline is None else self.started + deadline
+        # Set once the run no longer needs its calls; abandoned member threads check it before retrying
+        self.cancelled = threading.Event()
+        # The run's own strategy instance, so strategy state is never shared between concurrent runs
+        self.strategy: Optional[ConsortiumStrategy] = None
+        # Members the strategy selected for the current iteration; None queries every member
+        self.models: Optional[Dict[str, int]] = None
+        # Highest cascade tier taking part; set by the orchestrator when the consortium has tiers
+        self.tier: Optional[int] = None
+        self.iteration_history: List[IterationContext] = []
+        # Member calls run on several threads; counters in ``stats`` are updated through ``count``
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            "dispatch_held_seconds": 0.0, "iterations": 0, "stragglers": [],
+            "hedges_issued": 0, "hedges_won": 0, "cache_hits": 0, "cache_misses": 0,
+            "arbiter_prompt_tokens": [], "history_tokens": [], "model_calls": 0,
+            "timed_out": [], "phases": [], "stopped_early": None, "selections": [],
+            "escalations": [], "arbiter_calls": [], "stream_truncated": False, "quorum_required": [],
+        }
+
+    def count(self, key: str, amount: float = 1) -> None:
+        """Add ``amount`` to the counter ``key`` of ``stats``."""
+        with self._stats_lock:
+            self.stats[key] += amount
 
 class ConsortiumConfig(BaseModel):
     models: Dict[str, int]  # Maps model names to instance counts
@@ -162,6 +339,46 @@ class ConsortiumConfig(BaseModel):
     minimum_iterations: int = 1
     arbiter: Optional[str] = None
     judging_method: str = "default"
+    # Start arbitration once this many members have answered: a count (>= 1) or a fraction of all instances
+    quorum: Optional[float] = None
+    # Send a duplicate member request once a call exceeds this latency percentile (e.g. 90) of the model's recent calls
+    hedge_percentile: Optional[float] = None
+    # Maximum hedged requests as a fraction of primary requests, per model
+    hedge_budget: float = 0.1
+    # Per-model or per-provider limits, e.g. {"openai": {"requests_per_minute": 500, "max_concurrency": 20}}
+    rate_limits: Dict[str, Dict[str, float]] = {}
+    # Serve repeated member and arbiter prompts from a local response cache
+    cache: bool = False
+    # Seconds a cached response stays valid
+    cache_ttl: float = 24 * 60 * 60
+    # Size limit of the cache; least recently used responses are evicted beyond it
+    cache_max_bytes: int = 256 * 1024 * 1024
+    # Keep a unique id in every member prompt even when caching, so providers never see identical prompts
+    force_diversity: bool = False
+    # Only the last N iterations are shown to the arbiter in full; None shows every iteration
+    history_window: Optional[int] = None
+    # Summarise iterations older than the window (synthesis, confidence, refinement areas) instead of dropping them
+    compact_history: bool = False
+    # Let concurrent identical runs (same config, prompt and history) share one run, and so one sampled
+    # answer and consortium_id; off by default since callers then no longer get independent runs
+    coalesce: bool = False
+    # Seconds the whole run may take; members still running when arbitration must start are dropped
+    deadline: Optional[float] = None
+    # Per-call time limits in seconds, by model id or provider; "default" applies to every other model
+    model_timeouts: Dict[str, float] = {}
+    # Seconds of the deadline kept for the arbiter (default: the arbiter's timeout, or a quarter of the deadline)
+    arbiter_reserve: Optional[float] = None
+    # Strategy choosing the members queried on each iteration (see llm_consortium.strategies) and its parameters
+    strategy: str = "default"
+    strategy_params: Dict[str, Any] = {}
+    # Cascade tier of each model (1 = cheapest, the default): a tier only joins when the previous iteration fell
+    # short of confidence_threshold
+    tiers: Dict[str, int] = {}
+    # Arbiter cascade, cheapest first; overrides arbiter. A later arbiter is only asked when the previous one's
+    # synthesis falls below confidence_threshold, cannot be parsed, or carries strong dissent
+    arbiters: List[str] = []
+    # Dissent of at least this many words counts as strong and escalates the arbiter cascade; None ignores dissent
+    arbiter_dissent_words: Optional[int] = 50
 
     def to_dict(self):
         return self.model_dump()
@@ -172,27 +389,267 @@ class ConsortiumConfig(BaseModel):
 
 class ConsortiumOrchestrator:
     def __init__(self, config: ConsortiumConfig):
+        setup_logging()
         self.models = config.models
         # Store system_prompt from config
         self.system_prompt = config.system_prompt
         self.confidence_threshold = config.confidence_threshold
         self.max_iterations = config.max_iterations
         self.minimum_iterations = config.minimum_iterations
-        self.arbiter = config.arbiter or "gemini-2.0-flash"
+        self.arbiters = list(config.arbiters) or [config.arbiter or "gemini-2.0-flash"]
+        # The first arbiter asked; later ones in a cascade only see the iterations it could not settle
+        self.arbiter = self.arbiters[0]
+        self.arbiter_dissent_words = config.arbiter_dissent_words
         self.judging_method = config.judging_method
-        self.iteration_history: List[IterationContext] = []
-        self.consortium_id: Optional[str] = None
-        # New: Dictionary to track conversation IDs for each model instance
-        # self.conversation_ids: Dict[str, str] = {}
+        self.quorum = config.quorum
+        self.hedge_percentile = config.hedge_percentile
+        self.hedge_budget = config.hedge_budget
+        self.history_window = config.history_window
+        self.compact_history = config.compact_history
+        self.scheduler = DispatchScheduler()
+        self.cache = get_cache(user_dir() / "consortium_cache.db", config.cache_max_bytes) if config.cache else None
+        self.cache_ttl = config.cache_ttl
+        # A fresh UUID in each member prompt defeats caching, so it is left out unless diversity is forced
+        self.inject_uuid = self.cache is None or config.force_diversity
+        self.coalesce = config.coalesce
+        self.deadline = config.deadline
+        self.model_timeouts = config.model_timeouts
+        self.arbiter_reserve = config.arbiter_reserve
+        self.strategy_name = config.strategy
+        self.strategy_params = config.strategy_params
+        self.tiers = {model: config.tiers.get(model, 1) for model in self.models} if config.tiers else {}
+        unknown_tiers = set(config.tiers) - set(self.models)
+        if unknown_tiers:
+            logger.warning(f"Tiers given for models outside the consortium: {sorted(unknown_tiers)}")
+        self.config_key = config_key(config.to_dict())
+        for key, limits in config.rate_limits.items():
+            configure_limits(key, **limits)
+        # Fail on an unknown strategy or invalid parameters now rather than on the first prompt
+        create_strategy(self.strategy_name, self, self.strategy_params)
+        # Nothing below is changed by a run: per-run state lives in RunContext
+
+    def orchestrate(self, prompt: str, conversation_history: str = "", consortium_id: Optional[str] = None,
+                    on_synthesis_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Run the consortium on ``prompt``.
+
+        If ``on_synthesis_chunk`` is given, the synthesis of the last permitted
+        iteration is passed to it chunk by chunk while the arbiter generates it.
+        With ``coalesce`` on, a call made while an identical one (same config,
+        prompt and history) is running waits for that run and shares its result.
+        """
+        if not self.coalesce:
+            return self._orchestrate(prompt, conversation_history, consortium_id, on_synthesis_chunk)
+        result, coalesced = get_singleflight().do(
+            flight_key(self.config_key, prompt, conversation_history),
+            # The leader only streams if its own caller asked for it
+            lambda publish: self._orchestrate(prompt, conversation_history, consortium_id,
+                                              publish if on_synthesis_chunk is not None else None),
+            on_chunk=on_synthesis_chunk, calls=_model_calls)
+        if coalesced:
+            result["metadata"]["coalesced"] = True
+        return result
 
-    def orchestrate(self, prompt: str, conversation_history: str = "", consortium_id: Optional[str] = None) -> Dict[str, Any]:
-        self.consortium_id = consortium_id
+    def _orchestrate(self, prompt: str, conversation_history: str = "", consortium_id: Optional[str] = None,
+                     on_synthesis_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        run = self._new_run(consortium_id)
         iteration_count = 0
         final_result = None
         original_prompt = prompt
         raw_arbiter_response_final = "" # Store the final raw response
 
-        # Construct the prompt including history, system prompt, and original user prompt
+        current_prompt = self._build_initial_prompt(original_prompt, conversation_history)
+
+        while iteration_count < run.max_iterations or iteration_count < self.minimum_iterations:
+            if iteration_count and self._deadline_reached(run):
+                run.stats["stopped_early"] = "deadline"
+                logger.info(f"Deadline reached, stopping after {iteration_count} iteration(s)")
+                break
+            run.models = self._select_models(current_prompt, iteration_count + 1, run)
+            if not run.models:
+                run.stats["stopped_early"] = "strategy"
+                logger.info(f"Strategy selected no models, stopping after {iteration_count} iteration(s)")
+                break
+            iteration_count += 1
+            run.stats["iterations"] = iteration_count
+            logger.debug(f"Starting iteration {iteration_count}")
+
+            # Get responses from the selected models using the current prompt
+            phase_start = time.monotonic()
+            model_responses = self._get_model_responses(current_prompt, run)
+            members_done = time.monotonic()
+            arbiter_responses = self._arbiter_responses(model_responses, run)
+            # Add a unique ID to each response for the arbiter to reference
+            for i, r in enumerate(arbiter_responses, 1):
+                r['id'] = i
+
+            # Have arbiter synthesize and evaluate responses
+            on_chunk = on_synthesis_chunk if self._is_streamed_iteration(iteration_count, run) else None
+            try:
+                synthesis_result = self._synthesize_responses(original_prompt, arbiter_responses, on_chunk, run)
+            except TimeoutError:
+                final_result = synthesis_result = self._arbiter_timeout_result(arbiter_responses, run)
+                break
+            finally:
+                self._record_phases(run, members_done - phase_start, time.monotonic() - members_done)
+            # Store the raw response text from this iteration
+            raw_arbiter_response_final = synthesis_result.get("raw_arbiter_response", "")
+
+            done, final_result = self._complete_iteration(synthesis_result, model_responses, iteration_count,
+                                                          raw_arbiter_response_final, run)
+            if done:
+                break
+            # Prepare for next iteration if needed
+            current_prompt = self._construct_iteration_prompt(original_prompt, synthesis_result)
+
+        # Calls abandoned at a time limit stop retrying
+        run.cancelled.set()
+        return self._build_result(original_prompt, model_responses, final_result, synthesis_result, iteration_count,
+                                  raw_arbiter_response_final, run)
+
+    def warm(self, connect: bool = True) -> Dict[str, Optional[str]]:
+        """Resolve the member and arbiter models and open their connections before the first prompt.
+
+        Returns a mapping of model name to an error message, or None for models that warmed up.
+        """
+        return warm_models([*self.models, *self.arbiters], connect=connect)
+
+    def _new_run(self, consortium_id: Optional[str] = None) -> RunContext:
+        # For non-iterative methods, run only once
+        max_iterations = self.max_iterations if self.judging_method == "default" else 1
+        run = RunContext(consortium_id, max_iterations, self.deadline)
+        run.strategy = create_strategy(self.strategy_name, self, self.strategy_params)
+        run.strategy.initialize_state()
+        if self.tiers:
+            run.tier = min(self.tiers.values())
+        return run
+
+    def _available_models(self, run: RunContext) -> Dict[str, int]:
+        """Members the run may query now: all of them, or those in the tiers reached so far."""
+        if run.tier is None:
+            return dict(self.models)
+        return {model: count for model, count in self.models.items() if self.tiers[model] <= run.tier}
+
+    def _escalate(self, synthesis: Dict[str, Any], run: RunContext) -> None:
+        """Bring in the next cascade tier after an iteration that fell short of the confidence threshold."""
+        higher = sorted(tier for tier in set(self.tiers.values()) if run.tier is not None and tier > run.tier)
+        if not higher or synthesis.get("confidence", 0.0) >= self.confidence_threshold:
+            return
+        run.stats["escalations"].append({"iteration": run.stats["iterations"], "from_tier": run.tier,
+                                         "to_tier": higher[0], "confidence": synthesis.get("confidence", 0.0)})
+        logger.info(f"Confidence {synthesis.get('confidence', 0.0)} below {self.confidence_threshold}, "
+                    f"escalating from tier {run.tier} to tier {higher[0]}")
+        run.tier = higher[0]
+
+    def _select_models(self, prompt: str, iteration: int, run: RunContext) -> Dict[str, int]:
+        """Members (and instance counts) the run's strategy queries on ``iteration``."""
+        available = self._available_models(run)
+        if run.strategy is None:
+            return available
+        selected = run.strategy.select_models(dict(available), prompt, iteration)
+        unknown = [model for model in selected if model not in available]
+        if unknown:
+            logger.warning(f"Strategy selected models outside the consortium or its current tiers, "
+                           f"ignoring them: {unknown}")
+        # A strategy may use fewer instances of a model, never more
+        models = {model: min(int(count), available[model]) for model, count in selected.items()
+                  if model in available and count > 0}
+        if not models and iteration == 1:
+            logger.warning("Strategy selected no models for the first iteration; using all of them")
+            models = available
+        selection = {"iteration": iteration, "models": dict(models), "instances": sum(models.values())}
+        if run.tier is not None:
+            # The highest tier actually queried, which a strategy may keep below the tier reached
+            selection["tier"] = max((self.tiers[model] for model in models), default=run.tier)
+        run.stats["selections"].append(selection)
+        logger.info(f"Iteration {iteration}: querying {sum(models.values())} instance(s) of {len(models)} model(s)")
+        return models
+
+    def _arbiter_responses(self, responses: List[Dict[str, Any]], run: RunContext) -> List[Dict[str, Any]]:
+        """The responses shown to the arbiter: successful ones as processed by the strategy, plus failures."""
+        if run.strategy is None:
+            return responses
+        successful = [r for r in responses if "error" not in r]
+        kept = run.strategy.process_responses(successful, run.stats["iterations"])
+        return self._in_stable_order([*kept, *(r for r in responses if "error" in r)])
+
+    def _model_timeout(self, model: str) -> Optional[float]:
+        """Time limit for one call to ``model``: set for the model, its provider, or by default."""
+        for key in (model, provider_for(model), "default"):
+            if key in self.model_timeouts:
+                return self.model_timeouts[key]
+        return None
+
+    def _members_deadline(self, run: RunContext) -> Optional[float]:
+        """Monotonic time by which members must have answered so the arbiter can still finish in time."""
+        if run.deadline is None:
+            return None
+        reserve = self.arbiter_reserve
+        if reserve is None:
+            # Enough for every arbiter of a cascade to use its full timeout
+            timeouts = [self._model_timeout(arbiter) for arbiter in self.arbiters]
+            reserve = sum(t for t in timeouts if t is not None) or 0.25 * self.deadline
+        return run.deadline - reserve
+
+    def _member_expiry(self, model: str, started: float, run: RunContext) -> Optional[float]:
+        """Monotonic time after which a member call started at ``started`` is abandoned."""
+        timeout = self._model_timeout(model)
+        limits = [limit for limit in (None if timeout is None else started + timeout, self._members_deadline(run))
+                  if limit is not None]
+        return min(limits) if limits else None
+
+    def _arbiter_time_limit(self, arbiter: str, run: RunContext) -> Optional[float]:
+        """Seconds ``arbiter`` may take in this iteration, or None if unlimited."""
+        limits = [self._model_timeout(arbiter)]
+        if run.deadline is not None:
+            limits.append(max(run.deadline - time.monotonic(), 0.0))
+        limits = [limit for limit in limits if limit is not None]
+        return min(limits) if limits else None
+
+    def _timed_out_response(self, model: str, instance: int, started: float, run: RunContext) -> Dict[str, Any]:
+        """Record a member call abandoned at its time limit and return its error entry."""
+        elapsed = round(time.monotonic() - started, 3)
+        timeout = self._model_timeout(model)
+        reason = "model_timeout" if timeout is not None and elapsed >= timeout else "deadline"
+        run.stats["timed_out"].append({"model": model, "instance": instance + 1, "iteration": run.stats["iterations"],
+                                       "after_seconds": elapsed, "reason": reason})
+        return {"model": model, "instance": instance + 1, "error": f"Timed out after {elapsed:.1f}s",
+                "timed_out": True}
+
+    def _deadline_reached(self, run: RunContext) -> bool:
+        """Whether there is no time left to run members for another iteration."""
+        members_deadline = self._members_deadline(run)
+        return members_deadline is not None and time.monotonic() >= members_deadline
+
+    def _record_phases(self, run: RunContext, members_seconds: float, arbiter_seconds: float) -> None:
+        run.stats["phases"].append({"iteration": run.stats["iterations"], "members_seconds": round(members_seconds, 3),
+                                    "arbiter_seconds": round(arbiter_seconds, 3)})
+
+    def _arbiter_timeout_result(self, responses: List[Dict[str, Any]], run: RunContext) -> Dict[str, Any]:
+        """Synthesis used when the arbiter misses its time limit: the last synthesis, or the best member answer."""
+        run.stats["stopped_early"] = "arbiter_timeout"
+        logger.warning("Arbiter timed out; returning the best result available")
+        if run.iteration_history:
+            return dict(run.iteration_history[-1].synthesis)
+        answered = [r for r in responses if "response" in r]
+        best = max(answered, key=lambda r: r.get("confidence") or 0.0, default=None)
+        return {
+            "synthesis": best["response"] if best else "Error: Arbiter timed out and no member answered.",
+            "confidence": 0.0, "analysis": "Arbiter timed out; this is an unsynthesised member response."
+            if best else "Arbiter timed out.", "dissent": "", "needs_iteration": False,
+            "refinement_areas": [], "raw_arbiter_response": "",
+        }
+
+    def _is_streamed_iteration(self, iteration_count: int, run: RunContext) -> bool:
+        """Whether the arbiter pass of this iteration may be streamed to the caller.
+
+        The arbiter reports its confidence after the synthesis, so only a pass that is
+        final regardless of confidence can be streamed. Pick-one and rank take their
+        synthesis from a member response rather than from the arbiter's output.
+        """
+        return self.judging_method == "default" and iteration_count >= max(run.max_iterations, self.minimum_iterations)
+
+    def _build_initial_prompt(self, original_prompt: str, conversation_history: str = "") -> str:
+        """Construct the first-iteration prompt from history, system prompt and user prompt."""
         full_prompt_parts = []
         if conversation_history:
             # Append history if provided
@@ -208,70 +665,59 @@ class ConsortiumOrchestrator:
 
         combined_prompt = "\n\n".join(full_prompt_parts)
 
-        current_prompt = f"""<prompt>
+        return f"""<prompt>
     <instruction>{combined_prompt}</instruction>
 </prompt>"""
 
-        # For non-iterative methods, run only once
-        if hasattr(self, "judging_method") and self.judging_method != "default":
-            self.max_iterations = 1
-
-        while iteration_count < self.max_iterations or iteration_count < self.minimum_iterations:
-            iteration_count += 1
-            logger.debug(f"Starting iteration {iteration_count}")
-
-            # Get responses from all models using the current prompt
-            model_responses = self._get_model_responses(current_prompt)
-            # Add a unique ID to each response for the arbiter to reference
-            for i, r in enumerate(model_responses, 1):
-                r['id'] = i
-
-            # Have arbiter synthesize and evaluate responses
-            synthesis_result = self._synthesize_responses(original_prompt, model_responses)
-            # Store the raw response text from this iteration
-            raw_arbiter_response_final = synthesis_result.get("raw_arbiter_response", "")
-
-
-            # Defensively check if synthesis_result is not None before proceeding
-            if synthesis_result is not None:
-                 # Ensure synthesis has the required keys to avoid KeyError
-                if "confidence" not in synthesis_result:
-                    synthesis_result["confidence"] = 0.0
-                    logger.warning("Missing 'confidence' in synthesis, using default value 0.0")
-
-                # Store iteration context
-                self.iteration_history.append(IterationContext(synthesis_result, model_responses))
-
-                if synthesis_result["confidence"] >= self.confidence_threshold and iteration_count >= self.minimum_iterations:
-                    final_result = synthesis_result
-                    break
-
-                # Prepare for next iteration if needed
-                current_prompt = self._construct_iteration_prompt(original_prompt, synthesis_result)
-            else:
-                # Handle the unexpected case where synthesis_result is None
-                logger.error("Synthesis result was None, breaking iteration.")
-                # Use the last valid synthesis if available, otherwise create a fallback
-                if self.iteration_history:
-                    final_result = self.iteration_history[-1].synthesis
-                else:
-                    final_result = {
-                        "synthesis": "Error: Failed to get synthesis.", "confidence": 0.0,
-                         "analysis": "Consortium failed.", "dissent": "", "needs_iteration": False,
-                         "refinement_areas": [], "raw_arbiter_response": raw_arbiter_response_final
-                    }
-                break
-
+    def _complete_iteration(self, synthesis_result: Optional[Dict[str, Any]], model_responses: List[Dict[str, Any]],
+                            iteration_count: int, raw_arbiter_response: str,
+                            run: RunContext) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Record an iteration and decide whether the run is finished.
+
+        Returns a ``(done, final_result)`` tuple; ``final_result`` is only set when ``done`` is True.
+        """
+        # Defensively check if synthesis_result is not None before proceeding
+        if synthesis_result is not None:
+             # Ensure synthesis has the required keys to avoid KeyError
+            if "confidence" not in synthesis_result:
+                synthesis_result["confidence"] = 0.0
+                logger.warning("Missing 'confidence' in synthesis, using default value 0.0")
+
+            # Store iteration context
+            context = IterationContext(synthesis_result, model_responses, iteration_count)
+            run.iteration_history.append(context)
+            if run.strategy is not None:
+                run.strategy.update_state(context)
+
+            if synthesis_result["confidence"] >= self.confidence_threshold and iteration_count >= self.minimum_iterations:
+                return True, synthesis_result
+            if iteration_count < max(run.max_iterations, self.minimum_iterations):
+                self._escalate(synthesis_result, run)
+            return False, None
+
+        # Handle the unexpected case where synthesis_result is None
+        logger.error("Synthesis result was None, breaking iteration.")
+        # Use the last valid synthesis if available, otherwise create a fallback
+        if run.iteration_history:
+            return True, run.iteration_history[-1].synthesis
+        return True, {
+            "synthesis": "Error: Failed to get synthesis.", "confidence": 0.0,
+             "analysis": "Consortium failed.", "dissent": "", "needs_iteration": False,
+             "refinement_areas": [], "raw_arbiter_response": raw_arbiter_response
+        }
 
+    def _build_result(self, original_prompt: str, model_responses: List[Dict[str, Any]], final_result: Optional[Dict[str, Any]],
+                      synthesis_result: Optional[Dict[str, Any]], iteration_count: int, raw_arbiter_response: str,
+                      run: RunContext) -> Dict[str, Any]:
+        """Assemble the result dictionary returned by ``orchestrate``."""
         if final_result is None:
              # If loop finished without meeting threshold, use the last synthesis_result
             final_result = synthesis_result if synthesis_result is not None else {
                  "synthesis": "Error: No final synthesis.", "confidence": 0.0,
                  "analysis":"Consortium finished iterations.", "dissent": "", "needs_iteration": False,
-                 "refinement_areas": [], "raw_arbiter_response": raw_arbiter_response_final
+                 "refinement_areas": [], "raw_arbiter_response": raw_arbiter_response
             }
 
-
         return {
             "original_prompt": original_prompt,
             # Storing all model responses might be verbose, consider adjusting if needed
@@ -280,41 +726,195 @@ class ConsortiumOrchestrator:
             "metadata": {
                 "models_used": self.models,
                 "arbiter": self.arbiter,
+                "arbiters": self._arbiter_stats(run),
                 "timestamp": datetime.utcnow().isoformat(),
-                "iteration_count": iteration_count
+                "iteration_count": iteration_count,
+                "consortium_id": run.consortium_id,
+                "dispatch": dispatch_stats(run.stats.get("dispatch_held_seconds", 0.0), iteration_count),
+                "quorum": {
+                    # Of the members queried in the last iteration, which a strategy may have narrowed
+                    "required": (run.stats["quorum_required"][-1]["required"] if run.stats.get("quorum_required")
+                                 else self._quorum_size(sum(self.models.values()))),
+                    "per_iteration": [dict(entry) for entry in run.stats.get("quorum_required", [])],
+                    "stragglers": [dict(entry) for entry in run.stats.get("stragglers", [])],
+                },
+                "model_calls": run.stats.get("model_calls", 0),
+                "strategy": {
+                    "name": self.strategy_name,
+                    "params": dict(self.strategy_params),
+                    "selections": [dict(entry, models=dict(entry["models"])) for entry in run.stats.get("selections", [])],
+                },
+                "tiers": {
+                    "models": dict(self.tiers),
+                    # The tier whose members took part in the final answer; below the top tier, no expensive call was made
+                    "answered_by": next((entry["tier"] for entry in reversed(run.stats.get("selections", []))
+                                         if "tier" in entry), run.tier),
+                    "escalations": [dict(entry) for entry in run.stats.get("escalations", [])],
+                } if self.tiers else None,
+                "timing": {
+                    "deadline": self.deadline,
+                    "elapsed_seconds": round(time.monotonic() - run.started, 3),
+                    "stopped_early": run.stats.get("stopped_early"),
+                    "phases": [dict(phase) for phase in run.stats.get("phases", [])],
+                    "timed_out": [dict(entry) for entry in run.stats.get("timed_out", [])],
+                    "stream_truncated": run.stats.get("stream_truncated", False),
+                },
+                "hedging": {
+                    "issued": run.stats.get("hedges_issued", 0),
+                    "won": run.stats.get("hedges_won", 0),
+                },
+                "cache": {
+                    "enabled": self.cache is not None,
+                    "hits": run.stats.get("cache_hits", 0),
+                    "misses": run.stats.get("cache_misses", 0),
+                },
+                "arbiter_prompt": {
+                    "tokens": list(run.stats.get("arbiter_prompt_tokens", [])),
+                    "history_tokens": list(run.stats.get("history_tokens", [])),
+                    "history_window": self.history_window,
+                    "compact_history": self.compact_history,
+                },
+                "log_writer": get_log_writer(logs_db_path()).stats(),
+                "rate_limits": {
+                    key: stats for key, stats in limiter_stats().items()
+                    if key in {limiter_key(model) for model in [*self.models, *self.arbiters]}
+                },
             }
         }
 
-    def _get_model_responses(self, prompt: str) -> List[Dict[str, Any]]:
+    def _get_model_responses(self, prompt: str, run: Optional[RunContext] = None) -> List[Dict[str, Any]]:
+        run = run or self._new_run()
         responses = []
-        first_prompt_sent = False
-        
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = []
-            for model, count in self.models.items():
-                for instance in range(count):
-                    # If this is the first prompt, mark it and submit immediately
-                    if not first_prompt_sent:
-                        futures.append(
-                            executor.submit(self._get_model_response, model, prompt, instance, self.consortium_id)
-                        )
-                        first_prompt_sent = True
-                        # Sleep for 5 seconds to allow prompt caching to kick in
-                        time.sleep(5)
-                    else:
-                        futures.append(
-                            executor.submit(self._get_model_response, model, prompt, instance, self.consortium_id)
-                        )
-
-            # Gather all results as they complete
-            for future in concurrent.futures.as_completed(futures):
-                responses.append(future.result())
-
-        return responses
-
-    def _get_model_response(self, model: str, prompt: str, instance: int, consortium_id: Optional[str] = None) -> Dict[str, Any]:
+        plan = self.scheduler.plan(self.models if run.models is None else run.models, prompt)
+        jobs: Dict[concurrent.futures.Future, Tuple[str, int]] = {}
+        started: Dict[concurrent.futures.Future, float] = {}
+
+        # Not used as a context manager: once a quorum is reached we return
+        # without waiting for the stragglers' threads to finish.
+        executor = concurrent.futures.ThreadPoolExecutor()
+
+        def submit(model: str, instance: int, **kwargs) -> None:
+            future = executor.submit(self._get_model_response, model, prompt, instance, run, **kwargs)
+            jobs[future] = (model, instance)
+            started[future] = time.monotonic()
+
+        for model, instance in plan.immediate:
+            submit(model, instance)
+
+        # Send one leader per caching provider; its followers are released as soon as
+        # the provider starts answering it, so they can reuse the warm prefix cache.
+        warm_providers = queue.Queue()
+        for provider, ((model, instance), _) in plan.held.items():
+            submit(model, instance, on_first_token=lambda provider=provider: warm_providers.put(provider))
+
+        hold_start = time.monotonic()
+        held = dict(plan.held)
+        while held:
+            remaining = self.scheduler.max_hold - (time.monotonic() - hold_start)
+            try:
+                provider = warm_providers.get(timeout=max(remaining, 0))
+            except queue.Empty:
+                logger.debug(f"Cache warm-up hold expired for providers {list(held)}")
+                provider = next(iter(held))
+            _, followers = held.pop(provider)
+            for model, instance in followers:
+                submit(model, instance)
+        if plan.held:
+            run.count("dispatch_held_seconds", time.monotonic() - hold_start)
+
+        # Gather results as they complete, stopping early once the quorum is met
+        quorum = self._record_quorum(len(jobs), run)
+        successful = 0
+        pending = set(jobs)
+        while pending:
+            expiries = {future: self._member_expiry(jobs[future][0], started[future], run) for future in pending}
+            timeout = self._wait_timeout(expiries.values())
+            done, pending = concurrent.futures.wait(pending, timeout=timeout,
+                                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                response = future.result()
+                responses.append(response)
+                if "error" not in response:
+                    successful += 1
+            now = time.monotonic()
+            for future in [f for f in pending if expiries[f] is not None and expiries[f] <= now]:
+                # Late calls are abandoned: the thread cannot be stopped, but nothing waits for it
+                future.cancel()
+                pending.discard(future)
+                responses.append(self._timed_out_response(*jobs[future], started[future], run))
+            if successful >= quorum and pending:
+                break
+
+        self._record_stragglers([(jobs[future], future) for future in pending], run)
+        # Don't wait for stragglers or calls abandoned at their time limit
+        executor.shutdown(wait=all(future.done() for future in jobs), cancel_futures=True)
+        return self._in_stable_order(responses)
+
+    def _wait_timeout(self, expiries: Iterable[Optional[float]]) -> Optional[float]:
+        """Seconds until the earliest of ``expiries``, or None when no call has a time limit."""
+        limits = [expiry for expiry in expiries if expiry is not None]
+        return max(min(limits) - time.monotonic(), 0.0) if limits else None
+
+    def _in_stable_order(self, responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Arbitrate in a fixed order rather than completion order, so identical
+        # answers produce an identical (and cacheable) arbiter prompt
+        return sorted(responses, key=lambda r: (r["model"], r["instance"]))
+
+    def _record_quorum(self, members: int, run: RunContext) -> int:
+        """The quorum for an iteration querying ``members`` instances, noted in the run metadata."""
+        quorum = self._quorum_size(members)
+        run.stats["quorum_required"].append({"iteration": run.stats["iterations"], "members": members,
+                                             "required": quorum})
+        return quorum
+
+    def _quorum_size(self, total: int) -> int:
+        """Number of successful member responses needed before arbitration may start."""
+        if not self.quorum:
+            return total
+        if self.quorum < 1:
+            return min(total, max(1, math.ceil(self.quorum * total)))
+        return min(total, int(self.quorum))
+
+    def _record_stragglers(self, stragglers: List[Tuple[Tuple[str, int], Any]], run: RunContext) -> None:
+        """Cancel members still running after the quorum was met and note them in the run metadata.
+
+        ``stragglers`` pairs each ``(model, instance)`` with its future or asyncio task.
+        """
+        quorum_reached = time.monotonic()
+        for (model, instance), call in stragglers:
+            entry = {"model": model, "instance": instance + 1, "iteration": run.stats["iterations"],
+                     "status": "cancelled" if call.cancel() else "ignored"}
+            if entry["status"] == "ignored":
+                # Threads cannot be interrupted; mark the response late if it arrives before the run ends
+                def mark_late(_, entry=entry):
+                    entry["status"] = "late"
+                    entry["late_by_seconds"] = round(time.monotonic() - quorum_reached, 3)
+                call.add_done_callback(mark_late)
+            run.stats["stragglers"].append(entry)
+        if stragglers:
+            logger.info(f"Quorum reached, not waiting for {len(stragglers)} straggling member(s)")
+
+    def _get_model_response(self, model: str, prompt: str, instance: int, run: Optional[RunContext] = None,
+                            on_first_token: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        """Prompt one member instance.
+
+        ``on_first_token`` is called once, when the first chunk of the response arrives
+        (or when the call fails), and is used by the dispatch scheduler to release
+        requests held back for prompt caching.
+        """
+        run = run or self._new_run()
         # Generate a unique UUID for this specific prompt
         prompt_uuid = str(uuid.uuid4())
+        if on_first_token is not None:
+            on_first_token = _call_once(on_first_token)
+        try:
+            return self._prompt_member(model, prompt, instance, prompt_uuid, run, on_first_token)
+        finally:
+            if on_first_token is not None:
+                on_first_token()
+
+    def _prompt_member(self, model: str, prompt: str, instance: int, prompt_uuid: str, run: RunContext,
+                       on_first_token: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
         
         if model == 'test-model':
             response = llm.Response.fake()
@@ -327,57 +927,172 @@ class ConsortiumOrchestrator:
             # Generate a unique key for this model instance
             instance_key = f"{model}-{instance}"
 
+            key, cached = self._cached_response(model, self._build_member_prompt(prompt), run, instance=instance)
+            if cached is not None:
+                return self._member_result(model, instance, cached, prompt_uuid, cached=True)
+
+            xml_prompt = self._build_member_prompt(prompt, prompt_uuid if self.inject_uuid else None)
+            hedge_budget.note_primary(model)
+
             while attempts < max_retries:
                 try:
-                    xml_prompt = f"""<prompt>
-        <uuid>{prompt_uuid}</uuid>
-        <instruction>{prompt}</instruction>
-    </prompt>"""
-
-                    response = llm.get_model(model).prompt(xml_prompt)
-
-                    text = response.text()
-                    log_response(response, f"{model}-{instance + 1}")
-                    return {
-                        "model": model,
-                        "instance": instance + 1,
-                        "response": text,
-                        "confidence": self._extract_confidence(text),
-                        "uuid": prompt_uuid,  # Include UUID in response
-                    }
+                    response, text = self._call_member_hedged(model, xml_prompt, run, on_first_token)
+                except CallCancelled as e:
+                    logger.debug(f"{model} instance {instance + 1} abandoned: {e}")
+                    return {"model": model, "instance": instance + 1, "error": str(e), "uuid": prompt_uuid}
                 except Exception as e:
                     # Check if the error is a rate-limit error
-                    if "RateLimitError" in str(e):
+                    if is_rate_limit_error(e) and not run.cancelled.is_set():
                         attempts += 1
-                        wait_time = 2 ** attempts  # exponential backoff
-                        logger.warning(f"Rate limit encountered for {model}, retrying in {wait_time} seconds... (attempt {attempts})")
-                        time.sleep(wait_time)
-                    else:
-                        logger.exception(f"Error getting response from {model} instance {instance + 1}")
-                        return {"model": model, "instance": instance + 1, "error": str(e), "uuid": prompt_uuid}
+                        # The limiter pauses every caller of this model until the Retry-After window passes
+                        logger.warning(f"Rate limit encountered for {model}, requeueing... (attempt {attempts})")
+                        continue
+                    logger.exception(f"Error getting response from {model} instance {instance + 1}")
+                    return {"model": model, "instance": instance + 1, "error": str(e), "uuid": prompt_uuid}
+
+                log_response(response, f"{model}-{instance + 1}")
+                if key is not None:
+                    self.cache.put(key, model, text)
+                return self._member_result(model, instance, text, prompt_uuid)
             return {"model": model, "instance": instance + 1, "error": "Rate limit exceeded after retries.", "uuid": prompt_uuid}
 
+    def _call_member(self, model: str, xml_prompt: str, on_first_token: Optional[Callable[[], None]] = None,
+                     cancel: Optional[threading.Event] = None) -> Tuple[Any, str]:
+        """Make one rate-limited call to a member model and return ``(response, text)``.
+
+        Waiting for a limiter slot, or reading a streamed response, stops with
+        ``CallCancelled`` once ``cancel`` is set.
+        """
+        # Queue on the shared per-model limiter rather than failing fast
+        with get_limiter(model).slot(estimate_tokens(xml_prompt), cancel) as call:
+            start = time.monotonic()
+            # Only stream when the first chunk is needed: a streamed OpenAI response is closed
+            # before it is fully read, so its connection cannot go back to the pool
+            response = resolve_model(model).prompt(xml_prompt, stream=on_first_token is not None)
+
+            if on_first_token is not None:
+                # Consume the stream so the first chunk can release held requests
+                for _ in response:
+                    if on_first_token is not None:
+                        on_first_token()
+                        on_first_token = None
+                    if cancel is not None and cancel.is_set():
+                        raise CallCancelled(f"Call to {model} cancelled while streaming")
+            text = response.text()
+            call.tokens_used = _usage_tokens(response)
+        latency_tracker.record(model, time.monotonic() - start)
+        return response, text
+
+    def _hedge_threshold(self, model: str) -> Optional[float]:
+        if not self.hedge_percentile:
+            return None
+        return latency_tracker.percentile(model, self.hedge_percentile)
+
+    def _call_member_hedged(self, model: str, xml_prompt: str, run: RunContext,
+                            on_first_token: Optional[Callable[[], None]] = None) -> Tuple[Any, str]:
+        """Call a member, sending a duplicate request if it runs past the model's hedge threshold."""
+        run.count("model_calls")
+        threshold = self._hedge_threshold(model)
+        if threshold is None:
+            return self._call_member(model, xml_prompt, on_first_token, run.cancelled)
+
+        # Set for the call that loses, so it stops if it is still queued for a slot or streaming
+        lost = {"primary": threading.Event(), "hedge": threading.Event()}
+        primary = _hedge_executor().submit(self._call_member, model, xml_prompt, on_first_token,
+                                           _EitherEvent(run.cancelled, lost["primary"]))
+        done, _ = concurrent.futures.wait([primary], timeout=threshold)
+        if done or not hedge_budget.try_hedge(model, self.hedge_budget):
+            return primary.result()
+
+        logger.debug(f"Hedging {model}: no answer after {threshold:.2f}s")
+        run.count("hedges_issued")
+        run.count("model_calls")
+        hedge = _hedge_executor().submit(self._call_member, model, xml_prompt, None,
+                                         _EitherEvent(run.cancelled, lost["hedge"]))
+        done, pending = concurrent.futures.wait([primary, hedge], return_when=concurrent.futures.FIRST_COMPLETED)
+        winner = next(iter(done))
+        if winner.exception() is not None and pending:
+            # The first to finish failed; fall back to the other request
+            winner = next(iter(pending))
+            pending = set()
+        for loser in pending:
+            # A request already sent runs to completion in its thread and its answer is dropped
+            loser.cancel()
+            lost["hedge" if loser is hedge else "primary"].set()
+        if winner is hedge:
+            run.count("hedges_won")
+        return winner.result()
+
+    def _member_result(self, model: str, instance: int, text: str, prompt_uuid: str, cached: bool = False) -> Dict[str, Any]:
+        result = {
+            "model": model,
+            "instance": instance + 1,
+            "response": text,
+            "confidence": self._extract_confidence(text),
+            "uuid": prompt_uuid,  # Include UUID in response
+        }
+        if cached:
+            result["cached"] = True
+        return result
+
+    def _build_member_prompt(self, prompt: str, prompt_uuid: Optional[str] = None) -> str:
+        """Wrap the iteration prompt in the XML envelope sent to each member."""
+        if prompt_uuid is None:
+            return f"""<prompt>
+        <instruction>{prompt}</instruction>
+    </prompt>"""
+        return f"""<prompt>
+        <uuid>{prompt_uuid}</uuid>
+        <instruction>{prompt}</instruction>
+    </prompt>"""
+
+    def _cached_response(self, model: str, prompt: str, run: RunContext, **options) -> Tuple[Optional[str], Optional[str]]:
+        """Look ``prompt`` up in the response cache.
+
+        Returns ``(key, text)``: ``text`` is None on a miss, and both are None when
+        caching is off. ``options`` distinguish calls that share a prompt, such as
+        the instances of one member model.
+        """
+        if self.cache is None:
+            return None, None
+        key = cache_key(model, prompt, options)
+        text = self.cache.get(key, self.cache_ttl)
+        run.count("cache_hits" if text is not None else "cache_misses")
+        return key, text
+
+    def _store_synthesis(self, key: Optional[str], arbiter: str, raw_arbiter_text: str,
+                         synthesis: Dict[str, Any]) -> None:
+        """Cache an arbiter response, unless it could not be parsed."""
+        if key is not None and "Parsing failed" not in synthesis.get("analysis", ""):
+            self.cache.put(key, arbiter, raw_arbiter_text)
+
+    def _replay_synthesis(self, raw_arbiter_text: str, responses: List[Dict[str, Any]],
+                          on_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Parse a cached arbiter response, passing its synthesis to ``on_chunk`` if streaming."""
+        sections = None
+        if on_chunk is not None:
+            streamer = SynthesisStreamer(on_chunk)
+            streamer.feed(raw_arbiter_text)
+            sections = streamer.scanner.values
+        return self._parse_synthesis(raw_arbiter_text, responses, sections)
+
     def _parse_confidence_value(self, text: str, default: float = 0.0) -> float:
         """Helper method to parse confidence values consistently."""
         # Try to find XML confidence tag, now handling multi-line and whitespace better
-        xml_match = re.search(r"<confidence>\s*(0?\.?\d+|1\.0|\d+)\s*</confidence>", text, re.IGNORECASE | re.DOTALL)
-        if xml_match:
+        tagged = scan(text, ("confidence",), MEMBER_CONFIDENCE_PATTERNS).get("confidence")
+        if tagged is not None:
             try:
-                value = float(xml_match.group(1).strip())
+                value = float(tagged.strip())
                 return value / 100 if value > 1 else value
             except ValueError:
                 pass
 
-        # Fallback to plain text parsing
-        for line in text.lower().split("\n"):
-            if "confidence:" in line or "confidence level:" in line:
-                try:
-                    nums = re.findall(r"(\d*\.?\d+)%?", line)
-                    if nums:
-                        num = float(nums[0])
-                        return num / 100 if num > 1 else num
-                except (IndexError, ValueError):
-                    pass
+        # Fallback to plain text parsing: the first number on the first line mentioning a confidence
+        for line in _CONFIDENCE_LINE.finditer(text):
+            num = _CONFIDENCE_NUMBER.search(line.group(0))
+            if num:
+                value = float(num.group(1))
+                return value / 100 if value > 1 else value
 
         return default
 
@@ -386,10 +1101,13 @@ class ConsortiumOrchestrator:
 
     def _construct_iteration_prompt(self, original_prompt: str, last_synthesis: Dict[str, Any]) -> str:
         """Construct the prompt for the next iteration."""
-        # Use the iteration prompt template from file instead of a hardcoded string
-        iteration_prompt_template = _read_iteration_prompt()
+        try:
+            iteration_prompt_template = get_template("iteration")
+        except TemplateError as e:
+            logger.error(f"Error loading iteration prompt template: {e}")
+            iteration_prompt_template = None
 
-        # If template exists, use it with formatting, otherwise fall back to previous implementation
+        # If template exists, render it, otherwise fall back to previous implementation
         if iteration_prompt_template:
             # Include the user_instructions parameter from the system_prompt
             user_instructions = self.system_prompt or ""
@@ -404,40 +1122,13 @@ class ConsortiumOrchestrator:
                 "refinement_areas": last_synthesis.get("refinement_areas", [])
             }
 
-            # Check if the template requires refinement_areas
-            if "{refinement_areas}" in iteration_prompt_template:
-                try:
-                    return iteration_prompt_template.format(
-                        original_prompt=original_prompt,
-                        previous_synthesis=json.dumps(formatted_synthesis, indent=2),
-                        user_instructions=user_instructions,
-                        refinement_areas="\n".join(formatted_synthesis["refinement_areas"])
-                    )
-                except KeyError:
-                    # Fallback if format fails
-                    return f"""Refining response for original prompt:
-{original_prompt}
-
-Arbiter feedback from previous attempt:
-{json.dumps(formatted_synthesis, indent=2)}
-
-Please improve your response based on this feedback."""
-            else:
-                try:
-                    return iteration_prompt_template.format(
-                        original_prompt=original_prompt,
-                        previous_synthesis=json.dumps(formatted_synthesis, indent=2),
-                        user_instructions=user_instructions
-                    )
-                except KeyError:
-                    # Fallback if format fails
-                    return f"""Refining response for original prompt:
-{original_prompt}
-
-Arbiter feedback from previous attempt:
-{json.dumps(formatted_synthesis, indent=2)}
-
-Please improve your response based on this feedback."""
+            # Placeholders were validated when the template was loaded
+            return iteration_prompt_template.render(
+                original_prompt=original_prompt,
+                previous_synthesis=json.dumps(formatted_synthesis, indent=2),
+                user_instructions=user_instructions,
+                refinement_areas="\n".join(formatted_synthesis["refinement_areas"])
+            )
         else:
             # Fallback to previous hardcoded prompt
             return f"""Refining response for original prompt:
@@ -448,26 +1139,27 @@ Arbiter feedback from previous attempt:
 
 Please improve your response based on this feedback."""
 
-    def _format_iteration_history(self) -> str:
+    def _format_iteration_history(self, run: Optional[RunContext] = None) -> str:
+        """Render previous iterations for the arbiter, limited to ``history_window``.
+
+        Iterations outside the window are summarised when ``compact_history`` is
+        set and otherwise left out. Each iteration's XML is rendered only once.
+        """
+        history_so_far = run.iteration_history if run is not None else []
+        total = len(history_so_far)
+        if not total:
+            return "<no_previous_iterations>No previous iterations available.</no_previous_iterations>"
+        first_full = 0 if self.history_window is None else max(0, total - self.history_window)
         history = []
-        for i, iteration in enumerate(self.iteration_history, start=1):
-            model_responses = "\n".join(
-                f"<model_response>{r['model']}: {r.get('response', 'Error')}</model_response>"
-                for r in iteration.model_responses
-            )
-
-            history.append(f"""<iteration>
-            <iteration_number>{i}</iteration_number>
-            <model_responses>
-                {model_responses}
-            </model_responses>
-            <synthesis>{iteration.synthesis.get('synthesis','Error')}</synthesis>
-            <confidence>{iteration.synthesis.get('confidence',0.0)}</confidence>
-            <refinement_areas>
-                {self._format_refinement_areas(iteration.synthesis.get('refinement_areas', []))}
-            </refinement_areas>
-        </iteration>""")
-        return "\n".join(history) if history else "<no_previous_iterations>No previous iterations available.</no_previous_iterations>"
+        if first_full and not self.compact_history:
+            history.append(f"<omitted_iterations>{first_full} earlier iteration(s) omitted</omitted_iterations>")
+        for i, iteration in enumerate(history_so_far, start=1):
+            if i <= first_full:
+                if self.compact_history:
+                    history.append(iteration.render(i, compact=True))
+                continue
+            history.append(iteration.render(i))
+        return "\n".join(history)
 
     def _format_refinement_areas(self, areas: List[str]) -> str:
         return "\n                ".join(f"<area>{area}</area>" for area in areas)
@@ -483,36 +1175,158 @@ Please improve your response based on this feedback."""
         </model_response>""")
         return "\n".join(formatted)
 
-    def _synthesize_responses(self, original_prompt: str, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _synthesize_responses(self, original_prompt: str, responses: List[Dict[str, Any]],
+                              on_chunk: Optional[Callable[[str], None]] = None,
+                              run: Optional[RunContext] = None) -> Dict[str, Any]:
         logger.debug("Synthesizing responses")
-        arbiter = llm.get_model(self.arbiter)
+        run = run or self._new_run()
+        arbiter_prompt = self._build_arbiter_prompt(original_prompt, responses, run)
+        for level, arbiter in enumerate(self.arbiters):
+            last = level == len(self.arbiters) - 1
+            started = time.monotonic()
+            try:
+                # Only the last arbiter of a cascade streams as it writes: an earlier one may be overruled
+                synthesis, cached = self._arbitrate(arbiter, arbiter_prompt, responses, on_chunk if last else None, run)
+            except TimeoutError:
+                synthesis, cached = None, False
+                if last:
+                    self._record_arbiter_call(arbiter, started, cached, None, run, timed_out=True)
+                    raise
+            reason = None if last else self._escalation_reason(synthesis)
+            self._record_arbiter_call(arbiter, started, cached, reason, run, timed_out=synthesis is None)
+            if reason is None:
+                return synthesis if last else self._accept_synthesis(synthesis, responses, on_chunk)
+
+    def _arbitrate(self, arbiter: str, arbiter_prompt: str, responses: List[Dict[str, Any]],
+                   on_chunk: Optional[Callable[[str], None]], run: RunContext) -> Tuple[Dict[str, Any], bool]:
+        """Have ``arbiter`` judge the responses; returns ``(synthesis, served from cache)``."""
+        key, cached = self._cached_response(arbiter, arbiter_prompt, run, judging_method=self.judging_method)
+        if cached is not None:
+            return self._replay_synthesis(cached, responses, on_chunk), True
+
+        run.count("model_calls")
+        time_limit = self._arbiter_time_limit(arbiter, run)
+        if time_limit is None:
+            arbiter_response, raw_arbiter_text, sections = self._call_arbiter(arbiter, arbiter_prompt, on_chunk,
+                                                                              run.cancelled)
+        else:
+            gate = _StreamGate(on_chunk) if on_chunk is not None else None
+            call = _run_in_thread(self._call_arbiter, arbiter, arbiter_prompt, gate, run.cancelled)
+            done, _ = concurrent.futures.wait([call], timeout=time_limit)
+            if not done:
+                self._abandon_stream(gate, run)
+                raise TimeoutError(f"Arbiter {arbiter} did not answer within {time_limit:.1f}s")
+            arbiter_response, raw_arbiter_text, sections = call.result()
+        log_response(arbiter_response, arbiter)
+
+        synthesis = self._parse_synthesis(raw_arbiter_text, responses, sections)
+        self._store_synthesis(key, arbiter, raw_arbiter_text, synthesis)
+        return synthesis, False
+
+    def _abandon_stream(self, gate: Optional[_StreamGate], run: RunContext) -> None:
+        """Cut an arbiter call that missed its time limit off from the caller's stream."""
+        if gate is not None and gate.revoke():
+            # Part of this synthesis already reached the caller, who must be told it is incomplete
+            run.stats["stream_truncated"] = True
+
+    def _escalation_reason(self, synthesis: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Why a synthesis should go to the next arbiter of the cascade, or None to accept it."""
+        if synthesis is None:
+            return "timeout"
+        if "Parsing failed" in synthesis.get("analysis", "") or (
+                self.judging_method == "default" and "<synthesis" not in synthesis.get("raw_arbiter_response", "")):
+            return "parse_failure"
+        if synthesis.get("confidence", 0.0) < self.confidence_threshold:
+            return "low_confidence"
+        dissent = synthesis.get("dissent") or ""
+        if self.arbiter_dissent_words is not None and len(dissent.split()) >= self.arbiter_dissent_words:
+            return "dissent"
+        return None
 
-        formatted_history = self._format_iteration_history()
+    def _accept_synthesis(self, synthesis: Dict[str, Any], responses: List[Dict[str, Any]],
+                          on_chunk: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+        """Use an earlier arbiter's synthesis, streaming it now if the caller wanted a stream."""
+        if on_chunk is None:
+            return synthesis
+        return self._replay_synthesis(synthesis["raw_arbiter_response"], responses, on_chunk)
+
+    def _record_arbiter_call(self, arbiter: str, started: float, cached: bool, escalated: Optional[str],
+                             run: RunContext, timed_out: bool = False) -> None:
+        """Record one arbiter attempt, including one that timed out at the end of the cascade."""
+        run.stats["arbiter_calls"].append({"iteration": run.stats["iterations"], "arbiter": arbiter,
+                                           "seconds": round(time.monotonic() - started, 3), "cached": cached,
+                                           "escalated": escalated, "timed_out": timed_out})
+        if escalated is not None:
+            logger.info(f"Arbiter {arbiter} escalated ({escalated})")
+
+    def _arbiter_stats(self, run: RunContext) -> Dict[str, Any]:
+        """Per-arbiter call counts, latency and escalation rate of a run."""
+        per_arbiter = {}
+        for arbiter in self.arbiters:
+            calls = [entry for entry in run.stats.get("arbiter_calls", []) if entry["arbiter"] == arbiter]
+            escalated = sum(1 for entry in calls if entry["escalated"] is not None)
+            per_arbiter[arbiter] = {
+                "calls": len(calls),
+                "escalated": escalated,
+                "timed_out": sum(1 for entry in calls if entry["timed_out"]),
+                "escalation_rate": round(escalated / len(calls), 3) if calls else None,
+                "mean_seconds": round(sum(entry["seconds"] for entry in calls) / len(calls), 3) if calls else None,
+            }
+        return {"cascade": list(self.arbiters), "stats": per_arbiter,
+                "calls": [dict(entry) for entry in run.stats.get("arbiter_calls", [])]}
+
+    def _call_arbiter(self, arbiter_model: str, arbiter_prompt: str,
+                      on_chunk: Optional[Callable[[str], None]] = None,
+                      cancel: Optional[threading.Event] = None) -> Tuple[Any, str, Optional[Dict[str, str]]]:
+        """Make one rate-limited arbiter call and return ``(response, text, streamed sections)``."""
+        arbiter = resolve_model(arbiter_model)
+        with get_limiter(arbiter_model).slot(estimate_tokens(arbiter_prompt), cancel) as call:
+            arbiter_response = arbiter.prompt(arbiter_prompt, stream=on_chunk is not None)
+            sections = None
+            if on_chunk is not None:
+                streamer = SynthesisStreamer(on_chunk)
+                for chunk in arbiter_response:
+                    streamer.feed(chunk)
+                sections = streamer.scanner.values
+            raw_arbiter_text = arbiter_response.text()
+            call.tokens_used = _usage_tokens(arbiter_response)
+        return arbiter_response, raw_arbiter_text, sections
+
+    def _build_arbiter_prompt(self, original_prompt: str, responses: List[Dict[str, Any]],
+                              run: Optional[RunContext] = None) -> str:
+        """Render the arbiter prompt for the configured judging method."""
+        run = run or self._new_run()
+        formatted_history = self._format_iteration_history(run)
         formatted_responses = self._format_responses(responses)
+        run.stats["history_tokens"].append(estimate_tokens(formatted_history))
 
         # Extract user instructions from system_prompt if available
         user_instructions = self.system_prompt or ""
 
         # Choose prompt template based on judging method
         if hasattr(self, 'judging_method') and self.judging_method == 'pick-one':
-            arbiter_prompt_template = _read_pick_one_prompt()
+            arbiter_prompt_template = get_template("pick_one")
         elif hasattr(self, 'judging_method') and self.judging_method == 'rank':
-            arbiter_prompt_template = _read_rank_prompt()
+            arbiter_prompt_template = get_template("rank")
         else:
             # Default to arbiter prompt
-            arbiter_prompt_template = _read_arbiter_prompt()
+            arbiter_prompt_template = get_template("arbiter")
 
-        arbiter_prompt = arbiter_prompt_template.format(
+        arbiter_prompt = arbiter_prompt_template.render(
             original_prompt=original_prompt,
             formatted_responses=formatted_responses,
             formatted_history=formatted_history,
             user_instructions=user_instructions
         )
+        run.stats["arbiter_prompt_tokens"].append(estimate_tokens(arbiter_prompt))
+        return arbiter_prompt
 
-        arbiter_response = arbiter.prompt(arbiter_prompt)
-        raw_arbiter_text = arbiter_response.text()
-        log_response(arbiter_response, self.arbiter)
+    def _parse_synthesis(self, raw_arbiter_text: str, responses: List[Dict[str, Any]],
+                         sections: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Parse raw arbiter output, falling back to the raw text if parsing fails.
 
+        ``sections`` holds arbiter tags already scanned while the response streamed.
+        """
         try:
             # Choose parser based on judging method
             if hasattr(self, 'judging_method') and self.judging_method == 'pick-one':
@@ -520,7 +1334,7 @@ Please improve your response based on this feedback."""
             elif hasattr(self, 'judging_method') and self.judging_method == 'rank':
                 parsed_result = self._parse_rank_response(raw_arbiter_text, responses)
             else:
-                parsed_result = self._parse_arbiter_response(raw_arbiter_text)
+                parsed_result = self._parse_arbiter_response(raw_arbiter_text, sections=sections)
             
             # Add raw response to the parsed result
             parsed_result['raw_arbiter_response'] = raw_arbiter_text
@@ -539,16 +1353,15 @@ Please improve your response based on this feedback."""
             }
 
     
-    def _parse_arbiter_response(self, text: str, is_final_iteration: bool = False) -> Dict[str, Any]:
-        """Parse arbiter response with special handling for final iteration."""
-        sections = {
-            "synthesis": r"<synthesis>([\s\S]*?)</synthesis>",
-            "confidence": r"<confidence>\s*([\d.]+)\s*</confidence>",
-            "analysis": r"<analysis>([\s\S]*?)</analysis>",
-            "dissent": r"<dissent>([\s\S]*?)</dissent>",
-            "needs_iteration": r"<needs_iteration>(true|false)</needs_iteration>",
-            "refinement_areas": r"<refinement_areas>([\s\S]*?)</refinement_areas>"
-        }
+    def _parse_arbiter_response(self, text: str, is_final_iteration: bool = False,
+                                sections: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Parse arbiter response with special handling for final iteration.
+
+        ``sections`` are the tag contents already extracted while the response was
+        streamed; without them the text is scanned here, in a single pass.
+        """
+        if sections is None:
+            sections = scan(text, ARBITER_TAGS, ARBITER_PATTERNS)
 
         # Initialize with default values to avoid KeyError
         result = {
@@ -561,10 +1374,9 @@ Please improve your response based on this feedback."""
             # raw_arbiter_response is added in _synthesize_responses
         }
 
-        for key, pattern in sections.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                extracted_text = match.group(1).strip()
+        for key in ARBITER_TAGS:
+            if key in sections:
+                extracted_text = sections[key].strip()
                 if key == "confidence":
                     try:
                         value = float(extracted_text)
@@ -589,10 +1401,10 @@ Please improve your response based on this feedback."""
 
     def _parse_pick_one_response(self, text: str, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Parse arbiter response for pick-one method."""
-        match = re.search(r"<response_id>\s*(\d+)\s*</response_id>", text, re.IGNORECASE)
-        if not match:
+        response_id = scan(text, ("response_id",), PICK_ONE_PATTERNS).get("response_id")
+        if response_id is None:
             raise ValueError("Could not find a valid <response_id> tag.")
-        chosen_id = int(match.group(1))
+        chosen_id = int(response_id)
         chosen_response = next((r for r in responses if r.get('id') == chosen_id), None)
         if not chosen_response:
             raise ValueError(f"Arbiter chose response ID {chosen_id}, but this ID was not found.")
@@ -604,10 +1416,10 @@ Please improve your response based on this feedback."""
 
     def _parse_rank_response(self, text: str, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Parse arbiter response for rank method."""
-        ranking_match = re.search(r"<ranking>([\s\S]*?)</ranking>", text, re.IGNORECASE | re.DOTALL)
-        if not ranking_match:
+        ranking = scan(text, ("ranking",)).get("ranking")
+        if ranking is None:
             raise ValueError("Could not find a <ranking> tag.")
-        ranked_ids_str = re.findall(r'<rank position="\d+">(\d+)</rank>', ranking_match.group(1), re.IGNORECASE)
+        ranked_ids_str = re.findall(r'<rank position="\d+">(\d+)</rank>', ranking, re.IGNORECASE)
         if not ranked_ids_str:
             raise ValueError("Found <ranking> tag, but no valid <rank> tags inside.")
         ranked_ids = [int(id_str) for id_str in ranked_ids_str]
@@ -622,11 +1434,313 @@ Please improve your response based on this feedback."""
         }
 
 
+class AsyncConsortiumOrchestrator(ConsortiumOrchestrator):
+    """Asyncio variant of ConsortiumOrchestrator built on llm's async model API.
+
+    Member calls are fanned out as asyncio tasks and the arbiter is awaited on the
+    same event loop, so no thread is parked per in-flight request and a single
+    loop can drive many concurrent consortium runs.
+    """
+
+    async def orchestrate(self, prompt: str, conversation_history: str = "", consortium_id: Optional[str] = None,
+                          on_synthesis_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        if not self.coalesce:
+            return await self._orchestrate(prompt, conversation_history, consortium_id, on_synthesis_chunk)
+        result, coalesced = await get_singleflight().do_async(
+            flight_key(self.config_key, prompt, conversation_history),
+            lambda publish: self._orchestrate(prompt, conversation_history, consortium_id,
+                                              publish if on_synthesis_chunk is not None else None),
+            on_chunk=on_synthesis_chunk, calls=_model_calls)
+        if coalesced:
+            result["metadata"]["coalesced"] = True
+        return result
+
+    async def _orchestrate(self, prompt: str, conversation_history: str = "", consortium_id: Optional[str] = None,
+                           on_synthesis_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        run = self._new_run(consortium_id)
+        iteration_count = 0
+        final_result = None
+        original_prompt = prompt
+        raw_arbiter_response_final = ""
+
+        current_prompt = self._build_initial_prompt(original_prompt, conversation_history)
+
+        while iteration_count < run.max_iterations or iteration_count < self.minimum_iterations:
+            if iteration_count and self._deadline_reached(run):
+                run.stats["stopped_early"] = "deadline"
+                logger.info(f"Deadline reached, stopping after {iteration_count} iteration(s)")
+                break
+            run.models = self._select_models(current_prompt, iteration_count + 1, run)
+            if not run.models:
+                run.stats["stopped_early"] = "strategy"
+                logger.info(f"Strategy selected no models, stopping after {iteration_count} iteration(s)")
+                break
+            iteration_count += 1
+            run.stats["iterations"] = iteration_count
+            logger.debug(f"Starting async iteration {iteration_count}")
+
+            phase_start = time.monotonic()
+            model_responses = await self._get_model_responses(current_prompt, run)
+            members_done = time.monotonic()
+            arbiter_responses = self._arbiter_responses(model_responses, run)
+            for i, r in enumerate(arbiter_responses, 1):
+                r['id'] = i
+
+            on_chunk = on_synthesis_chunk if self._is_streamed_iteration(iteration_count, run) else None
+            try:
+                synthesis_result = await self._synthesize_responses(original_prompt, arbiter_responses, on_chunk, run)
+            except asyncio.TimeoutError:
+                final_result = synthesis_result = self._arbiter_timeout_result(arbiter_responses, run)
+                break
+            finally:
+                self._record_phases(run, members_done - phase_start, time.monotonic() - members_done)
+            raw_arbiter_response_final = synthesis_result.get("raw_arbiter_response", "")
+
+            done, final_result = self._complete_iteration(synthesis_result, model_responses, iteration_count,
+                                                          raw_arbiter_response_final, run)
+            if done:
+                break
+            current_prompt = self._construct_iteration_prompt(original_prompt, synthesis_result)
+
+        run.cancelled.set()
+        return self._build_result(original_prompt, model_responses, final_result, synthesis_result, iteration_count,
+                                  raw_arbiter_response_final, run)
+
+    async def _get_model_responses(self, prompt: str, run: Optional[RunContext] = None) -> List[Dict[str, Any]]:
+        run = run or self._new_run()
+        models = self.models if run.models is None else run.models
+        plan = self.scheduler.plan(models, prompt)
+        jobs: Dict[asyncio.Task, Tuple[str, int]] = {}
+        started: Dict[asyncio.Task, float] = {}
+        pending = set()
+
+        def spawn(model: str, instance: int, **kwargs) -> None:
+            task = asyncio.create_task(self._get_model_response(model, prompt, instance, run, **kwargs))
+            jobs[task] = (model, instance)
+            started[task] = time.monotonic()
+            pending.add(task)
+
+        for model, instance in plan.immediate:
+            spawn(model, instance)
+        holds: List[float] = []
+        for provider, (leader, followers) in plan.held.items():
+            warm = asyncio.Event()
+            spawn(*leader, on_first_token=warm.set)
+            pending.add(asyncio.create_task(self._hold_followers(warm, followers, holds)))
+
+        # Gather results as they complete, stopping early once the quorum is met
+        quorum = self._record_quorum(sum(models.values()), run)
+        responses = []
+        successful = 0
+        while pending:
+            expiries = {task: self._member_expiry(jobs[task][0], started[task], run) for task in pending if task in jobs}
+            done, _ = await asyncio.wait(pending, timeout=self._wait_timeout(expiries.values()),
+                                         return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for task in done:
+                if task in jobs:
+                    response = task.result()
+                    responses.append(response)
+                    if "error" not in response:
+                        successful += 1
+                else:
+                    # A provider's leader is warm: send its held followers
+                    for model, instance in task.result():
+                        spawn(model, instance)
+            now = time.monotonic()
+            for task in [t for t in pending if expiries.get(t) is not None and expiries[t] <= now]:
+                task.cancel()
+                pending.discard(task)
+                responses.append(self._timed_out_response(*jobs[task], started[task], run))
+            if successful >= quorum and any(task in jobs for task in pending):
+                break
+
+        for task in pending:
+            if task not in jobs:
+                task.cancel()
+        self._record_stragglers([(jobs[task], task) for task in pending if task in jobs], run)
+        if holds:
+            # Holds for different providers overlap, so the iteration paid for the longest one
+            run.count("dispatch_held_seconds", max(holds))
+        return self._in_stable_order(responses)
+
+    async def _hold_followers(self, warm: asyncio.Event, followers: List[Tuple[str, int]],
+                              holds: List[float]) -> List[Tuple[str, int]]:
+        """Wait for a provider's leader to start answering, then hand back its followers to send."""
+        loop = asyncio.get_running_loop()
+        hold_start = loop.time()
+        try:
+            await asyncio.wait_for(warm.wait(), timeout=self.scheduler.max_hold)
+        except asyncio.TimeoutError:
+            logger.debug("Cache warm-up hold expired, releasing followers")
+        holds.append(loop.time() - hold_start)
+        return followers
+
+    async def _get_model_response(self, model: str, prompt: str, instance: int, run: Optional[RunContext] = None,
+                                  on_first_token: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        run = run or self._new_run()
+        prompt_uuid = str(uuid.uuid4())
+        if on_first_token is not None:
+            on_first_token = _call_once(on_first_token)
+        try:
+            return await self._prompt_member(model, prompt, instance, prompt_uuid, run, on_first_token)
+        finally:
+            if on_first_token is not None:
+                on_first_token()
+
+    async def _prompt_member(self, model: str, prompt: str, instance: int, prompt_uuid: str, run: RunContext,
+                             on_first_token: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        logger.debug(f"Getting async response from model: {model} instance {instance + 1} with UUID: {prompt_uuid}")
+        attempts = 0
+        max_retries = 3
+
+        key, cached = await asyncio.to_thread(self._cached_response, model, self._build_member_prompt(prompt), run,
+                                              instance=instance)
+        if cached is not None:
+            return self._member_result(model, instance, cached, prompt_uuid, cached=True)
+
+        xml_prompt = self._build_member_prompt(prompt, prompt_uuid if self.inject_uuid else None)
+        hedge_budget.note_primary(model)
+
+        while attempts < max_retries:
+            try:
+                response, text = await self._call_member_hedged(model, xml_prompt, run, on_first_token)
+            except Exception as e:
+                if is_rate_limit_error(e) and not run.cancelled.is_set():
+                    attempts += 1
+                    logger.warning(f"Rate limit encountered for {model}, requeueing... (attempt {attempts})")
+                    continue
+                logger.exception(f"Error getting response from {model} instance {instance + 1}")
+                return {"model": model, "instance": instance + 1, "error": str(e), "uuid": prompt_uuid}
+
+            await asyncio.to_thread(log_response, response, f"{model}-{instance + 1}")
+            if key is not None:
+                await asyncio.to_thread(self.cache.put, key, model, text)
+            return self._member_result(model, instance, text, prompt_uuid)
+        return {"model": model, "instance": instance + 1, "error": "Rate limit exceeded after retries.", "uuid": prompt_uuid}
+
+    async def _call_member(self, model: str, xml_prompt: str, on_first_token: Optional[Callable[[], None]] = None) -> Tuple[Any, str]:
+        async with get_limiter(model).slot_async(estimate_tokens(xml_prompt)) as call:
+            start = time.monotonic()
+            response = resolve_async_model(model).prompt(xml_prompt, stream=on_first_token is not None)
+            if on_first_token is not None:
+                async for _ in response:
+                    if on_first_token is not None:
+                        on_first_token()
+                        on_first_token = None
+            text = await response.text()
+            call.tokens_used = _usage_tokens(response)
+        latency_tracker.record(model, time.monotonic() - start)
+        return response, text
+
+    async def _call_member_hedged(self, model: str, xml_prompt: str, run: RunContext,
+                                  on_first_token: Optional[Callable[[], None]] = None) -> Tuple[Any, str]:
+        run.count("model_calls")
+        threshold = self._hedge_threshold(model)
+        if threshold is None:
+            return await self._call_member(model, xml_prompt, on_first_token)
+
+        primary = asyncio.create_task(self._call_member(model, xml_prompt, on_first_token))
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done or not hedge_budget.try_hedge(model, self.hedge_budget):
+            return await primary
+
+        logger.debug(f"Hedging {model}: no answer after {threshold:.2f}s")
+        run.count("hedges_issued")
+        run.count("model_calls")
+        hedge = asyncio.create_task(self._call_member(model, xml_prompt))
+        done, pending = await asyncio.wait({primary, hedge}, return_when=asyncio.FIRST_COMPLETED)
+        winner = next(iter(done))
+        if winner.exception() is not None and pending:
+            winner = next(iter(pending))
+            await asyncio.wait({winner})
+            pending = set()
+        for loser in pending:
+            loser.cancel()
+        if winner is hedge:
+            run.count("hedges_won")
+        return winner.result()
+
+    async def _synthesize_responses(self, original_prompt: str, responses: List[Dict[str, Any]],
+                                    on_chunk: Optional[Callable[[str], None]] = None,
+                                    run: Optional[RunContext] = None) -> Dict[str, Any]:
+        logger.debug("Synthesizing responses (async)")
+        run = run or self._new_run()
+        arbiter_prompt = self._build_arbiter_prompt(original_prompt, responses, run)
+        for level, arbiter in enumerate(self.arbiters):
+            last = level == len(self.arbiters) - 1
+            started = time.monotonic()
+            try:
+                synthesis, cached = await self._arbitrate(arbiter, arbiter_prompt, responses,
+                                                          on_chunk if last else None, run)
+            except asyncio.TimeoutError:
+                synthesis, cached = None, False
+                if last:
+                    self._record_arbiter_call(arbiter, started, cached, None, run, timed_out=True)
+                    raise
+            reason = None if last else self._escalation_reason(synthesis)
+            self._record_arbiter_call(arbiter, started, cached, reason, run, timed_out=synthesis is None)
+            if reason is None:
+                return synthesis if last else self._accept_synthesis(synthesis, responses, on_chunk)
+
+    async def _arbitrate(self, arbiter: str, arbiter_prompt: str, responses: List[Dict[str, Any]],
+                         on_chunk: Optional[Callable[[str], None]], run: RunContext) -> Tuple[Dict[str, Any], bool]:
+        key, cached = await asyncio.to_thread(self._cached_response, arbiter, arbiter_prompt, run,
+                                              judging_method=self.judging_method)
+        if cached is not None:
+            return self._replay_synthesis(cached, responses, on_chunk), True
+
+        run.count("model_calls")
+        gate = _StreamGate(on_chunk) if on_chunk is not None else None
+        try:
+            arbiter_response, raw_arbiter_text, sections = await asyncio.wait_for(
+                self._call_arbiter(arbiter, arbiter_prompt, gate), timeout=self._arbiter_time_limit(arbiter, run))
+        except asyncio.TimeoutError:
+            self._abandon_stream(gate, run)
+            raise
+        await asyncio.to_thread(log_response, arbiter_response, arbiter)
+
+        synthesis = self._parse_synthesis(raw_arbiter_text, responses, sections)
+        await asyncio.to_thread(self._store_synthesis, key, arbiter, raw_arbiter_text, synthesis)
+        return synthesis, False
+
+    async def _call_arbiter(self, arbiter_model: str, arbiter_prompt: str,
+                            on_chunk: Optional[Callable[[str], None]] = None
+                            ) -> Tuple[Any, str, Optional[Dict[str, str]]]:
+        arbiter = resolve_async_model(arbiter_model)
+        async with get_limiter(arbiter_model).slot_async(estimate_tokens(arbiter_prompt)) as call:
+            arbiter_response = arbiter.prompt(arbiter_prompt, stream=on_chunk is not None)
+            sections = None
+            if on_chunk is not None:
+                streamer = SynthesisStreamer(on_chunk)
+                async for chunk in arbiter_response:
+                    streamer.feed(chunk)
+                sections = streamer.scanner.values
+            raw_arbiter_text = await arbiter_response.text()
+            call.tokens_used = _usage_tokens(arbiter_response)
+        return arbiter_response, raw_arbiter_text, sections
+
+
+TIER_PREFIX = re.compile(r"^tier(\d+):", re.IGNORECASE)
+
+
+def parse_tiers(models: List[str]) -> Dict[str, int]:
+    """Cascade tiers of CLI model arguments written as ``tierN:model[:count]``; other models are left out."""
+    tiers = {}
+    for item in models:
+        match = TIER_PREFIX.match(item)
+        if match:
+            tiers[item[match.end():].split(':', 1)[0]] = int(match.group(1))
+    return tiers
+
+
 def parse_models(models: List[str], count: int) -> Dict[str, int]:
     """Parse models and counts from CLI arguments into a dictionary."""
     model_dict = {}
 
     for item in models:
+        # A cascade tier prefix is read by parse_tiers
+        item = TIER_PREFIX.sub("", item)
         # Basic split, can be enhanced later if needed
         if ':' in item:
              parts = item.split(':', 1)
@@ -647,33 +1761,118 @@ def read_stdin_if_not_tty() -> Optional[str]:
         return sys.stdin.read().strip()
     return None
 
+def final_output_text(result: Dict[str, Any]) -> str:
+    """Pick the text to return: the clean synthesis, or the raw arbiter output if parsing failed."""
+    final_synthesis_data = result.get("synthesis", {}) # This dict contains parsed fields and raw_arbiter_response
+    raw_arbiter_response = final_synthesis_data.get("raw_arbiter_response", "")
+    parsed_synthesis = final_synthesis_data.get("synthesis", "") # This is the parsed <synthesis> content
+    analysis_text = final_synthesis_data.get("analysis", "")
+
+    # Determine if parsing failed or synthesis is insufficient
+    # Check 1: Explicit parsing failure message
+    # Check 2: Parsed synthesis is empty, but raw response is not (likely missing <synthesis> tag)
+    # Check 3: Parsed synthesis is exactly the raw response (parser fallback returned raw) AND no explicit success analysis
+    is_fallback = ("Parsing failed" in analysis_text) or \
+                  (not parsed_synthesis and raw_arbiter_response) or \
+                  (parsed_synthesis == raw_arbiter_response and raw_arbiter_response) # Simpler check: If parsed == raw and raw is not empty, it's likely the fallback.
+
+    if is_fallback:
+        logger.warning("Arbiter response parsing failed or synthesis missing/empty. Returning raw arbiter response for logging.")
+        return raw_arbiter_response if raw_arbiter_response else "Error: Arbiter response unavailable or empty."
+    # Parsing seemed successful, return the clean synthesis
+    return parsed_synthesis
+
+
+# Sent between a synthesis cut off by an arbiter timeout and the fallback answer that replaces it
+TRUNCATED_STREAM_NOTICE = "\n\n[The arbiter timed out mid-answer; the best available answer follows.]\n\n"
+
+
+def stream_truncated(result: Dict[str, Any]) -> bool:
+    """Whether the synthesis streamed for ``result`` was cut off by an arbiter timeout."""
+    return bool(result.get("metadata", {}).get("timing", {}).get("stream_truncated"))
+
+
 class ConsortiumModel(llm.Model):
-    can_stream = False # Synchronous execution only for now
+    can_stream = True  # The final arbiter pass is streamed as it is generated
 
     class Options(llm.Options):
         confidence_threshold: Optional[float] = None
         max_iterations: Optional[int] = None
         system_prompt: Optional[str] = None  # Add support for system prompt as an option
 
-    def __init__(self, model_id: str, config: ConsortiumConfig):
+    def __init__(self, model_id: str, config: Union[ConsortiumConfig, Dict[str, Any]]):
         self.model_id = model_id
-        self.config = config
+        # Saved consortiums are registered from their raw dict; pydantic parsing
+        # is deferred until the model is actually used.
+        self._config = config
         self._orchestrator = None  # Lazy initialization
+        self._orchestrator_lock = threading.Lock()
+
+    @property
+    def config(self) -> ConsortiumConfig:
+        if not isinstance(self._config, ConsortiumConfig):
+            self._config = ConsortiumConfig.from_dict(self._config)
+        return self._config
 
     def __str__(self):
         return f"Consortium Model: {self.model_id}"
 
     def get_orchestrator(self):
+        """The shared orchestrator; it keeps no per-run state, so concurrent prompts may use it."""
         if self._orchestrator is None:
-            try:
-                self._orchestrator = ConsortiumOrchestrator(self.config)
-            except Exception as e:
-                raise llm.ModelError(f"Failed to initialize consortium: {e}")
+            with self._orchestrator_lock:
+                if self._orchestrator is None:
+                    try:
+                        self._orchestrator = ConsortiumOrchestrator(self.config)
+                    except Exception as e:
+                        raise llm.ModelError(f"Failed to initialize consortium: {e}")
         return self._orchestrator
 
     def execute(self, prompt, stream, response, conversation):
+        """Execute the consortium, streaming the final synthesis when ``stream`` is set."""
+        if not stream:
+            result = self._run(prompt, conversation)
+            # Store the full result JSON in the response object for logging
+            response.response_json = result
+            yield self._final_output_text(result)
+            return
+
+        # Run the consortium in a worker thread and forward synthesis chunks as they arrive
+        chunks: queue.Queue = queue.Queue()
+        outcome: Dict[str, Any] = {}
+
+        def run():
+            try:
+                outcome["result"] = self._run(prompt, conversation, on_synthesis_chunk=chunks.put)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                chunks.put(None)
+
+        worker = threading.Thread(target=run, name="consortium-execute", daemon=True)
+        worker.start()
+        streamed = False
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                break
+            streamed = True
+            yield chunk
+        worker.join()
+        if "error" in outcome:
+            raise outcome["error"]
+        result = outcome["result"]
+        response.response_json = result
+        if not streamed:
+            # The run finished before its last permitted iteration, or the synthesis
+            # was not tagged: nothing was streamed, so send the final text in one piece
+            yield self._final_output_text(result)
+        elif stream_truncated(result):
+            yield TRUNCATED_STREAM_NOTICE + self._final_output_text(result)
+
+    def _run(self, prompt, conversation, on_synthesis_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Orchestrate a single prompt, including any conversation history."""
         consortium_id = secrets.token_hex(8)
-        """Execute the consortium synchronously"""
         try:
             # Extract conversation history from the conversation object directly
             conversation_history = ""
@@ -706,52 +1905,30 @@ class ConsortiumModel(llm.Model):
 
             # Check if a system prompt was provided via --system option
             if hasattr(prompt, 'system') and prompt.system:
-                # Create a copy of the config with the updated system prompt
-                updated_config = ConsortiumConfig(**self.config.to_dict())
-                updated_config.system_prompt = prompt.system
-                # Create a new orchestrator with the updated config
-                orchestrator = ConsortiumOrchestrator(updated_config)
-                result = orchestrator.orchestrate(prompt.prompt, conversation_history=conversation_history, consortium_id=consortium_id)
+                orchestrator = self._orchestrator_for_system(prompt.system)
             else:
                 # Use the default orchestrator with the original config
-                result = self.get_orchestrator().orchestrate(prompt.prompt, conversation_history=conversation_history, consortium_id=consortium_id)
-
-            # --- BEGIN REVISED FALLBACK LOGIC ---
-            # Check result details from orchestrate
-            final_synthesis_data = result.get("synthesis", {}) # This dict contains parsed fields and raw_arbiter_response
-            raw_arbiter_response = final_synthesis_data.get("raw_arbiter_response", "")
-            parsed_synthesis = final_synthesis_data.get("synthesis", "") # This is the parsed <synthesis> content
-            analysis_text = final_synthesis_data.get("analysis", "")
-
-            # Determine if parsing failed or synthesis is insufficient
-            # Check 1: Explicit parsing failure message
-            # Check 2: Parsed synthesis is empty, but raw response is not (likely missing <synthesis> tag)
-            # Check 3: Parsed synthesis is exactly the raw response (parser fallback returned raw) AND no explicit success analysis
-            is_fallback = ("Parsing failed" in analysis_text) or \
-                          (not parsed_synthesis and raw_arbiter_response) or \
-                          (parsed_synthesis == raw_arbiter_response and raw_arbiter_response) # Simpler check: If parsed == raw and raw is not empty, it's likely the fallback.
-
-            if is_fallback:
-                 final_output_text = raw_arbiter_response if raw_arbiter_response else "Error: Arbiter response unavailable or empty."
-                 logger.warning("Arbiter response parsing failed or synthesis missing/empty. Returning raw arbiter response for logging.")
-            else:
-                 # Parsing seemed successful, return the clean synthesis
-                 final_output_text = parsed_synthesis
-
-            # Store the full result JSON in the response object for logging (existing code)
-            response.response_json = result # Ensure this is still done before returning
-            # Return the determined final text (clean synthesis or raw fallback)
-            return final_output_text
-            # --- END REVISED FALLBACK LOGIC ---
-
+                orchestrator = self.get_orchestrator()
+            return orchestrator.orchestrate(prompt.prompt, conversation_history=conversation_history,
+                                            consortium_id=consortium_id, on_synthesis_chunk=on_synthesis_chunk)
         except Exception as e:
             logger.exception(f"Consortium execution failed: {e}")
             raise llm.ModelError(f"Consortium execution failed: {e}")
 
-def _get_consortium_configs() -> Dict[str, ConsortiumConfig]:
-    """Fetch saved consortium configurations from the database."""
-    db = DatabaseConnection.get_connection()
+    def _orchestrator_for_system(self, system_prompt: str) -> "ConsortiumOrchestrator":
+        """A (cached) orchestrator for this consortium's config with ``system_prompt`` swapped in."""
+        config = self.config.model_copy(update={"system_prompt": system_prompt})
+        return get_orchestrator_cache().get(config.to_dict(), lambda: ConsortiumOrchestrator(config))
+
+    def _final_output_text(self, result: Dict[str, Any]) -> str:
+        return final_output_text(result)
+
 
+def config_index_path() -> pathlib.Path:
+    """Get path to the JSON index of saved consortiums read at plugin startup."""
+    return user_dir() / "consortium_index.json"
+
+def _ensure_config_table(db: sqlite_utils.Database) -> None:
     db.execute("""
         CREATE TABLE IF NOT EXISTS consortium_configs (
             name TEXT PRIMARY KEY,
@@ -760,29 +1937,72 @@ def _get_consortium_configs() -> Dict[str, ConsortiumConfig]:
         )
     """)
 
+def _read_config_rows() -> Dict[str, Dict[str, Any]]:
+    """Read the raw saved configurations from the database, skipping unreadable rows.
+
+    Uses a connection of its own, closed before returning: the server reads
+    configs on worker threads, which would otherwise each keep one open.
+    """
+    db = sqlite_utils.Database(logs_db_path())
+    try:
+        _ensure_config_table(db)
+        rows = {}
+        for row in db["consortium_configs"].rows:
+            try:
+                rows[row["name"]] = json.loads(row["config"])
+            except (json.JSONDecodeError, TypeError) as e:
+                logger.error(f"Error loading config for '{row['name']}': {e}. Skipping.")
+        return rows
+    finally:
+        db.close()
+
+def _write_config_index(rows: Dict[str, Dict[str, Any]]) -> None:
+    path = config_index_path()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(rows))
+        os.replace(tmp_path, path)  # Readers never see a half-written index
+    except OSError as e:
+        logger.warning(f"Could not write consortium index {path}: {e}")
+
+def _invalidate_config_index() -> None:
+    """Drop the config index and the resolved models, after a consortium is saved or removed."""
+    clear_models()
+    try:
+        config_index_path().unlink()
+    except FileNotFoundError:
+        pass
+
+def _load_config_index() -> Dict[str, Dict[str, Any]]:
+    """Raw saved configurations, from the JSON index when present, else rebuilt from the database."""
+    try:
+        rows = json.loads(config_index_path().read_text())
+        if isinstance(rows, dict):
+            return rows
+    except (OSError, ValueError):
+        pass
+    rows = _read_config_rows()
+    _write_config_index(rows)
+    return rows
+
+def _get_consortium_configs() -> Dict[str, ConsortiumConfig]:
+    """Fetch saved consortium configurations."""
     configs = {}
-    for row in db["consortium_configs"].rows:
-        config_name = row["name"]
+    for config_name, config_data in _load_config_index().items():
         try:
-            config_data = json.loads(row["config"])
             configs[config_name] = ConsortiumConfig.from_dict(config_data)
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
+        except (TypeError, KeyError, ValueError) as e:
              logger.error(f"Error loading config for '{config_name}': {e}. Skipping.")
     return configs
 
 def _save_consortium_config(name: str, config: ConsortiumConfig) -> None:
     """Save a consortium configuration to the database."""
     db = DatabaseConnection.get_connection()
-    db.execute("""
-        CREATE TABLE IF NOT EXISTS consortium_configs (
-            name TEXT PRIMARY KEY,
-            config TEXT NOT NULL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    _ensure_config_table(db)
     db["consortium_configs"].insert(
         {"name": name, "config": json.dumps(config.to_dict())}, replace=True
     )
+    _invalidate_config_index()
 
 from click_default_group import DefaultGroup
 class DefaultToRunGroup(DefaultGroup):
@@ -835,31 +2055,214 @@ def create_consortium(
     system_prompt: Optional[str] = None,
     default_count: int = 1,
     raw: bool = False,
+    quorum: Optional[float] = None,
+    cache: bool = False,
+    force_diversity: bool = False,
+    history_window: Optional[int] = None,
+    compact_history: bool = False,
+    deadline: Optional[float] = None,
+    model_timeouts: Optional[Dict[str, float]] = None,
+    strategy: str = "default",
+    strategy_params: Optional[Dict[str, Any]] = None,
+    arbiters: Optional[List[str]] = None,
 ) -> ConsortiumOrchestrator:
     """
     Create and return a ConsortiumOrchestrator with a simplified API.
     - models: list of model names. To specify instance counts, use the format "model:count".
     - system_prompt: if not provided, DEFAULT_SYSTEM_PROMPT is used.
+    - quorum: arbitrate once this many members (or this fraction of them) have answered.
+    - cache: serve repeated prompts from the local response cache; force_diversity keeps
+      member prompts unique even then.
+    - history_window: show the arbiter only the last N iterations in full; compact_history
+      summarises the older ones instead of dropping them.
+    - deadline: seconds the whole run may take; model_timeouts limits each call by
+      model id or provider ("default" for the rest).
+    - strategy: name of the strategy choosing the members of each iteration, with strategy_params.
+    - Models written as "tierN:model" form a cascade: tier N+1 only joins after an iteration
+      below confidence_threshold.
+    - arbiters: arbiter cascade, cheapest first; overrides arbiter.
     """
     model_dict = parse_models(models, default_count) # Use parse_models here
     config = ConsortiumConfig(
         models=model_dict,
-        system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT,
+        system_prompt=system_prompt or _default_system_prompt(),
         confidence_threshold=confidence_threshold,
         max_iterations=max_iterations,
         minimum_iterations=min_iterations,
         arbiter=arbiter,
                judging_method=judging_method,
+        quorum=quorum,
+        cache=cache,
+        force_diversity=force_diversity,
+        history_window=history_window,
+        compact_history=compact_history,
+        deadline=deadline,
+        model_timeouts=model_timeouts or {},
+        strategy=strategy,
+        strategy_params=strategy_params or {},
+        tiers=parse_tiers(models),
+        arbiters=arbiters or [],
             )
     return ConsortiumOrchestrator(config=config)
 
+
+def _timeouts_option(timeouts: Tuple[str, ...]) -> Dict[str, float]:
+    """Parse --timeout values, each SECONDS (for every model) or MODEL=SECONDS."""
+    model_timeouts = {}
+    for value in timeouts:
+        key, _, seconds = value.rpartition("=")
+        try:
+            limit = float(seconds)
+        except ValueError:
+            raise click.UsageError(f"Invalid --timeout '{value}': expected SECONDS or MODEL=SECONDS.")
+        if limit <= 0:
+            raise click.UsageError(f"Invalid --timeout '{value}': the time limit must be positive.")
+        model_timeouts[key or "default"] = limit
+    return model_timeouts
+
+
+def _strategy_params_option(strategy: str, values: Tuple[str, ...]) -> Dict[str, Any]:
+    """Parse --strategy-param KEY=VALUE pairs (JSON values, or plain strings) and check the strategy accepts them."""
+    params = {}
+    for value in values:
+        key, sep, raw = value.partition("=")
+        if not sep or not key:
+            raise click.UsageError(f"Invalid --strategy-param '{value}': expected KEY=VALUE.")
+        try:
+            params[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            params[key] = raw
+    try:
+        create_strategy(strategy, None, params)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    return params
+
+
+def _system_prompt_option(system: Optional[str]) -> str:
+    """Resolve a --system value that is either prompt text or a path to a prompt file."""
+    if not system:
+        logger.info("Using default system prompt.")
+        return _default_system_prompt()
+    system_path = pathlib.Path(system)
+    if not system_path.is_file():
+        logger.info("Using provided system prompt text.")
+        return system
+    try:
+        content = system_path.read_text().strip()
+    except Exception as e:
+        raise click.ClickException(f"Error reading system prompt file '{system}': {e}")
+    logger.info(f"Loaded system prompt from file: {system}")
+    return content
+
+
+def _confidence_threshold_option(confidence_threshold: float) -> float:
+    # Convert percentage confidence to decimal if needed
+    if confidence_threshold > 1.0:
+        if confidence_threshold <= 100.0:
+            return confidence_threshold / 100.0
+        raise click.UsageError("Confidence threshold must be between 0.0 and 1.0 (or 0 and 100).")
+    if confidence_threshold < 0.0:
+        raise click.UsageError("Confidence threshold must be non-negative.")
+    return confidence_threshold
+
+
+def _consortium_definition_options(f):
+    """Options naming a saved consortium, or defining one inline, for commands that run many prompts."""
+    options = [
+        click.option("--consortium", "consortium_name", help="Name of a saved consortium to run the prompts through."),
+        click.option("-m", "--model", "models", multiple=True,
+                     help="Model to include, use format 'model:count' or 'model' for default count; prefix 'tierN:' for a cascade tier. Multiple allowed."),
+        click.option("-n", "--count", type=int, default=1,
+                     help="Default number of instances (if count not specified per model)"),
+        click.option("--arbiter", help="Model to use as arbiter", default="claude-3-opus-20240229"),
+        click.option("--confidence-threshold", type=float, help="Minimum confidence threshold (0.0-1.0)", default=0.8),
+        click.option("--max-iterations", type=int, help="Maximum number of iteration rounds", default=3),
+        click.option("--min-iterations", type=int, help="Minimum number of iterations to perform", default=1),
+        click.option("--system", help="System prompt text or path to system prompt file."),
+        click.option("--judging-method", type=click.Choice(["default", "pick-one", "rank"], case_sensitive=False),
+                     default="default", help="Judging method for the arbiter (default, pick-one, rank)."),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+def _config_from_options(consortium_name: Optional[str], models: Tuple[str, ...], count: int, arbiter: str,
+                         confidence_threshold: float, max_iterations: int, min_iterations: int,
+                         system: Optional[str], judging_method: str) -> ConsortiumConfig:
+    if consortium_name and models:
+        raise click.UsageError("Use either --consortium or --model, not both.")
+    if consortium_name:
+        config = _get_consortium_configs().get(consortium_name)
+        if config is None:
+            raise click.ClickException(f"Consortium with name '{consortium_name}' not found.")
+        return config
+    if not models:
+        raise click.UsageError("Give a saved consortium with --consortium or its models with --model.")
+    try:
+        model_dict = parse_models(models, count)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    return ConsortiumConfig(
+        models=model_dict,
+        system_prompt=_system_prompt_option(system),
+        confidence_threshold=_confidence_threshold_option(confidence_threshold),
+        max_iterations=max_iterations,
+        minimum_iterations=min_iterations,
+        arbiter=arbiter,
+        judging_method=judging_method,
+        tiers=parse_tiers(models),
+    )
+
+
+def job_queue_path() -> pathlib.Path:
+    return user_dir() / "consortium_jobs.db"
+
+
+def get_job_queue(path: Optional[pathlib.Path] = None) -> job_queue.JobQueue:
+    """Return the job queue shared by `consortium submit` and `consortium worker` (or the one at ``path``)."""
+    return job_queue.get_queue(path or job_queue_path())
+
+
+def _run_job(job: job_queue.Job) -> Dict[str, Any]:
+    config = ConsortiumConfig.from_dict(job.config)
+    # Jobs for the same consortium share one orchestrator within a worker process
+    orchestrator = get_orchestrator_cache().get(config.to_dict(), lambda: ConsortiumOrchestrator(config))
+    return orchestrator.orchestrate(job.prompt, consortium_id=job.id)
+
+
+def _worker_process(queue_path: Optional[pathlib.Path], threads: int, **options) -> None:
+    """Entry point of each `consortium worker` process."""
+    setup_logging()
+    try:
+        job_queue.run_workers(get_job_queue(queue_path), _run_job, threads=threads, **options)
+    except KeyboardInterrupt:
+        pass
+
+
+def _echo_job_result(jobs: job_queue.JobQueue, job_id: str, as_json: bool = False) -> None:
+    status = jobs.status(job_id)
+    if status is None:
+        raise click.ClickException(f"Job '{job_id}' not found.")
+    if status["status"] == "failed":
+        raise click.ClickException(f"Job '{job_id}' failed: {status['error']}")
+    result = jobs.result(job_id)
+    if result is None:
+        raise click.ClickException(f"Job '{job_id}' is {status['status']}.")
+    if as_json:
+        click.echo(json.dumps(result, indent=2))
+    else:
+        click.echo(result.get("synthesis", {}).get("synthesis", ""))
+
+
 @llm.hookimpl
 def register_commands(cli):
     @cli.group(cls=DefaultToRunGroup)
     @click.pass_context
     def consortium(ctx):
         """Commands for managing and running model consortiums"""
-        pass
+        setup_logging()
 
     @consortium.command(name="run")
     @click.argument("prompt", required=False)
@@ -867,7 +2270,7 @@ def register_commands(cli):
         "-m",
         "--model", "models",  # store values in 'models'
         multiple=True,
-        help="Model to include, use format 'model:count' or 'model' for default count. Multiple allowed.",
+        help="Model to include, use format 'model:count' or 'model' for default count; prefix 'tierN:' for a cascade tier. Multiple allowed.",
         default=[], # Default to empty list, require at least one model
     )
     @click.option(
@@ -926,8 +2329,72 @@ def register_commands(cli):
         default="default",
         help="Judging method for the arbiter (default, pick-one, rank)."
     )
+    @click.option(
+        "--quorum",
+        type=float,
+        default=None,
+        help="Arbitrate once this many members have answered (a count, or a fraction such as 0.6). Stragglers are cancelled.",
+    )
+    @click.option(
+        "--cache",
+        is_flag=True,
+        default=False,
+        help="Serve repeated member and arbiter prompts from the local response cache.",
+    )
+    @click.option(
+        "--force-diversity",
+        is_flag=True,
+        default=False,
+        help="Keep a unique id in every member prompt even when caching.",
+    )
+    @click.option(
+        "--history-window",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Show the arbiter only the last N iterations in full.",
+    )
+    @click.option(
+        "--compact-history",
+        is_flag=True,
+        default=False,
+        help="Summarise iterations older than the history window instead of dropping them.",
+    )
+    @click.option(
+        "--deadline",
+        type=click.FloatRange(min=0, min_open=True),
+        default=None,
+        help="Seconds the whole run may take; the arbiter works with whatever members answered in time.",
+    )
+    @click.option(
+        "--timeout", "timeouts",
+        multiple=True,
+        help="Time limit per member call: SECONDS for every model, or MODEL=SECONDS (model id or provider). Can be used multiple times.",
+    )
+    @click.option(
+        "--strategy",
+        default="default",
+        help="Strategy choosing which members are queried on each iteration (default, round_robin, bandit, elimination).",
+    )
+    @click.option(
+        "--strategy-param", "strategy_params",
+        multiple=True,
+        help="Strategy parameter as KEY=VALUE, e.g. models_per_iteration=2 (can be used multiple times).",
+    )
+    @click.option(
+        "--escalate-to", "escalate_to",
+        multiple=True,
+        help="Stronger arbiter asked only when the previous one is unsure, unparseable or reports strong dissent (can be used multiple times, cheapest first).",
+    )
+    @click.option(
+        "--template-dir", "template_dirs",
+        multiple=True,
+        type=click.Path(exists=True, file_okay=False, path_type=pathlib.Path),
+        help="Directory of prompt templates overriding the bundled ones by file name (can be used multiple times).",
+    )
     def run_command(prompt, models, count, arbiter, confidence_threshold, max_iterations,
-                   min_iterations, system, output, read_from_stdin, raw, judging_method):
+                   min_iterations, system, output, read_from_stdin, raw, judging_method, quorum,
+                   cache, force_diversity, history_window, compact_history, deadline, timeouts, strategy,
+                   strategy_params, escalate_to, template_dirs):
         """Run prompt through a dynamically defined consortium of models."""
         # Check if models list is empty
         if not models:
@@ -959,31 +2426,16 @@ def register_commands(cli):
             raise click.ClickException(str(e))
 
         # Handle system prompt (text or file path)
-        system_prompt_content = None
-        if system:
-             system_path = pathlib.Path(system)
-             if system_path.is_file():
-                 try:
-                     system_prompt_content = system_path.read_text().strip()
-                     logger.info(f"Loaded system prompt from file: {system}")
-                 except Exception as e:
-                     raise click.ClickException(f"Error reading system prompt file '{system}': {e}")
-             else:
-                 system_prompt_content = system # Use as literal string
-                 logger.info("Using provided system prompt text.")
-        else:
-            system_prompt_content = DEFAULT_SYSTEM_PROMPT # Use default if nothing provided
-            logger.info("Using default system prompt.")
+        system_prompt_content = _system_prompt_option(system)
+        confidence_threshold = _confidence_threshold_option(confidence_threshold)
 
+        if quorum is not None and quorum <= 0:
+            raise click.UsageError("Quorum must be a positive count or a fraction between 0 and 1.")
+        model_timeouts = _timeouts_option(timeouts)
+        strategy_params = _strategy_params_option(strategy, strategy_params)
 
-        # Convert percentage confidence to decimal if needed
-        if confidence_threshold > 1.0:
-             if confidence_threshold <= 100.0:
-                 confidence_threshold /= 100.0
-             else:
-                 raise click.UsageError("Confidence threshold must be between 0.0 and 1.0 (or 0 and 100).")
-        elif confidence_threshold < 0.0:
-             raise click.UsageError("Confidence threshold must be non-negative.")
+        for template_dir in reversed(template_dirs):  # First one given takes precedence
+            register_template_dir(template_dir)
 
         logger.info(f"Starting consortium run with {len(model_dict)} models.")
         logger.debug(f"Models: {', '.join(f'{k}:{v}' for k, v in model_dict.items())}")
@@ -999,11 +2451,22 @@ def register_commands(cli):
                minimum_iterations=min_iterations,
                 arbiter=arbiter,
                judging_method=judging_method,
+               quorum=quorum,
+               cache=cache,
+               force_diversity=force_diversity,
+               history_window=history_window,
+               compact_history=compact_history,
+               deadline=deadline,
+               model_timeouts=model_timeouts,
+               strategy=strategy,
+               strategy_params=strategy_params,
+               tiers=parse_tiers(models),
+               arbiters=[arbiter, *escalate_to] if escalate_to else [],
             )
         )
 
         try:
-            result = orchestrator.orchestrate(prompt, consortium_id=consortium_id)
+            result = orchestrator.orchestrate(prompt, consortium_id=secrets.token_hex(8))
 
             # Output full result to JSON file if requested
             if output:
@@ -1036,6 +2499,230 @@ def register_commands(cli):
             raise click.ClickException(f"Consortium run failed: {e}")
 
 
+    @consortium.command(name="batch")
+    @click.argument("input_path", metavar="INPUT", type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path))
+    @click.option(
+        "-o",
+        "--output",
+        required=True,
+        type=click.Path(dir_okay=False, writable=True, path_type=pathlib.Path),
+        help="JSONL file results are appended to as each prompt finishes.",
+    )
+    @_consortium_definition_options
+    @click.option(
+        "-j",
+        "--concurrency",
+        type=click.IntRange(min=1),
+        default=batch_runner.DEFAULT_CONCURRENCY,
+        show_default=True,
+        help="Number of prompts run at the same time.",
+    )
+    @click.option(
+        "--checkpoint",
+        type=click.Path(dir_okay=False, path_type=pathlib.Path),
+        help="SQLite file recording finished prompts (default: OUTPUT.checkpoint.db).",
+    )
+    @click.option(
+        "--retry-failed",
+        is_flag=True,
+        default=False,
+        help="Run prompts that failed in an earlier attempt again.",
+    )
+    @click.option(
+        "--full",
+        is_flag=True,
+        default=False,
+        help="Include the full result of each run in its output record.",
+    )
+    def batch_command(input_path, output, consortium_name, models, count, arbiter, confidence_threshold,
+                      max_iterations, min_iterations, system, judging_method, concurrency, checkpoint,
+                      retry_failed, full):
+        """Run every prompt in a JSONL file, resuming where an earlier run stopped.
+
+        Each line of INPUT is a JSON string or an object with a "prompt" and an
+        optional "id". Rerunning the same command after an interruption skips
+        the prompts already written to OUTPUT.
+        """
+        config = _config_from_options(consortium_name, models, count, arbiter, confidence_threshold,
+                                      max_iterations, min_iterations, system, judging_method)
+
+        # One orchestrator serves every prompt; each run keeps its state in its own RunContext
+        orchestrator = ConsortiumOrchestrator(config)
+
+        def run_item(item: batch_runner.BatchItem) -> Dict[str, Any]:
+            result = orchestrator.orchestrate(item.prompt, consortium_id=secrets.token_hex(8))
+            return batch_runner.result_record(item, result, full=full)
+
+        progress = {"done": 0}
+
+        def report(record: Dict[str, Any]) -> None:
+            progress["done"] += 1
+            status = f"failed: {record['error']}" if "error" in record else "done"
+            logger.info(f"Batch item {record['id']} {status} ({progress['done']} this run)")
+
+        checkpoint_db = batch_runner.BatchCheckpoint(checkpoint or batch_runner.checkpoint_path_for(output))
+        try:
+            summary = batch_runner.run_batch(run_item, batch_runner.read_items(input_path), output, checkpoint_db,
+                                             concurrency=concurrency, retry_failed=retry_failed,
+                                             on_record=report)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+        finally:
+            checkpoint_db.close()
+        click.echo(f"Ran {summary['run']} prompt(s), {summary['failed']} failed, "
+                   f"{summary['skipped']} already finished. Results in {output}", err=True)
+
+    @consortium.command(name="submit")
+    @click.argument("prompt", required=False)
+    @_consortium_definition_options
+    @click.option(
+        "--max-attempts",
+        type=click.IntRange(min=1),
+        default=job_queue.DEFAULT_MAX_ATTEMPTS,
+        show_default=True,
+        help="Times the job is tried before it is marked failed.",
+    )
+    @click.option(
+        "--wait",
+        is_flag=True,
+        default=False,
+        help="Wait for a worker to finish the job and print its synthesis.",
+    )
+    @click.option(
+        "--queue", "queue_path",
+        type=click.Path(dir_okay=False, path_type=pathlib.Path),
+        help="Job queue database (default: consortium_jobs.db in the llm user directory).",
+    )
+    def submit_command(prompt, consortium_name, models, count, arbiter, confidence_threshold, max_iterations,
+                       min_iterations, system, judging_method, max_attempts, wait, queue_path):
+        """Queue a prompt for `llm consortium worker` processes and print its job id."""
+        prompt = prompt or read_stdin_if_not_tty()
+        if not prompt:
+            raise click.UsageError("No prompt provided via argument or stdin.")
+        config = _config_from_options(consortium_name, models, count, arbiter, confidence_threshold,
+                                      max_iterations, min_iterations, system, judging_method)
+        jobs = get_job_queue(queue_path)
+        job_id = jobs.submit(prompt, config.to_dict(), max_attempts=max_attempts)
+        click.echo(job_id)
+        if wait:
+            jobs.wait(job_id)
+            _echo_job_result(jobs, job_id)
+
+    @consortium.command(name="status")
+    @click.argument("job_id", required=False)
+    @click.option(
+        "--queue", "queue_path",
+        type=click.Path(dir_okay=False, path_type=pathlib.Path),
+        help="Job queue database (default: consortium_jobs.db in the llm user directory).",
+    )
+    def status_command(job_id, queue_path):
+        """Show the status of a job, or job counts for the whole queue."""
+        jobs = get_job_queue(queue_path)
+        if job_id is None:
+            for status, count in jobs.counts().items():
+                click.echo(f"{status}: {count}")
+            return
+        status = jobs.status(job_id)
+        if status is None:
+            raise click.ClickException(f"Job '{job_id}' not found.")
+        click.echo(json.dumps(status, indent=2))
+
+    @consortium.command(name="result")
+    @click.argument("job_id")
+    @click.option(
+        "--wait",
+        is_flag=True,
+        default=False,
+        help="Wait for the job to finish.",
+    )
+    @click.option(
+        "--json", "as_json",
+        is_flag=True,
+        default=False,
+        help="Print the full result as JSON instead of the synthesis.",
+    )
+    @click.option(
+        "--queue", "queue_path",
+        type=click.Path(dir_okay=False, path_type=pathlib.Path),
+        help="Job queue database (default: consortium_jobs.db in the llm user directory).",
+    )
+    def result_command(job_id, wait, as_json, queue_path):
+        """Print the synthesis of a finished job."""
+        jobs = get_job_queue(queue_path)
+        if wait:
+            jobs.wait(job_id)
+        _echo_job_result(jobs, job_id, as_json)
+
+    @consortium.command(name="worker")
+    @click.option(
+        "-p",
+        "--processes",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Worker processes to start, e.g. one per core.",
+    )
+    @click.option(
+        "-t",
+        "--threads",
+        type=click.IntRange(min=1),
+        default=4,
+        show_default=True,
+        help="Jobs each process runs at the same time.",
+    )
+    @click.option(
+        "--lease",
+        type=click.FloatRange(min=1),
+        default=job_queue.DEFAULT_LEASE_SECONDS,
+        show_default=True,
+        help="Seconds a claimed job stays reserved without a heartbeat.",
+    )
+    @click.option(
+        "--exit-when-empty",
+        is_flag=True,
+        default=False,
+        help="Stop once no queued job is left instead of waiting for more.",
+    )
+    @click.option(
+        "--queue", "queue_path",
+        type=click.Path(dir_okay=False, path_type=pathlib.Path),
+        help="Job queue database (default: consortium_jobs.db in the llm user directory).",
+    )
+    def worker_command(processes, threads, lease, exit_when_empty, queue_path):
+        """Run queued jobs until interrupted."""
+        options = {"lease_seconds": lease, "exit_when_empty": exit_when_empty}
+        if processes == 1:
+            _worker_process(queue_path, threads, **options)
+            return
+        # Spawned rather than forked: the parent may already hold SQLite connections and threads
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_worker_process, args=(queue_path, threads), kwargs=options)
+                   for _ in range(processes)]
+        for process in workers:
+            process.start()
+        logger.info(f"Started {processes} worker process(es) with {threads} thread(s) each")
+        try:
+            for process in workers:
+                process.join()
+        except KeyboardInterrupt:
+            # The workers received the same interrupt and are shutting down
+            for process in workers:
+                process.join()
+
+    @consortium.command(name="serve")
+    @click.option("--host", default="127.0.0.1", show_default=True, help="Interface to listen on.")
+    @click.option("--port", type=int, default=8000, show_default=True, help="Port to listen on.")
+    def serve_command(host, port):
+        """Serve saved consortiums through an OpenAI-compatible API.
+
+        Requires the optional server dependencies: pip install 'llm-consortium[serve]'
+        """
+        try:
+            from .server import serve
+        except ImportError as e:
+            raise click.ClickException(f"{e}. Install the server dependencies with: pip install 'llm-consortium[serve]'")
+        serve(host=host, port=port)
+
     # Register consortium management commands group
     @consortium.command(name="save")
     @click.argument("name")
@@ -1043,7 +2730,7 @@ def register_commands(cli):
         "-m",
         "--model", "models",
         multiple=True,
-        help="Model to include (format 'model:count' or 'model'). Multiple allowed.",
+        help="Model to include (format 'model:count' or 'model', prefixed 'tierN:' for a cascade tier). Multiple allowed.",
         required=True,
     )
     @click.option(
@@ -1086,8 +2773,72 @@ def register_commands(cli):
         default="default",
         help="Judging method for the arbiter (default, pick-one, rank)."
     )
+    @click.option(
+        "--quorum",
+        type=float,
+        default=None,
+        help="Arbitrate once this many members have answered (a count, or a fraction such as 0.6). Stragglers are cancelled.",
+    )
+    @click.option(
+        "--cache",
+        is_flag=True,
+        default=False,
+        help="Serve repeated member and arbiter prompts from the local response cache.",
+    )
+    @click.option(
+        "--force-diversity",
+        is_flag=True,
+        default=False,
+        help="Keep a unique id in every member prompt even when caching.",
+    )
+    @click.option(
+        "--history-window",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Show the arbiter only the last N iterations in full.",
+    )
+    @click.option(
+        "--compact-history",
+        is_flag=True,
+        default=False,
+        help="Summarise iterations older than the history window instead of dropping them.",
+    )
+    @click.option(
+        "--deadline",
+        type=click.FloatRange(min=0, min_open=True),
+        default=None,
+        help="Seconds the whole run may take; the arbiter works with whatever members answered in time.",
+    )
+    @click.option(
+        "--timeout", "timeouts",
+        multiple=True,
+        help="Time limit per member call: SECONDS for every model, or MODEL=SECONDS (model id or provider). Can be used multiple times.",
+    )
+    @click.option(
+        "--strategy",
+        default="default",
+        help="Strategy choosing which members are queried on each iteration (default, round_robin, bandit, elimination).",
+    )
+    @click.option(
+        "--strategy-param", "strategy_params",
+        multiple=True,
+        help="Strategy parameter as KEY=VALUE, e.g. models_per_iteration=2 (can be used multiple times).",
+    )
+    @click.option(
+        "--coalesce",
+        is_flag=True,
+        default=False,
+        help="Let concurrent identical prompts share one run (and its answer) instead of each running on its own.",
+    )
+    @click.option(
+        "--escalate-to", "escalate_to",
+        multiple=True,
+        help="Stronger arbiter asked only when the previous one is unsure, unparseable or reports strong dissent (can be used multiple times, cheapest first).",
+    )
     def save_command(name, models, count, arbiter, confidence_threshold, max_iterations,
-                     min_iterations, system, judging_method):
+                     min_iterations, system, judging_method, quorum, cache, force_diversity,
+                     history_window, compact_history, deadline, timeouts, strategy, strategy_params,
+                     coalesce, escalate_to):
         """Save a consortium configuration to be used as a model."""
         try:
             model_dict = parse_models(models, count)
@@ -1117,6 +2868,11 @@ def register_commands(cli):
              raise click.UsageError("Confidence threshold must be non-negative.")
 
 
+        if quorum is not None and quorum <= 0:
+            raise click.UsageError("Quorum must be a positive count or a fraction between 0 and 1.")
+        model_timeouts = _timeouts_option(timeouts)
+        strategy_params = _strategy_params_option(strategy, strategy_params)
+
         config = ConsortiumConfig(
             models=model_dict,
             arbiter=arbiter,
@@ -1125,6 +2881,18 @@ def register_commands(cli):
             minimum_iterations=min_iterations,
             system_prompt=system_prompt_content,
             judging_method=judging_method,
+            quorum=quorum,
+            cache=cache,
+            force_diversity=force_diversity,
+            history_window=history_window,
+            compact_history=compact_history,
+            deadline=deadline,
+            model_timeouts=model_timeouts,
+            strategy=strategy,
+            strategy_params=strategy_params,
+            tiers=parse_tiers(models),
+            arbiters=[arbiter, *escalate_to] if escalate_to else [],
+            coalesce=coalesce,
         )
         try:
             _save_consortium_config(name, config)
@@ -1150,7 +2918,11 @@ def register_commands(cli):
         for name, config in configs.items():
             click.echo(f"Name: {name}")
             click.echo(f"  Models: {', '.join(f'{k}:{v}' for k, v in config.models.items())}")
+            if config.tiers:
+                click.echo(f"  Tiers: {', '.join(f'{k}=tier{v}' for k, v in config.tiers.items())}")
             click.echo(f"  Arbiter: {config.arbiter}")
+            if config.arbiters:
+                click.echo(f"  Arbiter Cascade: {' -> '.join(config.arbiters)}")
             click.echo(f"  Confidence Threshold: {config.confidence_threshold}")
             click.echo(f"  Max Iterations: {config.max_iterations}")
             click.echo(f"  Min Iterations: {config.minimum_iterations}")
@@ -1159,6 +2931,21 @@ def register_commands(cli):
                  system_prompt_display = system_prompt_display[:57] + "..."
             click.echo(f"  System Prompt: {system_prompt_display or 'Default'}")
             click.echo(f"  Judging Method: {config.judging_method}")
+            if config.quorum:
+                click.echo(f"  Quorum: {config.quorum:g}")
+            if config.coalesce:
+                click.echo("  Coalesce: yes")
+            if config.cache:
+                click.echo(f"  Cache: on{' (forced diversity)' if config.force_diversity else ''}")
+            if config.history_window:
+                click.echo(f"  History Window: {config.history_window}{' (compact)' if config.compact_history else ''}")
+            if config.deadline:
+                click.echo(f"  Deadline: {config.deadline:g}s")
+            if config.model_timeouts:
+                click.echo(f"  Timeouts: {', '.join(f'{k}={v:g}s' for k, v in config.model_timeouts.items())}")
+            if config.strategy != "default":
+                params = ", ".join(f"{k}={v}" for k, v in config.strategy_params.items())
+                click.echo(f"  Strategy: {config.strategy}{f' ({params})' if params else ''}")
             click.echo("") # Empty line between consortiums
 
 
@@ -1168,19 +2955,14 @@ def register_commands(cli):
         """Remove a saved consortium configuration."""
         db = DatabaseConnection.get_connection()
         # Ensure table exists before trying to delete
-        db.execute("""
-        CREATE TABLE IF NOT EXISTS consortium_configs (
-            name TEXT PRIMARY KEY,
-            config TEXT NOT NULL,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        _ensure_config_table(db)
         try:
             # Check if it exists before deleting
             count = db["consortium_configs"].count_where("name = ?", [name])
             if count == 0:
                  raise click.ClickException(f"Consortium with name '{name}' not found.")
             db["consortium_configs"].delete(name)
+            _invalidate_config_index()
             click.echo(f"Consortium configuration '{name}' removed.")
         except Exception as e:
              # Catch potential database errors beyond NotFoundError
@@ -1200,11 +2982,12 @@ def register_models(register):
         logger.error(f"Failed to register dummy model: {e}")
     
     try:
-        configs = _get_consortium_configs()
+        # Read the raw index only: parsing each config waits until the model is used
+        configs = _load_config_index()
         for name, config in configs.items():
             try:
                 # Ensure config is valid before registering
-                if not config.models or not config.arbiter:
+                if not isinstance(config, dict) or not config.get("models") or not config.get("arbiter"):
                      logger.warning(f"Skipping registration of invalid consortium '{name}': Missing models or arbiter.")
                      continue
                 model_instance = ConsortiumModel(name, config)
@@ -1232,9 +3015,10 @@ logger.debug("llm_consortium module finished loading")
 # Define __all__ for explicit exports if this were a larger package
 __all__ = [
     'KarpathyConsortiumPlugin', 'ConsortiumModel', 'ConsortiumConfig',
-    'ConsortiumOrchestrator', 'create_consortium', 'register_commands',
+    'ConsortiumOrchestrator', 'AsyncConsortiumOrchestrator', 'RunContext', 'create_consortium', 'register_commands',
     'register_models', 'log_response', 'DatabaseConnection', 'logs_db_path',
-    'user_dir'
+    'user_dir', 'limiter_stats', 'configure_limits', 'log_writer_stats', 'register_template_dir',
+    'orchestrator_cache_stats', 'model_pool_stats', 'clear_models', 'get_job_queue', 'coalescing_stats'
 ]
 
 __version__ = "0.3.2" # Incremented version number
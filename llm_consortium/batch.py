@@ -0,0 +1,245 @@
+"""Resumable batch runs over a JSONL file of prompts.
+
+Prompts are run concurrently, at most ``concurrency`` at a time, and each
+result is appended to the output JSONL as soon as its run finishes. Finished
+prompts are recorded in a SQLite checkpoint next to the output, so an
+interrupted batch picked up again with the same output only runs the prompts
+it had not finished. Prompts that failed are recorded too and are only rerun
+when asked to; their records are then removed from the output, so every
+prompt ends up with exactly one record.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+import concurrent.futures
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+# Bytes read at a time while searching backwards from the end of the output for a line break
+_TAIL_BLOCK = 64 * 1024
+
+
+class BatchItem:
+    def __init__(self, item_id: str, prompt: str, line: int):
+        self.id = item_id
+        self.prompt = prompt
+        self.line = line
+
+
+def read_items(path: pathlib.Path) -> Iterator[BatchItem]:
+    """Yield the prompts in a JSONL file.
+
+    Each line is either a JSON string or an object with a ``prompt`` and an
+    optional ``id``; lines without an id are identified by their line number.
+    """
+    with pathlib.Path(path).open(encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Line {number} of {path} is not valid JSON: {e}")
+            if isinstance(data, str):
+                data = {"prompt": data}
+            if not isinstance(data, dict) or not isinstance(data.get("prompt"), str):
+                raise ValueError(f"Line {number} of {path} has no 'prompt' string")
+            yield BatchItem(str(data.get("id", number)), data["prompt"], number)
+
+
+def checkpoint_path_for(output: pathlib.Path) -> pathlib.Path:
+    output = pathlib.Path(output)
+    return output.with_name(output.name + ".checkpoint.db")
+
+
+class BatchCheckpoint:
+    def __init__(self, path: pathlib.Path):
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS batch_items (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                finished_at REAL NOT NULL
+            )
+        """)
+
+    def finished(self) -> Set[str]:
+        """Ids of prompts that need no further run."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT id FROM batch_items")}
+
+    def record(self, item_id: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO batch_items (id, status, error, attempts, finished_at) VALUES (?, ?, ?, 1, ?) "
+                "ON CONFLICT(id) DO UPDATE SET status = excluded.status, error = excluded.error, "
+                "attempts = attempts + 1, finished_at = excluded.finished_at",
+                (item_id, "failed" if error else "done", error, time.time()),
+            )
+
+    def failed(self) -> Set[str]:
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT id FROM batch_items WHERE status = 'failed'")}
+
+    def forget(self, item_ids: Set[str]) -> None:
+        """Drop ``item_ids`` from the checkpoint, so they count as not yet run."""
+        with self._lock:
+            self._conn.executemany("DELETE FROM batch_items WHERE id = ?", [(item_id,) for item_id in item_ids])
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM batch_items GROUP BY status").fetchall())
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _line_start(f, pos: int) -> int:
+    """Offset just past the last line break before ``pos`` in ``f``, or 0 if there is none."""
+    while pos > 0:
+        block_start = max(0, pos - _TAIL_BLOCK)
+        f.seek(block_start)
+        newline = f.read(pos - block_start).rfind(b"\n")
+        if newline >= 0:
+            return block_start + newline + 1
+        pos = block_start
+    return 0
+
+
+def _recover_output(output: pathlib.Path, checkpoint: BatchCheckpoint) -> None:
+    """Reconcile the output file with the checkpoint after an interrupted batch.
+
+    A cut-short last line is truncated so that appending continues on a clean
+    line. Records are checkpointed one at a time right after being written, so
+    only the last complete record can be missing from the checkpoint; it is
+    recorded. Only the end of the file is read.
+    """
+    if not output.exists():
+        return
+    with output.open("rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        end = _line_start(f, size)
+        if end < size:
+            logger.warning(f"Dropping incomplete last line of {output}")
+            f.truncate(end)
+        start = _line_start(f, end - 1) if end else 0
+        f.seek(start)
+        last = f.read(end - start)
+    try:
+        record = json.loads(last)
+    except json.JSONDecodeError:
+        return
+    item_id = str(record.get("id"))
+    if item_id not in checkpoint.finished():
+        checkpoint.record(item_id, record.get("error"))
+
+
+def _drop_failed(output: pathlib.Path, checkpoint: BatchCheckpoint) -> None:
+    """Remove the records of failed prompts from ``output`` and the checkpoint before they are retried."""
+    failed = checkpoint.failed()
+    if not failed:
+        return
+    if output.exists():
+        tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+        with output.open("rb") as src, tmp_path.open("wb") as dst:
+            for line in src:
+                try:
+                    item_id = str(json.loads(line).get("id"))
+                except (json.JSONDecodeError, AttributeError):
+                    item_id = None
+                if item_id not in failed:
+                    dst.write(line)
+        os.replace(tmp_path, output)
+    checkpoint.forget(failed)
+
+
+def result_record(item: BatchItem, result: Dict[str, Any], full: bool = False) -> Dict[str, Any]:
+    synthesis = result.get("synthesis", {})
+    record = {
+        "id": item.id,
+        "synthesis": synthesis.get("synthesis"),
+        "confidence": synthesis.get("confidence"),
+        "iterations": result.get("metadata", {}).get("iteration_count"),
+    }
+    if full:
+        record["result"] = result
+    return record
+
+
+def run_batch(run: Callable[[BatchItem], Dict[str, Any]], items: Iterator[BatchItem], output: pathlib.Path,
+              checkpoint: BatchCheckpoint, concurrency: int = DEFAULT_CONCURRENCY, retry_failed: bool = False,
+              on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, int]:
+    """Run every unfinished item with ``run`` and append one JSON record per item to ``output``.
+
+    ``run`` returns the record to write for an item; an exception is recorded
+    as that item's error. Items are read lazily and at most ``concurrency``
+    runs are in flight, so a large input is never held in memory. Returns the
+    number of items run, failed and skipped.
+    """
+    output = pathlib.Path(output)
+    _recover_output(output, checkpoint)
+    if retry_failed:
+        _drop_failed(output, checkpoint)
+    skip = checkpoint.finished()
+    summary = {"run": 0, "failed": 0, "skipped": 0}
+    seen: Set[str] = set()
+
+    def pending_items() -> Iterator[BatchItem]:
+        for item in items:
+            if item.id in seen:
+                raise ValueError(f"Duplicate id {item.id!r} on line {item.line}")
+            seen.add(item.id)
+            if item.id in skip:
+                summary["skipped"] += 1
+            else:
+                yield item
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="consortium-batch")
+    in_flight: Dict[concurrent.futures.Future, BatchItem] = {}
+    queued = pending_items()
+    try:
+        with output.open("a", encoding="utf-8") as out:
+            while True:
+                # Keep the pool full without reading the whole input ahead of it
+                while len(in_flight) < concurrency:
+                    item = next(queued, None)
+                    if item is None:
+                        break
+                    in_flight[executor.submit(run, item)] = item
+                if not in_flight:
+                    break
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        record = future.result()
+                        error = None
+                    except Exception as e:
+                        logger.error(f"Batch item {item.id} failed: {e}")
+                        error = str(e) or type(e).__name__
+                        record = {"id": item.id, "error": error}
+                    # The record is on disk before the checkpoint says so; _recover_output covers the gap
+                    out.write(json.dumps(record) + "\n")
+                    out.flush()
+                    checkpoint.record(item.id, error)
+                    summary["run"] += 1
+                    if error is not None:
+                        summary["failed"] += 1
+                    if on_record is not None:
+                        on_record(record)
+    finally:
+        # Runs still in flight after an interruption are left unrecorded and rerun on resume
+        executor.shutdown(wait=False, cancel_futures=True)
+    return summary
@@ -0,0 +1,136 @@
+"""Opt-in, content-addressed cache of member and arbiter responses.
+
+Entries live in a local SQLite file keyed by a hash of the model id, the
+normalized prompt and any options that affect the answer. Entries older than
+the caller's TTL are treated as misses, and the least recently used entries are
+evicted once the stored text exceeds the size limit.
+"""
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import pathlib
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse differences that do not change a prompt's meaning: line endings and trailing whitespace."""
+    lines = prompt.replace("\r\n", "\n").strip().split("\n")
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def cache_key(model: str, prompt: str, options: Optional[Dict[str, Any]] = None) -> str:
+    payload = json.dumps({"model": model, "prompt": normalize_prompt(prompt), "options": options or {}},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path: pathlib.Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = pathlib.Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Running size of the stored text, kept in step with this process's writes so that a put
+        # does not have to sum the table; re-read whenever it crosses max_bytes
+        self._bytes = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str, ttl: Optional[float] = DEFAULT_TTL_SECONDS) -> Optional[str]:
+        """Return the cached response for ``key``, or None if absent or older than ``ttl`` seconds."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at, size FROM responses WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is not None and ttl is not None and now - row[1] > ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bytes -= row[2]
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now),
+            )
+            self._bytes += size - (replaced[0] if replaced else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in ``max_bytes``."""
+        # Other processes sharing the file may have written or evicted since the total was last read
+        self._bytes = self._stored_bytes()
+        excess = self._bytes - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            victims.append((key,))
+            excess -= size
+            self._bytes -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evictions += len(victims)
+        logger.debug(f"Evicted {len(victims)} cached response(s) from {self.path}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+_caches: Dict[str, ResponseCache] = {}
+_registry_lock = threading.Lock()
+
+
+def get_cache(path: pathlib.Path, max_bytes: int = DEFAULT_MAX_BYTES) -> ResponseCache:
+    """Return the process-wide cache stored at ``path``, opening it on first use."""
+    with _registry_lock:
+        cache = _caches.get(str(path))
+        if cache is None:
+            cache = _caches[str(path)] = ResponseCache(path, max_bytes)
+        else:
+            cache.max_bytes = max_bytes
+        return cache
@@ -0,0 +1,211 @@
+"""Write-behind logging of responses to llm's logs.db.
+
+Member and arbiter threads only put finished responses on a bounded queue. A
+single background thread owns the SQLite connection, switches the database to
+WAL mode and writes whatever has queued up in one transaction per batch, so
+concurrent members never contend for the database lock. The queue is flushed
+when the interpreter exits.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import atexit
+import logging
+import pathlib
+import queue
+import threading
+import time
+
+import sqlite_utils
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE = 1000
+DEFAULT_BATCH_SIZE = 100
+# How long a caller waits for room in a full queue before the response is dropped
+DEFAULT_PUT_TIMEOUT = 5.0
+EXIT_FLUSH_TIMEOUT = 10.0
+
+_STOP = object()
+
+
+class LogWriter:
+    def __init__(self, path: pathlib.Path, max_queue: int = DEFAULT_MAX_QUEUE,
+                 batch_size: int = DEFAULT_BATCH_SIZE, put_timeout: float = DEFAULT_PUT_TIMEOUT):
+        self.path = pathlib.Path(path)
+        self.batch_size = batch_size
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # Counters for monitoring
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.write_seconds = 0.0
+        self.max_write_seconds = 0.0
+        self.queued_seconds = 0.0
+
+    def submit(self, response: Any, label: str) -> bool:
+        """Queue ``response`` to be logged; returns False if it had to be dropped."""
+        if self._closed:
+            with self._lock:
+                self.dropped += 1
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put((response, label, time.monotonic()), timeout=self.put_timeout)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning(f"Log queue full, dropping response from {label}")
+            return False
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued response has been written; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = EXIT_FLUSH_TIMEOUT) -> None:
+        """Write out the queue and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self._queue.maxsize,
+                "written": self.written,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "batches": self.batches,
+                "avg_write_ms": round(1000 * self.write_seconds / self.batches, 3) if self.batches else 0.0,
+                "max_write_ms": round(1000 * self.max_write_seconds, 3),
+                "avg_queued_ms": round(1000 * self.queued_seconds / (self.written + self.failed), 3)
+                if self.written + self.failed else 0.0,
+            }
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="consortium-log-writer", daemon=True)
+                self._thread.start()
+
+    def _connect(self) -> sqlite_utils.Database:
+        db = sqlite_utils.Database(self.path)
+        db.conn.execute("PRAGMA journal_mode=WAL")
+        # Durable enough in WAL mode, and avoids an fsync per transaction
+        db.conn.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _run(self) -> None:
+        db = None
+        while True:
+            item = self._queue.get()
+            batch: List[Tuple[Any, str, float]] = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            # Take whatever else has queued up, without waiting for more
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    if db is None:
+                        db = self._connect()
+                    self._write_batch(db, batch)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} response(s) to {self.path}: {e}")
+                with self._lock:
+                    self.failed += len(batch)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self._queue.task_done()
+            if stop:
+                break
+        if db is not None:
+            db.conn.close()
+
+    def _write_batch(self, db: sqlite_utils.Database, batch: List[Tuple[Any, str, float]]) -> None:
+        start = time.monotonic()
+        written = failed = 0
+        queued = 0.0
+        conn = db.conn
+        conn.execute("BEGIN")
+        try:
+            for response, label, enqueued in batch:
+                queued += start - enqueued
+                # A savepoint per response, so one bad row does not lose the batch
+                conn.execute("SAVEPOINT log_response")
+                try:
+                    response.log_to_db(db)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT log_response")
+                    logger.error(f"Error logging response from {label} to database: {e}")
+                    failed += 1
+                else:
+                    written += 1
+                conn.execute("RELEASE SAVEPOINT log_response")
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        elapsed = time.monotonic() - start
+        with self._lock:
+            self.written += written
+            self.failed += failed
+            self.batches += 1
+            self.write_seconds += elapsed
+            self.max_write_seconds = max(self.max_write_seconds, elapsed)
+            self.queued_seconds += queued
+        logger.debug(f"Logged {written} response(s) in {elapsed * 1000:.1f}ms")
+
+
+_writers: Dict[str, LogWriter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_log_writer(path: pathlib.Path) -> LogWriter:
+    """Return the process-wide writer for the database at ``path``, creating it on first use."""
+    with _registry_lock:
+        writer = _writers.get(str(path))
+        if writer is None:
+            writer = _writers[str(path)] = LogWriter(path)
+        return writer
+
+
+def writer_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every log writer in this process, keyed by database path."""
+    with _registry_lock:
+        writers = dict(_writers)
+    return {path: writer.stats() for path, writer in writers.items()}
+
+
+@atexit.register
+def _close_writers() -> None:
+    with _registry_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.close()
@@ -0,0 +1,268 @@
+"""Durable SQLite job queue for consortium runs spread over worker processes.
+
+Jobs are submitted with the prompt and the consortium configuration to run it
+with. A worker claims the oldest queued job under a lease and keeps the lease
+alive with heartbeats while the run is in progress; a job whose lease runs out
+(because its worker died or hung) is handed to the next worker that asks. Each
+claim counts as an attempt, and a job that has used up its attempts is marked
+failed. Claims happen inside ``BEGIN IMMEDIATE`` transactions, so any number of
+worker processes on one host can share the queue file.
+"""
+from typing import Any, Callable, Dict, List, Optional
+import json
+import logging
+import os
+import pathlib
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_POLL_INTERVAL = 1.0
+
+STATUSES = ("queued", "running", "done", "failed")
+
+
+class Job:
+    def __init__(self, row: sqlite3.Row):
+        self.id = row["id"]
+        self.prompt = row["prompt"]
+        self.config = json.loads(row["config"])
+        self.status = row["status"]
+        self.attempts = row["attempts"]
+        self.max_attempts = row["max_attempts"]
+
+
+class JobQueue:
+    def __init__(self, path: pathlib.Path, busy_timeout: float = 30.0):
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None,
+                                     timeout=busy_timeout)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                prompt TEXT NOT NULL,
+                config TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                worker TEXT,
+                lease_expires REAL,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+
+    def submit(self, prompt: str, config: Dict[str, Any], max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+               job_id: Optional[str] = None) -> str:
+        """Queue ``prompt`` to be run with the consortium ``config`` and return the job id."""
+        job_id = job_id or uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, prompt, config, status, max_attempts, created_at) VALUES (?, ?, ?, 'queued', ?, ?)",
+                (job_id, prompt, json.dumps(config), max_attempts, time.time()),
+            )
+        return job_id
+
+    def claim(self, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Job]:
+        """Lease the oldest runnable job to ``worker``, or return None if there is none."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Jobs whose worker disappeared after their last attempt will never finish
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = 'Lease expired', finished_at = ?, worker = NULL "
+                    "WHERE status = 'running' AND lease_expires < ? AND attempts >= max_attempts",
+                    (now, now),
+                )
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' OR (status = 'running' AND lease_expires < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                if row["status"] == "running":
+                    logger.warning(f"Job {row['id']} lease held by {row['worker']} expired; reclaiming")
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'running', worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                    "started_at = ? WHERE id = ?",
+                    (worker, now + lease_seconds, now, row["id"]),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            job = Job(row)
+            job.status = "running"
+            job.attempts += 1
+            return job
+
+    def heartbeat(self, job_id: str, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """Extend ``worker``'s lease on a job; False means the lease was lost to another worker."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                (time.time() + lease_seconds, job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker: str, result: Dict[str, Any]) -> bool:
+        """Store a job's result. Ignored (returns False) if ``worker`` no longer holds its lease."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL, worker = NULL, finished_at = ? "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (json.dumps(result), time.time(), job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker: str, error: str) -> bool:
+        """Record a failed attempt; the job is queued again while it has attempts left."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET error = ?, worker = NULL, lease_expires = NULL, "
+                "status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+                "finished_at = CASE WHEN attempts < max_attempts THEN NULL ELSE ? END "
+                "WHERE id = ? AND worker = ? AND status = 'running'",
+                (error, time.time(), job_id, worker),
+            )
+        return cursor.rowcount == 1
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, error, attempts, max_attempts, worker, created_at, started_at, finished_at "
+                "FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The result of a finished job, or None if it has not finished successfully."""
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM jobs WHERE id = ? AND status = 'done'", (job_id,)).fetchone()
+        return json.loads(row["result"]) if row is not None else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None,
+             poll_interval: float = DEFAULT_POLL_INTERVAL) -> Optional[Dict[str, Any]]:
+        """Block until a job is done or failed and return its status, or None on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.status(job_id)
+            if status is None or status["status"] in ("done", "failed"):
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_queues: Dict[str, JobQueue] = {}
+_registry_lock = threading.Lock()
+
+
+def get_queue(path: pathlib.Path) -> JobQueue:
+    """Return the process-wide queue stored at ``path``, opening it on first use."""
+    with _registry_lock:
+        queue = _queues.get(str(path))
+        if queue is None:
+            queue = _queues[str(path)] = JobQueue(path)
+        return queue
+
+
+def worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+
+
+def _keep_lease(queue: JobQueue, job: Job, worker: str, lease_seconds: float, done: threading.Event) -> None:
+    while not done.wait(lease_seconds / 3):
+        if not queue.heartbeat(job.id, worker, lease_seconds):
+            logger.warning(f"Worker {worker} lost the lease on job {job.id}")
+            return
+
+
+def run_worker(queue: JobQueue, handler: Callable[[Job], Dict[str, Any]],
+               lease_seconds: float = DEFAULT_LEASE_SECONDS, poll_interval: float = DEFAULT_POLL_INTERVAL,
+               exit_when_empty: bool = False, stop: Optional[threading.Event] = None) -> int:
+    """Claim and run jobs with ``handler`` until ``stop`` is set. Returns the number of jobs handled.
+
+    With ``exit_when_empty`` the worker returns as soon as no job is runnable.
+    """
+    worker = worker_name()
+    stop = stop or threading.Event()
+    handled = 0
+    while not stop.is_set():
+        job = queue.claim(worker, lease_seconds)
+        if job is None:
+            if exit_when_empty:
+                break
+            stop.wait(poll_interval)
+            continue
+        logger.info(f"Worker {worker} running job {job.id} (attempt {job.attempts}/{job.max_attempts})")
+        done = threading.Event()
+        threading.Thread(target=_keep_lease, args=(queue, job, worker, lease_seconds, done), daemon=True).start()
+        try:
+            result = handler(job)
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            queue.fail(job.id, worker, str(e) or type(e).__name__)
+        else:
+            if not queue.complete(job.id, worker, result):
+                logger.warning(f"Discarding result of job {job.id}: its lease was taken over")
+        finally:
+            done.set()
+        handled += 1
+    return handled
+
+
+def run_workers(queue: JobQueue, handler: Callable[[Job], Dict[str, Any]], threads: int = 1,
+                **kwargs) -> List[int]:
+    """Run ``threads`` workers in this process over one queue and return the jobs each handled.
+
+    On an interrupt the workers stop claiming and the call returns at once;
+    jobs still in flight are picked up by another worker when their lease expires.
+    """
+    handled = [0] * threads
+    stop = kwargs.setdefault("stop", threading.Event())
+
+    def work(index: int) -> None:
+        handled[index] = run_worker(queue, handler, **kwargs)
+
+    workers = [threading.Thread(target=work, args=(n,), name=f"consortium-worker-{n}", daemon=True)
+               for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    try:
+        for thread in workers:
+            # Joined with a timeout so the main thread stays responsive to Ctrl-C
+            while thread.is_alive():
+                thread.join(1.0)
+    except KeyboardInterrupt:
+        stop.set()
+        raise
+    return handled
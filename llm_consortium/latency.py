@@ -0,0 +1,85 @@
+"""Per-model latency tracking and the budget for hedged member requests.
+
+A hedged request is a duplicate of a member call sent once the original has
+been running longer than a high percentile of that model's recent latencies.
+Whichever finishes first wins. The budget caps hedges at a fraction of all
+primary requests so hedging cannot multiply load during a provider slowdown.
+"""
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+import math
+import threading
+
+DEFAULT_WINDOW = 200
+# Percentiles are not trusted (and hedging stays off) until this many samples exist
+DEFAULT_MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    def __init__(self, window: int = DEFAULT_WINDOW, min_samples: int = DEFAULT_MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(model)
+            if samples is None:
+                samples = self._samples[model] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, model: str, p: float) -> Optional[float]:
+        """The ``p``-th percentile (0-100) of recent latencies, or None without enough samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(model, ()))
+        if len(samples) < self.min_samples:
+            return None
+        rank = max(0, math.ceil(p / 100 * len(samples)) - 1)
+        return samples[min(rank, len(samples) - 1)]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            models = list(self._samples)
+        return {
+            model: {
+                "samples": len(self._samples[model]),
+                "p50": self.percentile(model, 50),
+                "p90": self.percentile(model, 90),
+                "p99": self.percentile(model, 99),
+            }
+            for model in models
+        }
+
+
+class HedgeBudget:
+    """Allows at most ``ratio`` hedged requests per primary request, per model."""
+
+    def __init__(self):
+        self._primaries: Dict[str, int] = {}
+        self._hedges: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def note_primary(self, model: str) -> None:
+        with self._lock:
+            self._primaries[model] = self._primaries.get(model, 0) + 1
+
+    def try_hedge(self, model: str, ratio: float) -> bool:
+        with self._lock:
+            hedges = self._hedges.get(model, 0)
+            if hedges + 1 > ratio * self._primaries.get(model, 0):
+                return False
+            self._hedges[model] = hedges + 1
+            return True
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                model: {"primaries": primaries, "hedges": self._hedges.get(model, 0)}
+                for model, primaries in self._primaries.items()
+            }
+
+
+# Shared by every orchestrator in the process
+latency_tracker = LatencyTracker()
+hedge_budget = HedgeBudget()
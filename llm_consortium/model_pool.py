@@ -0,0 +1,176 @@
+"""Process-wide cache of resolved models and pooled HTTP clients.
+
+``llm.get_model`` walks every plugin's ``register_models`` hook on each call,
+and llm's OpenAI-compatible models build a new API client (and so a new
+connection pool) for every prompt, so consecutive member calls never reuse a
+TLS connection. Resolved models are cached here by name, and models that build
+their client through the public ``get_client(key, *, async_=False)`` method of
+llm's OpenAI-compatible models share one keep-alive client per provider,
+endpoint and API key. The cached model is a copy whose class overrides
+``get_client`` in a subclass, so neither the provider's class nor the model
+llm returned is modified. Async clients are pooled per event loop, since their
+connections belong to the loop that opened them.
+
+Models are resolved once per process: call ``clear_models()`` after plugins
+are registered or removed at runtime.
+"""
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import asyncio
+import copy
+import logging
+import threading
+import weakref
+
+import llm
+
+from .scheduler import provider_for
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool:
+    def __init__(self):
+        self._clients: Dict[Tuple, Any] = {}
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, Any]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def get(self, pool_key: Tuple, factory: Callable[[], Any], loop: Optional[asyncio.AbstractEventLoop] = None) -> Any:
+        with self._lock:
+            clients = self._clients if loop is None else self._async_clients.setdefault(loop, {})
+            client = clients.get(pool_key)
+            if client is not None:
+                self.reused += 1
+                return client
+            client = clients[pool_key] = factory()
+            self.created += 1
+        logger.debug(f"Opened pooled client for {pool_key[0]}")
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._async_clients = weakref.WeakKeyDictionary()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"Error closing pooled client: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"clients": len(self._clients), "created": self.created, "reused": self.reused}
+
+
+_pooled_classes: Dict[type, type] = {}
+_pooled_classes_lock = threading.Lock()
+
+
+def _pooled_class(cls: type) -> type:
+    """``cls`` with ``get_client`` served from the model's client pool."""
+    with _pooled_classes_lock:
+        pooled = _pooled_classes.get(cls)
+        if pooled is not None:
+            return pooled
+
+        def get_client(self, key=None, *, async_=False):
+            api_key = self.get_key(key) if getattr(self, "needs_key", None) else None
+            pool_key = (provider_for(self.model_id) or self.model_id, getattr(self, "api_base", None), api_key,
+                        repr(getattr(self, "headers", None)), async_)
+            loop = asyncio.get_running_loop() if async_ else None
+            return self._consortium_pool.get(pool_key, lambda: cls.get_client(self, key, async_=async_), loop)
+
+        pooled = _pooled_classes[cls] = type(cls.__name__, (cls,), {
+            "get_client": get_client, "__module__": cls.__module__, "_consortium_pooled": True})
+        return pooled
+
+
+def _pooled_model(model: Any, pool: ClientPool) -> Any:
+    """A copy of ``model`` that takes its API clients from ``pool``; models without ``get_client`` are returned as is."""
+    if not callable(getattr(type(model), "get_client", None)) or getattr(model, "_consortium_pooled", False):
+        return model
+    pooled = copy.copy(model)
+    pooled.__class__ = _pooled_class(type(model))
+    pooled._consortium_pool = pool
+    return pooled
+
+
+class ModelCache:
+    """Resolved sync and async models by name, kept until ``clear`` is called."""
+
+    def __init__(self, pool: ClientPool):
+        self.pool = pool
+        self._models: Dict[Tuple[str, bool], Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, async_: bool = False) -> Any:
+        with self._lock:
+            model = self._models.get((name, async_))
+            if model is not None:
+                self.hits += 1
+                return model
+            self.misses += 1
+        model = _pooled_model(llm.get_async_model(name) if async_ else llm.get_model(name), self.pool)
+        with self._lock:
+            return self._models.setdefault((name, async_), model)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"models": len(self._models), "hits": self.hits, "misses": self.misses}
+
+
+client_pool = ClientPool()
+model_cache = ModelCache(client_pool)
+
+
+def clear_models() -> None:
+    """Forget every resolved model, so the next use resolves it through llm's plugins again."""
+    model_cache.clear()
+
+
+def resolve_model(name: str) -> Any:
+    """``llm.get_model(name)``, resolved once per process."""
+    return model_cache.get(name)
+
+
+def resolve_async_model(name: str) -> Any:
+    """``llm.get_async_model(name)``, resolved once per process."""
+    return model_cache.get(name, async_=True)
+
+
+def warm(models: Iterable[str], connect: bool = True, timeout: float = 5.0) -> Dict[str, Optional[str]]:
+    """Resolve ``models`` and, with ``connect``, open their pooled connections ahead of the first prompt.
+
+    Connections are opened with a HEAD request to each client's base URL.
+    Returns a mapping of model name to an error message, or None if it warmed up.
+    """
+    results: Dict[str, Optional[str]] = {}
+    for name in models:
+        try:
+            model = resolve_model(name)
+            client = model.get_client(None) if connect and callable(getattr(model, "get_client", None)) else None
+            if client is not None:
+                http_client = getattr(client, "_client", None)
+                base_url = getattr(client, "base_url", None)
+                if http_client is not None and base_url is not None:
+                    http_client.head(str(base_url), timeout=timeout)
+            results[name] = None
+        except Exception as e:
+            logger.warning(f"Could not warm up {name}: {e}")
+            results[name] = str(e)
+    return results
+
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    return {"models": model_cache.stats(), "clients": client_pool.stats()}
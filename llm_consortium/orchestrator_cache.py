@@ -0,0 +1,81 @@
+"""LRU cache of orchestrators keyed by their effective configuration.
+
+A prompt that overrides the system prompt needs an orchestrator built from a
+modified config. Orchestrators keep no per-run state, so one built for a given
+configuration can be reused by every later call with the same configuration,
+along with whatever it has warmed up. The least recently used orchestrators are
+dropped once the cache is full.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+import hashlib
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 32
+
+
+def config_key(config_data: Dict[str, Any]) -> str:
+    """Stable hash of a configuration dict, independent of key order."""
+    payload = json.dumps(config_data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class OrchestratorCache:
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, config_data: Dict[str, Any], factory: Callable[[], Any]) -> Any:
+        """Return the orchestrator for ``config_data``, building it with ``factory`` on a miss."""
+        key = config_key(config_data)
+        with self._lock:
+            orchestrator = self._entries.get(key)
+            if orchestrator is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return orchestrator
+            self.misses += 1
+        # Built outside the lock; if another thread got there first, its instance wins
+        orchestrator = factory()
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = orchestrator
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        logger.debug(f"Cached orchestrator for config {key[:12]} ({len(self._entries)}/{self.max_size})")
+        return orchestrator
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+_cache = OrchestratorCache()
+
+
+def get_orchestrator_cache(max_size: Optional[int] = None) -> OrchestratorCache:
+    """Return the process-wide orchestrator cache, optionally resizing it."""
+    if max_size is not None:
+        _cache.max_size = max_size
+    return _cache
+
+
+def orchestrator_cache_stats() -> Dict[str, Any]:
+    return _cache.stats()
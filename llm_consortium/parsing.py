@@ -0,0 +1,136 @@
+"""Single-pass, incremental extraction of tagged sections from model output.
+
+Arbiter and member responses use a loose XML-like format (``<synthesis>``,
+``<confidence>``, ...). Rather than running one regular expression per tag over
+the complete text, ``TagScanner`` walks the text once, in whatever chunks it
+arrives, and records each wanted tag as soon as its closing tag is seen. The
+results match a non-greedy, case-insensitive search for each tag: the first
+complete occurrence wins, and tags may nest or overlap freely.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Pattern
+import re
+
+_TAG = re.compile(r"<(/?)([A-Za-z_]+)>")
+# A tag cut off by the end of a chunk; it is carried over to the next one
+_PARTIAL_TAG = re.compile(r"</?[A-Za-z_]*\Z")
+_MAX_TAG_LENGTH = 64
+
+ARBITER_TAGS = ("synthesis", "confidence", "analysis", "dissent", "needs_iteration", "refinement_areas")
+ARBITER_PATTERNS: Dict[str, Pattern] = {
+    "confidence": re.compile(r"\s*([\d.]+)\s*"),
+    "needs_iteration": re.compile(r"(true|false)", re.IGNORECASE),
+}
+PICK_ONE_PATTERNS: Dict[str, Pattern] = {"response_id": re.compile(r"\s*(\d+)\s*")}
+MEMBER_CONFIDENCE_PATTERNS: Dict[str, Pattern] = {"confidence": re.compile(r"\s*(0?\.?\d+|1\.0|\d+)\s*")}
+
+
+class TagScanner:
+    """Incrementally extract the contents of ``tags`` from text fed in chunks.
+
+    ``patterns`` optionally constrains a tag's content: the content must match the
+    pattern in full, and its first group becomes the value. Occurrences that do not
+    match are skipped, so a later well-formed tag can still be found.
+
+    ``on_tag(name, value)`` is called as soon as a tag closes. For tags listed in
+    ``stream``, ``on_content(name, text)`` additionally receives the tag's content
+    piece by piece while it is still open.
+    """
+
+    def __init__(self, tags: Iterable[str], patterns: Optional[Dict[str, Pattern]] = None,
+                 on_tag: Optional[Callable[[str, str], None]] = None,
+                 stream: Iterable[str] = (), on_content: Optional[Callable[[str, str], None]] = None):
+        self.tags = {tag.lower() for tag in tags}
+        self.patterns = {tag.lower(): pattern for tag, pattern in (patterns or {}).items()}
+        self.stream = {tag.lower() for tag in stream}
+        self.on_tag = on_tag
+        self.on_content = on_content
+        self.values: Dict[str, str] = {}
+        self._open: Dict[str, int] = {}      # tag -> offset where its content starts
+        self._streamed: Dict[str, int] = {}  # tag -> offset up to which content was streamed
+        self._chunks: List[str] = []
+        self._carry = ""
+        self._carry_offset = 0
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    @property
+    def complete(self) -> bool:
+        """True once every wanted tag has been found."""
+        return len(self.values) == len(self.tags)
+
+    def get(self, tag: str, default: Optional[str] = None) -> Optional[str]:
+        return self.values.get(tag, default)
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        data = self._carry + chunk
+        base = self._carry_offset
+        settled = len(data)
+        pos = 0
+        while True:
+            lt = data.find("<", pos)
+            if lt == -1:
+                break
+            match = _TAG.match(data, lt)
+            if match is None:
+                if len(data) - lt < _MAX_TAG_LENGTH and _PARTIAL_TAG.match(data, lt):
+                    settled = lt
+                    break
+                pos = lt + 1
+                continue
+            self._handle(match.group(1) == "/", match.group(2).lower(), base + lt, base + match.end(), data, base)
+            pos = match.end()
+        for tag in list(self._open):
+            if tag in self._streamed:
+                self._emit(tag, data, base, base + settled)
+        self._carry = data[settled:]
+        self._carry_offset = base + settled
+
+    def _handle(self, closing: bool, tag: str, tag_start: int, tag_end: int, data: str, base: int) -> None:
+        if tag not in self.tags or tag in self.values:
+            return
+        if not closing:
+            # Free text keeps the first opening tag, like a non-greedy search; constrained
+            # tags restart at each opening tag since their content cannot contain one
+            if tag not in self._open or tag in self.patterns:
+                self._open[tag] = tag_end
+                if tag in self.stream:
+                    self._streamed[tag] = tag_end
+            return
+        start = self._open.pop(tag, None)
+        if start is None:
+            return
+        if tag in self._streamed:
+            self._emit(tag, data, base, tag_start)
+            del self._streamed[tag]
+        value = self.text[start:tag_start]
+        pattern = self.patterns.get(tag)
+        if pattern is not None:
+            match = pattern.fullmatch(value)
+            if match is None:
+                return
+            value = match.group(1)
+        self.values[tag] = value
+        if self.on_tag is not None:
+            self.on_tag(tag, value)
+
+    def _emit(self, tag: str, data: str, base: int, end: int) -> None:
+        start = self._streamed[tag]
+        if end > start:
+            self._streamed[tag] = end
+            if self.on_content is not None:
+                self.on_content(tag, data[start - base:end - base])
+
+
+def scan(text: str, tags: Iterable[str], patterns: Optional[Dict[str, Pattern]] = None) -> Dict[str, str]:
+    """Scan a complete text in one pass and return the contents of the tags found."""
+    scanner = TagScanner(tags, patterns)
+    scanner.feed(text)
+    return scanner.values
@@ -0,0 +1,351 @@
+"""Process-wide rate limiting shared by every orchestrator.
+
+Each provider with provider-level limits, and every other model, gets one
+AdaptiveLimiter combining:
+
+- token buckets for requests per minute and tokens per minute,
+- AIMD concurrency control (additive increase on success, multiplicative
+  decrease when the provider reports a rate limit),
+- a shared back-off window set from Retry-After hints, so that one 429
+  pauses every caller of that model instead of each retrying on its own.
+
+Callers that cannot proceed queue inside ``acquire`` instead of failing.
+Limits can be configured per model or per provider name (see
+``scheduler.provider_for``). Models with limits of their own get their own
+limiter; the models of a provider with provider-level limits share one, since
+the provider enforces those limits across all of them.
+"""
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Set, Tuple
+import asyncio
+import logging
+import re
+import threading
+import time
+
+from .scheduler import provider_for
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 64
+DEFAULT_MIN_CONCURRENCY = 1
+# Back-off applied when a provider reports a rate limit without a Retry-After hint
+DEFAULT_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class CallCancelled(Exception):
+    """Raised by ``slot`` when the caller's cancel event is set while it waits for a slot."""
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``per_minute / 60`` tokens per second."""
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if they already are)."""
+        self._refill(now)
+        # Never ask for more than the bucket can hold, or the request would wait forever
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        # May go negative when actual usage exceeds the estimate; later callers wait it off
+        self.tokens -= amount
+
+
+class AdaptiveLimiter:
+    def __init__(self, key: str, requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 min_concurrency: int = DEFAULT_MIN_CONCURRENCY):
+        self.key = key
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency_limit = float(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.blocked_until = 0.0
+        self.backoff = DEFAULT_BACKOFF_SECONDS
+        self._cond = threading.Condition()
+        # Async waiters, woken from ``release`` on their own event loop
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        # Counters for monitoring
+        self.acquired = 0
+        self.rate_limited = 0
+        self.queued_seconds = 0.0
+
+    def _wait_time(self, tokens: float, now: float) -> Optional[float]:
+        """Seconds to wait before a call may start, or None to wait for a release."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= int(self.concurrency_limit):
+            return None
+        wait = 0.0
+        if self.requests:
+            wait = max(wait, self.requests.time_until(1, now))
+        if self.tokens and tokens:
+            wait = max(wait, self.tokens.time_until(tokens, now))
+        return wait
+
+    def _take(self, tokens: float, queued: float) -> None:
+        self.in_flight += 1
+        self.acquired += 1
+        self.queued_seconds += queued
+        if self.requests:
+            self.requests.consume(1)
+        if self.tokens and tokens:
+            self.tokens.consume(tokens)
+
+    def acquire(self, tokens: float = 0, cancel: Optional[threading.Event] = None) -> bool:
+        """Block until a call with ``tokens`` estimated tokens may start.
+
+        Returns False if ``cancel`` was set while waiting, True otherwise.
+        """
+        start = time.monotonic()
+        with self._cond:
+            self.waiting += 1
+            try:
+                while True:
+                    if cancel is not None and cancel.is_set():
+                        return False
+                    now = time.monotonic()
+                    wait = self._wait_time(tokens, now)
+                    if wait == 0:
+                        self._take(tokens, now - start)
+                        return True
+                    # Wake up periodically so cancellation is noticed
+                    self._cond.wait(timeout=min(wait, 1.0) if wait is not None else 1.0)
+            finally:
+                self.waiting -= 1
+
+    async def acquire_async(self, tokens: float = 0) -> None:
+        """Asyncio counterpart of ``acquire``; waits without blocking the event loop."""
+        start = time.monotonic()
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            self.waiting += 1
+            self._async_waiters.add(waiter)
+        try:
+            while True:
+                with self._cond:
+                    now = time.monotonic()
+                    wait = self._wait_time(tokens, now)
+                    if wait == 0:
+                        self._take(tokens, now - start)
+                        return
+                    # Cleared under the lock, so a release after this check always wakes us
+                    waiter[1].clear()
+                try:
+                    await asyncio.wait_for(waiter[1].wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._cond:
+                self.waiting -= 1
+                self._async_waiters.discard(waiter)
+
+    def _wake_async_waiters(self) -> None:
+        for loop, event in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop is closed; its task is gone with it
+                pass
+
+    def release(self, rate_limited: bool = False, retry_after: Optional[float] = None,
+                estimated_tokens: float = 0, tokens_used: Optional[float] = None) -> None:
+        """Finish a call started with ``acquire`` and adapt the limits to its outcome."""
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            now = time.monotonic()
+            if rate_limited:
+                self.rate_limited += 1
+                self.concurrency_limit = max(float(self.min_concurrency), self.concurrency_limit / 2)
+                if retry_after is None:
+                    retry_after = self.backoff
+                    self.backoff = min(self.backoff * 2, MAX_BACKOFF_SECONDS)
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+                logger.warning(f"Rate limited on {self.key}: concurrency limit now {int(self.concurrency_limit)}, "
+                               f"pausing for {retry_after:.1f}s")
+            else:
+                self.backoff = DEFAULT_BACKOFF_SECONDS
+                # Additive increase: roughly +1 per window of concurrency_limit successes
+                self.concurrency_limit = min(float(self.max_concurrency),
+                                             self.concurrency_limit + 1.0 / self.concurrency_limit)
+                if self.tokens and tokens_used is not None and tokens_used > estimated_tokens:
+                    self.tokens.consume(tokens_used - estimated_tokens)
+            self._cond.notify_all()
+            self._wake_async_waiters()
+
+    @contextmanager
+    def slot(self, tokens: float = 0, cancel: Optional[threading.Event] = None) -> Iterator["LimitedCall"]:
+        """Hold a limiter slot for the duration of one call.
+
+        The slot is released as rate limited if the call raises a rate-limit
+        error; set ``tokens_used`` on the yielded object to correct the token
+        bucket with the provider-reported usage. Raises ``CallCancelled`` if
+        ``cancel`` is set before a slot is free.
+        """
+        if not self.acquire(tokens, cancel):
+            raise CallCancelled(f"Call to {self.key} cancelled while waiting for a rate limit slot")
+        call = LimitedCall()
+        try:
+            yield call
+        except BaseException as e:
+            self._release_for_error(e)
+            raise
+        self.release(estimated_tokens=tokens, tokens_used=call.tokens_used)
+
+    @asynccontextmanager
+    async def slot_async(self, tokens: float = 0) -> AsyncIterator["LimitedCall"]:
+        """Asyncio counterpart of ``slot``; a cancelled task stops waiting at once, so it needs no cancel event."""
+        await self.acquire_async(tokens)
+        call = LimitedCall()
+        try:
+            yield call
+        except BaseException as e:
+            self._release_for_error(e)
+            raise
+        self.release(estimated_tokens=tokens, tokens_used=call.tokens_used)
+
+    def _release_for_error(self, error: BaseException) -> None:
+        if isinstance(error, Exception) and is_rate_limit_error(error):
+            self.release(rate_limited=True, retry_after=retry_after_from_error(error))
+        else:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            now = time.monotonic()
+            return {
+                "concurrency_limit": int(self.concurrency_limit),
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "acquired": self.acquired,
+                "rate_limited": self.rate_limited,
+                "queued_seconds": round(self.queued_seconds, 3),
+                "blocked_for": round(max(0.0, self.blocked_until - now), 3),
+                "requests_available": round(self.requests.tokens, 1) if self.requests else None,
+                "tokens_available": round(self.tokens.tokens, 1) if self.tokens else None,
+            }
+
+
+class LimitedCall:
+    """Handle yielded by ``AdaptiveLimiter.slot``."""
+
+    def __init__(self):
+        self.tokens_used: Optional[float] = None
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_limits: Dict[str, Dict[str, Any]] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_limits(key: str, requests_per_minute: Optional[float] = None,
+                     tokens_per_minute: Optional[float] = None,
+                     max_concurrency: Optional[int] = None) -> None:
+    """Set limits for a model id or provider name.
+
+    Limiters already created for affected models or providers are rebuilt on next use.
+    """
+    limits = {
+        "requests_per_minute": requests_per_minute,
+        "tokens_per_minute": tokens_per_minute,
+        "max_concurrency": max_concurrency,
+    }
+    limits = {k: v for k, v in limits.items() if v is not None}
+    with _registry_lock:
+        if _limits.get(key) == limits:
+            return
+        _limits[key] = limits
+        for existing in list(_limiters):
+            if existing == key or provider_for(existing) == key:
+                del _limiters[existing]
+
+
+def _limiter_key(model: str) -> str:
+    if model in _limits:
+        return model
+    provider = provider_for(model)
+    return provider if provider and provider in _limits else model
+
+
+def limiter_key(model: str) -> str:
+    """Key of the limiter ``model`` shares: its provider's name when limits are set for the provider, else the model id."""
+    with _registry_lock:
+        return _limiter_key(model)
+
+
+def get_limiter(model: str) -> AdaptiveLimiter:
+    """Return the shared limiter for a model, creating it on first use."""
+    with _registry_lock:
+        key = _limiter_key(model)
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveLimiter(key, **_limits.get(key, {}))
+            _limiters[key] = limiter
+        return limiter
+
+
+def limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every limiter in this process, keyed by provider name or model id."""
+    with _registry_lock:
+        limiters = dict(_limiters)
+    return {model: limiter.stats() for model, limiter in limiters.items()}
+
+
+def reset_limiters() -> None:
+    """Forget all limiter state and configuration (mainly for tests)."""
+    with _registry_lock:
+        _limiters.clear()
+        _limits.clear()
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Return True if an exception raised by a model looks like a rate-limit error."""
+    if "ratelimit" in type(error).__name__.lower():
+        return True
+    if getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error)
+    return "RateLimitError" in message or "rate limit" in message.lower() or bool(_STATUS_429_PATTERN.search(message))
+
+
+_STATUS_429_PATTERN = re.compile(r"\b(?:error|status)(?: code)?:? 429\b", re.IGNORECASE)
+
+
+_RETRY_AFTER_PATTERN = re.compile(r"(?:retry after|try again in)\s*(\d+(?:\.\d+)?)\s*(ms|s|seconds?)?", re.IGNORECASE)
+
+
+def retry_after_from_error(error: Exception) -> Optional[float]:
+    """Extract a Retry-After hint (in seconds) from a provider error, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except (TypeError, ValueError):
+            pass
+    match = _RETRY_AFTER_PATTERN.search(str(error))
+    if match:
+        value = float(match.group(1))
+        return value / 1000 if (match.group(2) or "").lower() == "ms" else value
+    return None
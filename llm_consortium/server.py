@@ -0,0 +1,262 @@
+"""OpenAI-compatible HTTP server for saved consortiums.
+
+``create_app`` builds a FastAPI application that exposes each saved consortium
+as a model through ``/v1/models`` and ``/v1/chat/completions``. Runs use
+``AsyncConsortiumOrchestrator`` on the server's event loop, so a multi-iteration
+run holds no thread while it waits on members or the arbiter. Orchestrators,
+rate limiters, response caches and pooled model clients are process-wide and
+therefore shared by every request. With ``"stream": true`` the final synthesis
+is sent as server-sent events while the arbiter writes it. ``/metrics`` reports
+request counters and the shared components' statistics in the Prometheus text
+format.
+
+Requires the optional ``fastapi`` dependency (``pip install 'llm-consortium[serve]'``).
+"""
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import secrets
+import threading
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from . import (AsyncConsortiumOrchestrator, ConsortiumConfig, _get_consortium_configs, coalescing_stats,
+               TRUNCATED_STREAM_NOTICE, final_output_text, limiter_stats, log_writer_stats, model_pool_stats,
+               orchestrator_cache_stats, stream_truncated)
+from .orchestrator_cache import get_orchestrator_cache
+from .scheduler import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class ServerMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self.seconds: Dict[str, Tuple[float, int]] = {}
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, model: str, status: str, elapsed: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.requests[(model, status)] = self.requests.get((model, status), 0) + 1
+            total, count = self.seconds.get(model, (0.0, 0))
+            self.seconds[model] = (total + elapsed, count + 1)
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            yield "consortium_requests_in_flight", {}, self.in_flight
+            for (model, status), count in sorted(self.requests.items()):
+                yield "consortium_requests_total", {"model": model, "status": status}, count
+            for model, (total, count) in sorted(self.seconds.items()):
+                yield "consortium_request_seconds_sum", {"model": model}, total
+                yield "consortium_request_seconds_count", {"model": model}, count
+
+
+def _numeric_samples(prefix: str, stats: Dict[str, Any],
+                     labels: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, Dict[str, str], float]]:
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        yield f"{prefix}_{key}", labels or {}, value
+
+
+def _component_samples() -> Iterator[Tuple[str, Dict[str, str], float]]:
+    for model, stats in limiter_stats().items():
+        yield from _numeric_samples("consortium_limiter", stats, {"model": model})
+    yield from _numeric_samples("consortium_orchestrator_cache", orchestrator_cache_stats())
+    yield from _numeric_samples("consortium_coalescing", coalescing_stats())
+    for group, stats in model_pool_stats().items():
+        yield from _numeric_samples(f"consortium_model_pool_{group}", stats)
+    for path, stats in log_writer_stats().items():
+        yield from _numeric_samples("consortium_log_writer", stats, {"path": path})
+
+
+def _label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(samples: Iterable[Tuple[str, Dict[str, str], float]]) -> str:
+    lines = []
+    for name, labels, value in samples:
+        label_text = ",".join(f'{key}="{_label_value(val)}"' for key, val in labels.items())
+        lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def _content_text(content: Any) -> str:
+    """The text of a message's content, which may be a string or a list of content parts."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return ""
+
+
+def split_messages(messages: List[Dict[str, Any]]) -> Tuple[str, str, Optional[str]]:
+    """Split chat messages into (prompt, conversation history, system prompt).
+
+    The last user message is the prompt; earlier turns are formatted the same
+    way ConsortiumModel formats an llm conversation.
+    """
+    system_parts = [_content_text(m.get("content")) for m in messages if m.get("role") in ("system", "developer")]
+    turns = [m for m in messages if m.get("role") in ("user", "assistant")]
+    if not turns or turns[-1].get("role") != "user":
+        raise ValueError("The last message must come from the user")
+    history = [f"{'Human' if m['role'] == 'user' else 'Assistant'}: {_content_text(m.get('content'))}"
+               for m in turns[:-1]]
+    return _content_text(turns[-1].get("content")), "\n\n".join(history), "\n\n".join(system_parts) or None
+
+
+def _error(status: int, message: str, error_type: str = "invalid_request_error",
+           code: Optional[str] = None) -> JSONResponse:
+    return JSONResponse({"error": {"message": message, "type": error_type, "code": code}}, status_code=status)
+
+
+def _sse(data: Any) -> str:
+    return f"data: {json.dumps(data)}\n\n"
+
+
+def create_app(configs: Optional[Callable[[], Dict[str, ConsortiumConfig]]] = None) -> FastAPI:
+    """Build the server application.
+
+    ``configs`` returns the consortiums to serve by name; by default the saved
+    consortiums are read on each request, so newly saved ones appear without a restart.
+    It is called in a worker thread, since reading them touches the disk.
+    """
+    load_configs = configs or _get_consortium_configs
+    metrics = ServerMetrics()
+    app = FastAPI(title="LLM Consortium")
+    app.state.metrics = metrics
+
+    def orchestrator_for(config: ConsortiumConfig, system: Optional[str]) -> AsyncConsortiumOrchestrator:
+        if system:
+            config = config.model_copy(update={"system_prompt": system})
+        # Keyed apart from the sync orchestrators ConsortiumModel caches for the same config
+        key = dict(config.to_dict(), orchestrator="async")
+        return get_orchestrator_cache().get(key, lambda: AsyncConsortiumOrchestrator(config))
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": name, "object": "model", "created": 0, "owned_by": "llm-consortium"}
+                                           for name in await asyncio.to_thread(load_configs)]}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/metrics")
+    async def metrics_endpoint():
+        samples = [*metrics.samples(), *_component_samples()]
+        return PlainTextResponse(render_metrics(samples), media_type="text/plain; version=0.0.4")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        try:
+            body = await request.json()
+        except json.JSONDecodeError:
+            return _error(400, "Request body is not valid JSON")
+        model = body.get("model")
+        config = (await asyncio.to_thread(load_configs)).get(model)
+        if config is None:
+            return _error(404, f"The model '{model}' does not exist", code="model_not_found")
+        try:
+            prompt, history, system = split_messages(body.get("messages") or [])
+        except ValueError as e:
+            return _error(400, str(e))
+
+        orchestrator = orchestrator_for(config, system)
+        completion_id = f"chatcmpl-{secrets.token_hex(12)}"
+        created = int(time.time())
+        if body.get("stream"):
+            return StreamingResponse(
+                _stream_completion(orchestrator, prompt, history, model, completion_id, created, metrics),
+                media_type="text/event-stream",
+            )
+
+        metrics.started()
+        start = time.monotonic()
+        try:
+            result = await orchestrator.orchestrate(prompt, conversation_history=history,
+                                                    consortium_id=completion_id)
+        except Exception as e:
+            logger.exception(f"Consortium run for {model} failed")
+            metrics.finished(model, "error", time.monotonic() - start)
+            return _error(500, f"Consortium run failed: {e}", error_type="server_error")
+        metrics.finished(model, "ok", time.monotonic() - start)
+        text = final_output_text(result)
+        prompt_tokens = estimate_tokens(prompt + history)
+        completion_tokens = estimate_tokens(text)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+            "consortium": result.get("metadata", {}),
+        }
+
+    return app
+
+
+async def _stream_completion(orchestrator: AsyncConsortiumOrchestrator, prompt: str, history: str, model: str,
+                             completion_id: str, created: int, metrics: ServerMetrics):
+    def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+        return _sse({"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]})
+
+    chunks: asyncio.Queue = asyncio.Queue()
+    metrics.started()
+    start = time.monotonic()
+    task = asyncio.ensure_future(orchestrator.orchestrate(prompt, conversation_history=history,
+                                                          consortium_id=completion_id,
+                                                          on_synthesis_chunk=chunks.put_nowait))
+    task.add_done_callback(lambda _: chunks.put_nowait(None))
+    status = "error"
+    try:
+        yield chunk({"role": "assistant", "content": ""})
+        streamed = False
+        while True:
+            text = await chunks.get()
+            if text is None:
+                break
+            streamed = True
+            yield chunk({"content": text})
+        try:
+            result = task.result()
+        except Exception as e:
+            logger.exception(f"Consortium run for {model} failed")
+            yield _sse({"error": {"message": f"Consortium run failed: {e}", "type": "server_error", "code": None}})
+        else:
+            finish_reason = "stop"
+            if not streamed:
+                # The run stopped before its last permitted iteration, so nothing was streamed
+                yield chunk({"content": final_output_text(result)})
+            elif stream_truncated(result):
+                # The arbiter timed out mid-synthesis: follow the partial text with the fallback answer
+                yield chunk({"content": TRUNCATED_STREAM_NOTICE + final_output_text(result)})
+                finish_reason = "length"
+            yield chunk({}, finish_reason)
+            status = "ok"
+        yield "data: [DONE]\n\n"
+    finally:
+        if not task.done():
+            # The client went away: stop the run rather than finishing it for nobody
+            task.cancel()
+            status = "cancelled"
+        metrics.finished(model, status, time.monotonic() - start)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, **uvicorn_options) -> None:
+    import uvicorn
+
+    uvicorn.run(create_app(), host=host, port=port, **uvicorn_options)
@@ -0,0 +1,158 @@
+"""Coalescing of identical consortium runs that are in flight at the same time.
+
+The first caller for a key runs the work; callers arriving with the same key
+while it is still running wait for it and receive a copy of its result (or its
+exception) instead of starting their own run. Synthesis chunks streamed by the
+running call are forwarded to every waiting caller that asked for them,
+starting with the chunks sent before it joined. A key is forgotten as soon as
+its run finishes, so nothing is cached beyond the lifetime of a run.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def flight_key(config_key: str, prompt: str, conversation_history: str) -> str:
+    payload = json.dumps([config_key, prompt, conversation_history])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Flight:
+    """One in-flight run and the callers attached to it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.chunks: List[str] = []
+        self.listeners: List[Callable[[str], None]] = []
+        self.followers = 0
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Only used by async flights: the task running the work and the callers awaiting it
+        self.task: Optional["asyncio.Task"] = None
+        self.waiting = 0
+
+    def publish(self, chunk: str) -> None:
+        with self._lock:
+            self.chunks.append(chunk)
+            listeners = list(self.listeners)
+        for listener in listeners:
+            listener(chunk)
+
+    def listen(self, listener: Optional[Callable[[str], None]]) -> None:
+        if listener is None:
+            return
+        with self._lock:
+            # Replay what was streamed before this caller joined
+            for chunk in self.chunks:
+                listener(chunk)
+            self.listeners.append(listener)
+
+
+class SingleFlight:
+    def __init__(self):
+        self._flights: Dict[Any, Flight] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+        self.saved_calls = 0
+
+    def _join(self, key: Any) -> Tuple[Flight, bool]:
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.followers += 1
+                self.coalesced += 1
+                return flight, False
+            flight = self._flights[key] = Flight()
+            self.leaders += 1
+            return flight, True
+
+    def _land(self, key: Any, flight: Flight, calls: int) -> None:
+        with self._lock:
+            del self._flights[key]
+            self.saved_calls += calls * flight.followers
+        if flight.followers:
+            logger.debug(f"Run {key} served {flight.followers} coalesced caller(s)")
+
+    def _follow(self, flight: Flight) -> Any:
+        if flight.error is not None:
+            raise flight.error
+        return copy.deepcopy(flight.result)
+
+    def do(self, key: Any, fn: Callable[[Callable[[str], None]], Any],
+           on_chunk: Optional[Callable[[str], None]] = None,
+           calls: Callable[[Any], int] = lambda result: 0) -> Tuple[Any, bool]:
+        """Run ``fn(publish)`` once per concurrent ``key`` and return ``(result, coalesced)``.
+
+        ``fn`` receives a callback for its synthesis chunks, which are passed on
+        to ``on_chunk`` of every caller. ``calls`` reports how many upstream
+        calls a result took, so the calls followers did not make can be counted.
+        """
+        flight, leader = self._join(key)
+        if not leader:
+            flight.listen(on_chunk)
+            flight.done.wait()
+            return self._follow(flight), True
+        flight.listen(on_chunk)
+        try:
+            flight.result = fn(flight.publish)
+            # The leader's caller gets a copy too, so changing it cannot race with followers copying the result
+            result = copy.deepcopy(flight.result)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._land(key, flight, calls(flight.result) if flight.error is None else 0)
+            flight.done.set()
+        return result, False
+
+    async def do_async(self, key: Any, fn: Callable[[Callable[[str], None]], Awaitable[Any]],
+                       on_chunk: Optional[Callable[[str], None]] = None,
+                       calls: Callable[[Any], int] = lambda result: 0) -> Tuple[Any, bool]:
+        """The asyncio counterpart of ``do``; runs are only shared within one event loop.
+
+        The run is a task of its own, so a caller that is cancelled only stops
+        it when no other caller is still waiting for it.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        flight, leader = self._join(key)
+        if leader:
+            flight.task = loop.create_task(fn(flight.publish))
+            flight.task.add_done_callback(lambda task: self._land(
+                key, flight, calls(task.result()) if not task.cancelled() and task.exception() is None else 0))
+        flight.listen(on_chunk)
+        flight.waiting += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiting -= 1
+            if not flight.waiting and not flight.task.done():
+                flight.task.cancel()
+            raise
+        flight.waiting -= 1
+        return copy.deepcopy(result), not leader
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"in_flight": len(self._flights), "leaders": self.leaders, "coalesced": self.coalesced,
+                    "saved_calls": self.saved_calls}
+
+
+_singleflight = SingleFlight()
+
+
+def get_singleflight() -> SingleFlight:
+    return _singleflight
+
+
+def coalescing_stats() -> Dict[str, int]:
+    """Process-wide counts of coalesced runs and the upstream model calls they saved."""
+    return _singleflight.stats()
@@ -2,9 +2,11 @@
 from .base import ConsortiumStrategy
 from .default import DefaultStrategy
 from .factory import create_strategy
+from .round_robin import RoundRobinStrategy
+from .bandit import BanditStrategy
+from .elimination import EliminationStrategy
 
 # Import specific strategy classes here when implemented
-# from .round_robin import RoundRobinStrategy
 # from .counterfactual_regret import CounterfactualRegretStrategy
 # from .deep_bloom import DeepBloomStrategy
 
@@ -12,8 +14,10 @@ __all__ = [
     "ConsortiumStrategy",
     "DefaultStrategy",
     "create_strategy",
+    "RoundRobinStrategy",
+    "BanditStrategy",
+    "EliminationStrategy",
     # Add other strategy class names to __all__ when implemented
-    # "RoundRobinStrategy",
     # "CounterfactualRegretStrategy",
     # "DeepBloomStrategy",
 ]
@@ -0,0 +1,200 @@
+from .base import ConsortiumStrategy
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
+import logging
+import pathlib
+import random
+import re
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__) # Use specific logger
+
+if TYPE_CHECKING:
+    from llm_consortium import IterationContext
+
+DEFAULT_MODELS_PER_RUN = 3
+
+# Keywords that place a prompt in a category; a prompt matching none is "general"
+DEFAULT_CATEGORIES: Dict[str, List[str]] = {
+    "code": ["code", "function", "python", "javascript", "sql", "bug", "stack trace", "compile", "regex", "```"],
+    "math": ["calculate", "equation", "solve", "integral", "derivative", "probability", "proof", "theorem"],
+    "writing": ["write", "essay", "story", "poem", "rewrite", "summarize", "summarise", "email", "tone"],
+}
+
+
+def prompt_category(prompt: str, categories: Optional[Dict[str, List[str]]] = None) -> str:
+    """The category whose keywords occur most often in ``prompt``, or "general"."""
+    # Only look at the user's words, not the system prompt or history wrapped around them
+    text = prompt.rsplit("Human:", 1)[-1].lower()
+    best, best_hits = "general", 0
+    for name, keywords in (categories or DEFAULT_CATEGORIES).items():
+        hits = sum(text.count(keyword.lower()) for keyword in keywords)
+        if hits > best_hits:
+            best, best_hits = name, hits
+    return best
+
+
+def words(text: str) -> set:
+    return set(re.findall(r"\w+", text.lower()))
+
+
+def word_overlap(response: Dict[str, Any], synthesis_words: set) -> float:
+    """Fraction of the synthesis' words a response contains, a cheap measure of how much of it the arbiter kept."""
+    if not synthesis_words:
+        return 0.0
+    return len(synthesis_words & words(response.get("response", ""))) / len(synthesis_words)
+
+
+def iteration_rewards(iteration_context: 'IterationContext') -> Dict[str, float]:
+    """Score each member of an iteration between 0 and 1 by how much the arbiter used its answers.
+
+    Pick-one rewards the chosen response, rank rewards by position, and the default
+    method credits each successful member with its ``word_overlap`` with the
+    synthesis, scaled by the synthesis confidence. Failed calls score 0. A
+    model's instances are averaged.
+    """
+    synthesis = iteration_context.synthesis
+    ranking = synthesis.get("ranking") or ([synthesis["chosen_id"]] if "chosen_id" in synthesis else None)
+    confidence = min(max(float(synthesis.get("confidence") or 0.0), 0.0), 1.0)
+    synthesis_words = words(synthesis.get("synthesis", "")) if ranking is None else set()
+    scores: Dict[str, List[float]] = {}
+    for response in iteration_context.model_responses:
+        if "error" in response:
+            score = 0.0
+        elif ranking is None:
+            score = confidence * word_overlap(response, synthesis_words)
+        elif response.get("id") in ranking:
+            position = ranking.index(response["id"])
+            score = 1.0 - position / max(len(ranking) - 1, 1) if len(ranking) > 1 else 1.0
+        else:
+            score = 0.0
+        scores.setdefault(response["model"], []).append(score)
+    return {model: sum(values) / len(values) for model, values in scores.items()}
+
+
+class BanditStore:
+    """Beta posteriors of each model's reward per prompt category, kept in SQLite.
+
+    Updates are single statements, so several processes can share one file.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS arms (
+                category TEXT NOT NULL,
+                model TEXT NOT NULL,
+                alpha REAL NOT NULL,
+                beta REAL NOT NULL,
+                pulls INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (category, model)
+            )
+        """)
+
+    def arms(self, category: str) -> Dict[str, Tuple[float, float]]:
+        """``(alpha, beta)`` of every model seen in ``category``; unseen models have the uniform prior (1, 1)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT model, alpha, beta FROM arms WHERE category = ?", (category,))
+            return {model: (alpha, beta) for model, alpha, beta in rows}
+
+    def update(self, category: str, rewards: Dict[str, float]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO arms (category, model, alpha, beta, pulls, updated_at) VALUES (?, ?, 1 + ?, 2 - ?, 1, ?) "
+                "ON CONFLICT (category, model) DO UPDATE SET alpha = alpha + excluded.alpha - 1, "
+                "beta = beta + excluded.beta - 1, pulls = pulls + 1, updated_at = excluded.updated_at",
+                [(category, model, reward, reward, now) for model, reward in rewards.items()],
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM arms")
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Pulls and mean reward of every arm, by category and model."""
+        with self._lock:
+            rows = self._conn.execute("SELECT category, model, alpha, beta, pulls FROM arms ORDER BY category, model")
+            stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for category, model, alpha, beta, pulls in rows:
+                stats.setdefault(category, {})[model] = {"pulls": pulls, "mean_reward": alpha / (alpha + beta)}
+        return stats
+
+
+_stores: Dict[str, BanditStore] = {}
+_registry_lock = threading.Lock()
+
+
+def get_bandit_store(path: pathlib.Path) -> BanditStore:
+    """Return the process-wide store at ``path``, opening it on first use."""
+    with _registry_lock:
+        store = _stores.get(str(path))
+        if store is None:
+            store = _stores[str(path)] = BanditStore(path)
+        return store
+
+
+class BanditStrategy(ConsortiumStrategy):
+    """
+    Learns which models contribute to good syntheses and queries only the most promising ones:
+    - Prompts are grouped into categories by keyword (`categories` param, name -> keywords).
+    - Each run draws a sample from every model's Beta posterior for the prompt's category
+      (Thompson sampling) and queries the `models_per_run` best (default 3) on every iteration.
+    - After each iteration the members are rewarded by how the arbiter used their answers
+      (see `iteration_rewards`); the posteriors persist in SQLite (`path` param, default
+      consortium_bandit.db in the llm user directory), shared by every process.
+    """
+
+    def _validate_params(self):
+        size = self.params.get("models_per_run", DEFAULT_MODELS_PER_RUN)
+        if isinstance(size, bool) or not isinstance(size, int) or size < 1:
+            raise ValueError(f"models_per_run must be a positive integer, got {size!r}")
+        categories = self.params.get("categories")
+        if categories is not None and not (
+                isinstance(categories, dict) and all(isinstance(words, list) for words in categories.values())):
+            raise ValueError("categories must map each category name to a list of keywords")
+
+    def _store(self) -> BanditStore:
+        path = self.params.get("path")
+        if path is None:
+            from llm_consortium import user_dir
+            path = user_dir() / "consortium_bandit.db"
+        return get_bandit_store(pathlib.Path(path))
+
+    def select_models(self, available_models: Dict[str, int], current_prompt: str, iteration: int) -> Dict[str, int]:
+        """Samples every model's posterior on the first iteration and keeps the winners for the whole run.
+
+        Models that become available later in the run (a cascade tier being reached) are
+        sampled then, and the best `models_per_run` of them join the selection.
+        """
+        if "selected" not in self.iteration_state:
+            category = prompt_category(current_prompt, self.params.get("categories"))
+            self.iteration_state.update(category=category, selected=[], seen=[])
+        new_models = [model for model in available_models if model not in self.iteration_state["seen"]]
+        if new_models:
+            category = self.iteration_state["category"]
+            arms = self._store().arms(category)
+            rng = random.Random(self.params.get("seed"))
+            samples = {model: rng.betavariate(*arms.get(model, (1.0, 1.0))) for model in new_models}
+            size = self.params.get("models_per_run", DEFAULT_MODELS_PER_RUN)
+            selected = sorted(samples, key=samples.get, reverse=True)[:size]
+            logger.debug(f"[BanditStrategy] Category '{category}', samples {samples}, selected {selected}")
+            self.iteration_state["selected"].extend(selected)
+            self.iteration_state["seen"].extend(new_models)
+        return {model: available_models[model] for model in self.iteration_state["selected"]
+                if model in available_models}
+
+    def process_responses(self, successful_responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Returns the list of successful responses unmodified."""
+        return successful_responses
+
+    def update_state(self, iteration_context: 'IterationContext'):
+        """Rewards this iteration's members in the persisted posteriors."""
+        rewards = iteration_rewards(iteration_context)
+        if rewards:
+            self._store().update(self.iteration_state.get("category", "general"), rewards)
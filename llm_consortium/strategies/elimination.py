@@ -0,0 +1,79 @@
+from .base import ConsortiumStrategy
+from .bandit import iteration_rewards, word_overlap, words
+from typing import List, Dict, Any, TYPE_CHECKING
+import logging
+
+logger = logging.getLogger(__name__) # Use specific logger
+
+if TYPE_CHECKING:
+    from llm_consortium import IterationContext
+
+DEFAULT_KEEP = 2
+
+
+def member_scores(iteration_context: 'IterationContext') -> Dict[str, float]:
+    """Score each model of an iteration between 0 and 1 by its share in the arbiter's verdict.
+
+    A pick-one choice or ranking is used when the arbiter gave one. Otherwise a
+    response scores its ``word_overlap`` with the synthesis. Failed calls score
+    0 and a model's instances are averaged.
+    """
+    synthesis = iteration_context.synthesis
+    if synthesis.get("ranking") or "chosen_id" in synthesis:
+        return iteration_rewards(iteration_context)
+    synthesis_words = words(synthesis.get("synthesis", ""))
+    scores: Dict[str, List[float]] = {}
+    for response in iteration_context.model_responses:
+        score = 0.0 if "error" in response else word_overlap(response, synthesis_words)
+        scores.setdefault(response["model"], []).append(score)
+    return {model: sum(values) / len(values) for model, values in scores.items()}
+
+
+class EliminationStrategy(ConsortiumStrategy):
+    """
+    Queries every model on the first iteration, then only the ones the arbiter relied on:
+    - After each iteration the models are scored by `member_scores`.
+    - Later iterations query the `keep` best-scoring models (default 2), each with its
+      configured instance count.
+    - Performs no processing or filtering on the responses before synthesis.
+    """
+
+    def _validate_params(self):
+        keep = self.params.get("keep", DEFAULT_KEEP)
+        if isinstance(keep, bool) or not isinstance(keep, int) or keep < 1:
+            raise ValueError(f"keep must be a positive integer, got {keep!r}")
+
+    def select_models(self, available_models: Dict[str, int], current_prompt: str, iteration: int) -> Dict[str, int]:
+        """Selects every model until a round has been scored, then the survivors.
+
+        Models that became available since the last round (a cascade tier being reached)
+        have not been scored yet and are selected alongside the survivors.
+        """
+        kept = self.iteration_state.get("kept")
+        seen = self.iteration_state.setdefault("seen", [])
+        new_models = [model for model in available_models if model not in seen]
+        seen.extend(new_models)
+        if kept is None:
+            return available_models.copy()
+        kept.extend(model for model in new_models if model not in kept)
+        return {model: available_models[model] for model in kept if model in available_models}
+
+    def process_responses(self, successful_responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Returns the list of successful responses unmodified."""
+        return successful_responses
+
+    def update_state(self, iteration_context: 'IterationContext'):
+        """Keeps the `keep` models whose answers scored best in this iteration."""
+        scores = member_scores(iteration_context)
+        if not scores:
+            return
+        # Stable sort: ties keep the consortium's model order
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        kept = ranked[:self.params.get("keep", DEFAULT_KEEP)]
+        eliminated = [model for model in ranked if model not in kept]
+        self.iteration_state["kept"] = kept
+        self.iteration_state.setdefault("scores", []).append(
+            {"iteration": iteration_context.iteration, "scores": scores, "eliminated": eliminated})
+        if eliminated:
+            logger.info(f"[EliminationStrategy Iteration {iteration_context.iteration}] Keeping {kept}, "
+                        f"eliminated {eliminated}")
@@ -1,7 +1,9 @@
 from .base import ConsortiumStrategy
 from .default import DefaultStrategy
+from .round_robin import RoundRobinStrategy
+from .bandit import BanditStrategy
+from .elimination import EliminationStrategy
 # Import other specific strategy classes here when they are implemented
-# e.g., from .round_robin import RoundRobinStrategy
 # e.g., from .counterfactual_regret import CounterfactualRegretStrategy
 # e.g., from .deep_bloom import DeepBloomStrategy
 from typing import Dict, Any, Optional, Type, TYPE_CHECKING
@@ -18,8 +20,10 @@ if TYPE_CHECKING:
 # Allows dynamic registration or discovery if needed later.
 _strategy_registry: Dict[str, Type[ConsortiumStrategy]] = {
     "default": DefaultStrategy,
+    "round_robin": RoundRobinStrategy,
+    "bandit": BanditStrategy,
+    "elimination": EliminationStrategy,
     # Add other built-in strategies here:
-    # "round_robin": RoundRobinStrategy,
     # "counterfactual_regret": CounterfactualRegretStrategy,
     # "deep_bloom": DeepBloomStrategy,
 }
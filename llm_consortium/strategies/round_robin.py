@@ -0,0 +1,56 @@
+from .base import ConsortiumStrategy
+from collections import OrderedDict
+from typing import List, Dict, Any
+import logging
+import threading
+
+logger = logging.getLogger(__name__) # Use specific logger
+
+# Where the next run of each consortium starts its rotation, keyed by the orchestrator's config key.
+# Kept per process so that single-iteration runs still spread over every model; only the
+# most recently used consortiums are remembered, as configs built per prompt would otherwise pile up.
+MAX_ROTATIONS = 256
+_next_start: "OrderedDict[str, int]" = OrderedDict()
+_next_start_lock = threading.Lock()
+
+
+class RoundRobinStrategy(ConsortiumStrategy):
+    """
+    Queries only some of the configured models on each iteration, taking turns:
+    - Each iteration selects the next `models_per_iteration` models (default 1),
+      each with its configured instance count.
+    - Each run starts where the previous run of the same consortium left off.
+    - Performs no processing or filtering on the responses before synthesis.
+    """
+
+    def _validate_params(self):
+        size = self.params.get("models_per_iteration", 1)
+        if isinstance(size, bool) or not isinstance(size, int) or size < 1:
+            raise ValueError(f"models_per_iteration must be a positive integer, got {size!r}")
+
+    def initialize_state(self):
+        super().initialize_state()
+        key = getattr(self.orchestrator, "config_key", "")
+        with _next_start_lock:
+            self.iteration_state["start"] = _next_start.get(key, 0)
+            # Reserve a turn per iteration the run may take, so concurrent runs do not start on the same model
+            turns = max(getattr(self.orchestrator, "max_iterations", 1), 1)
+            _next_start[key] = self.iteration_state["start"] + turns * self.params.get("models_per_iteration", 1)
+            _next_start.move_to_end(key)
+            while len(_next_start) > MAX_ROTATIONS:
+                _next_start.popitem(last=False)
+
+    def select_models(self, available_models: Dict[str, int], current_prompt: str, iteration: int) -> Dict[str, int]:
+        """Selects the next models in the rotation."""
+        names = list(available_models)
+        if not names:
+            return {}
+        size = min(self.params.get("models_per_iteration", 1), len(names))
+        first = self.iteration_state.get("start", 0) + (iteration - 1) * size
+        selected = [names[(first + offset) % len(names)] for offset in range(size)]
+        logger.debug(f"[RoundRobinStrategy Iteration {iteration}] Selecting {selected}")
+        return {name: available_models[name] for name in selected}
+
+    def process_responses(self, successful_responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Returns the list of successful responses unmodified."""
+        return successful_responses
@@ -0,0 +1,45 @@
+"""Incremental forwarding of the arbiter's synthesis while it is being generated.
+
+The arbiter answers in a tagged format where ``<synthesis>`` comes before
+``<confidence>``, so the decision to stream has to be made before the call:
+only an arbiter pass that is known to be the last one (the final permitted
+iteration) is streamed. The remaining tags are picked up by the same scan and
+parsed once the full text is available.
+"""
+from typing import Callable
+
+from .parsing import ARBITER_PATTERNS, ARBITER_TAGS, TagScanner
+
+
+class SynthesisStreamer:
+    """Feed arbiter chunks in; the text of the first ``<synthesis>`` tag comes out.
+
+    The emitted text matches what ``_parse_arbiter_response`` extracts: leading
+    and trailing whitespace inside the tag are dropped. ``scanner`` holds every
+    arbiter tag seen so far, so the full response does not need a second scan.
+    """
+
+    def __init__(self, emit: Callable[[str], None]):
+        self.emit = emit
+        self.emitted = False
+        self._whitespace = ""
+        self.scanner = TagScanner(ARBITER_TAGS, ARBITER_PATTERNS, stream=("synthesis",),
+                                  on_content=lambda tag, text: self._write(text))
+
+    @property
+    def done(self) -> bool:
+        return "synthesis" in self.scanner.values
+
+    def feed(self, chunk: str) -> None:
+        self.scanner.feed(chunk)
+
+    def _write(self, text: str) -> None:
+        if not self.emitted:
+            text = text.lstrip()
+        text = self._whitespace + text
+        stripped = text.rstrip()
+        # Trailing whitespace is only sent once more text follows it
+        self._whitespace = text[len(stripped):]
+        if stripped:
+            self.emit(stripped)
+            self.emitted = True
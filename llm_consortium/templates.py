@@ -0,0 +1,167 @@
+"""Registry of the prompt templates used by the orchestrator.
+
+Each template is read and parsed once into literal text and placeholder
+segments, and its placeholders are checked against the values the orchestrator
+supplies, so a typo fails at load instead of on the first request. A template
+is re-read only when its file's modification time changes. Directories
+registered with ``register_template_dir`` are searched before the bundled
+templates, so a user can override any of them by file name.
+"""
+from string import Formatter
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+import logging
+import os
+import pathlib
+import threading
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = pathlib.Path(__file__).parent
+
+
+class TemplateSpec(NamedTuple):
+    filename: str
+    allowed: FrozenSet[str]
+    required: FrozenSet[str] = frozenset()
+
+
+_JUDGE_FIELDS = frozenset({"original_prompt", "formatted_responses", "formatted_history", "user_instructions"})
+
+TEMPLATE_SPECS: Dict[str, TemplateSpec] = {
+    "arbiter": TemplateSpec("arbiter_prompt.xml", _JUDGE_FIELDS, frozenset({"formatted_responses"})),
+    "pick_one": TemplateSpec("pick_one_prompt.xml", _JUDGE_FIELDS, frozenset({"formatted_responses"})),
+    "rank": TemplateSpec("rank_prompt.xml", _JUDGE_FIELDS, frozenset({"formatted_responses"})),
+    "iteration": TemplateSpec(
+        "iteration_prompt.txt",
+        frozenset({"original_prompt", "previous_synthesis", "user_instructions", "refinement_areas"}),
+        frozenset({"previous_synthesis"}),
+    ),
+}
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+class TemplateError(ValueError):
+    pass
+
+
+class PromptTemplate:
+    """A template parsed once into ``(literal, field, conversion, format_spec)`` segments."""
+
+    def __init__(self, name: str, text: str, path: Optional[pathlib.Path] = None,
+                 allowed: Optional[FrozenSet[str]] = None, required: FrozenSet[str] = frozenset()):
+        self.name = name
+        self.text = text
+        self.path = path
+        try:
+            segments = list(Formatter().parse(text))
+        except ValueError as e:
+            raise TemplateError(f"Template '{name}' ({path}) is malformed: {e}") from None
+        self._segments: List[Tuple[str, Optional[str], Optional[str], str]] = []
+        for literal, field, format_spec, conversion in segments:
+            if field is not None:
+                if not field.isidentifier():
+                    raise TemplateError(f"Template '{name}' ({path}) has unsupported placeholder {{{field}}}")
+                if format_spec and "{" in format_spec:
+                    raise TemplateError(f"Template '{name}' ({path}) has a nested placeholder in {{{field}}}")
+            self._segments.append((literal, field, conversion, format_spec or ""))
+        self.placeholders = frozenset(s[1] for s in self._segments if s[1] is not None)
+        if allowed is not None and self.placeholders - allowed:
+            unknown = ", ".join(sorted(self.placeholders - allowed))
+            raise TemplateError(f"Template '{name}' ({path}) uses unknown placeholder(s): {unknown}. "
+                                f"Available: {', '.join(sorted(allowed))}")
+        if required - self.placeholders:
+            missing = ", ".join(sorted(required - self.placeholders))
+            raise TemplateError(f"Template '{name}' ({path}) is missing required placeholder(s): {missing}")
+
+    def render(self, **values: Any) -> str:
+        parts = []
+        for literal, field, conversion, format_spec in self._segments:
+            parts.append(literal)
+            if field is None:
+                continue
+            value = values[field]
+            if conversion:
+                value = _CONVERSIONS[conversion](value)
+            parts.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(parts)
+
+
+class _Entry(NamedTuple):
+    template: PromptTemplate
+    mtime_ns: int
+
+
+class TemplateRegistry:
+    def __init__(self, default_dir: pathlib.Path = PACKAGE_DIR, specs: Dict[str, TemplateSpec] = TEMPLATE_SPECS):
+        self.default_dir = pathlib.Path(default_dir)
+        self.specs = dict(specs)
+        self._user_dirs: List[pathlib.Path] = []
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @property
+    def dirs(self) -> List[pathlib.Path]:
+        return [*self._user_dirs, self.default_dir]
+
+    def register_dir(self, path: pathlib.Path) -> None:
+        """Search ``path`` for template overrides ahead of any directory registered before it."""
+        path = pathlib.Path(path).expanduser()
+        if not path.is_dir():
+            raise TemplateError(f"Template directory {path} does not exist")
+        with self._lock:
+            if path in self._user_dirs:
+                self._user_dirs.remove(path)
+            self._user_dirs.insert(0, path)
+            self._entries.clear()
+
+    def _resolve(self, spec: TemplateSpec) -> Tuple[pathlib.Path, os.stat_result]:
+        for directory in self.dirs:
+            path = directory / spec.filename
+            try:
+                return path, path.stat()
+            except FileNotFoundError:
+                continue
+        raise TemplateError(f"Template {spec.filename} not found in {', '.join(str(d) for d in self.dirs)}")
+
+    def get(self, name: str) -> PromptTemplate:
+        """The parsed template ``name``, re-read only if its file changed since the last call."""
+        spec = self.specs.get(name)
+        if spec is None:
+            raise TemplateError(f"Unknown template '{name}'")
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                try:
+                    if entry.template.path.stat().st_mtime_ns == entry.mtime_ns:
+                        return entry.template
+                except FileNotFoundError:
+                    pass
+            path, stat = self._resolve(spec)
+            try:
+                text = path.read_text().strip()
+                template = PromptTemplate(name, text, path, spec.allowed, spec.required)
+            except (OSError, TemplateError) as e:
+                if entry is None:
+                    raise TemplateError(str(e)) from None
+                # Keep serving the last good version rather than failing live runs on a bad edit
+                logger.error(f"Error reloading template '{name}', keeping previous version: {e}")
+                self._entries[name] = entry._replace(mtime_ns=stat.st_mtime_ns)
+                return entry.template
+            self._entries[name] = _Entry(template, stat.st_mtime_ns)
+            self.loads += 1
+            logger.debug(f"Loaded template '{name}' from {path}")
+            return template
+
+
+_registry = TemplateRegistry()
+
+
+def get_template(name: str) -> PromptTemplate:
+    return _registry.get(name)
+
+
+def register_template_dir(path: pathlib.Path) -> None:
+    """Let templates in ``path`` override the bundled ones, matched by file name."""
+    _registry.register_dir(path)
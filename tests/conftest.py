@@ -0,0 +1,11 @@
+import pytest
+
+from llm_consortium.model_pool import clear_models
+
+
+@pytest.fixture(autouse=True)
+def fresh_models():
+    """Tests patch llm's model registry, so each one starts and ends with no resolved models."""
+    clear_models()
+    yield
+    clear_models()
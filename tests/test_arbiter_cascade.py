@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, register_commands
+from llm_consortium.model_pool import clear_models
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+CONFIDENT = "<synthesis>strong answer</synthesis><confidence>0.9</confidence>"
+
+
+class ArbiterModels:
+    """Members answer plainly; each arbiter returns its canned reply."""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.calls = []
+
+    def reply(self, name, prompt):
+        self.calls.append(name)
+        return self.replies.get(name, f"{name} answer")
+
+    def get_model(self, name):
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(
+            **{"text.return_value": self.reply(name, prompt), "response_json": None})
+        return model
+
+    def get_async_model(self, name):
+        async def text(prompt):
+            return self.reply(name, prompt)
+
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(text=lambda: text(prompt), response_json=None)
+        return model
+
+
+class TestArbiterCascade(unittest.TestCase):
+    def patch_models(self, replies):
+        models = ArbiterModels(replies)
+        clear_models()
+        for patcher in (patch('llm_consortium.llm.get_model', side_effect=models.get_model),
+                        patch('llm_consortium.llm.get_async_model', side_effect=models.get_async_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return models
+
+    def orchestrate(self, cheap_reply, **kwargs):
+        models = self.patch_models({"cheap": cheap_reply, "strong": CONFIDENT})
+        config = ConsortiumConfig(models={"member": 1}, arbiters=["cheap", "strong"], max_iterations=1,
+                                  confidence_threshold=0.8, coalesce=False, **kwargs)
+        return ConsortiumOrchestrator(config).orchestrate("question"), models
+
+    def test_confident_cheap_arbiter_is_final(self):
+        result, models = self.orchestrate("<synthesis>cheap answer</synthesis><confidence>0.85</confidence>")
+        self.assertNotIn("strong", models.calls)
+        self.assertEqual(result["synthesis"]["synthesis"], "cheap answer")
+        arbiters = result["metadata"]["arbiters"]
+        self.assertEqual(arbiters["cascade"], ["cheap", "strong"])
+        self.assertEqual(arbiters["stats"]["cheap"]["escalation_rate"], 0.0)
+        self.assertEqual(arbiters["stats"]["strong"]["calls"], 0)
+
+    def test_escalation_reasons(self):
+        long_dissent = " ".join(["no"] * 60)
+        cases = {
+            "low_confidence": "<synthesis>cheap answer</synthesis><confidence>0.3</confidence>",
+            "parse_failure": "I am not sure what to say",
+            "dissent": f"<synthesis>cheap</synthesis><confidence>0.9</confidence><dissent>{long_dissent}</dissent>",
+        }
+        for reason, reply in cases.items():
+            with self.subTest(reason=reason):
+                result, models = self.orchestrate(reply)
+                self.assertEqual(models.calls.count("strong"), 1)
+                self.assertEqual(result["synthesis"]["synthesis"], "strong answer")
+                calls = result["metadata"]["arbiters"]["calls"]
+                self.assertEqual([(c["arbiter"], c["escalated"]) for c in calls], [("cheap", reason), ("strong", None)])
+                self.assertEqual(result["metadata"]["arbiters"]["stats"]["cheap"]["escalation_rate"], 1.0)
+
+    def test_dissent_can_be_ignored(self):
+        reply = f"<synthesis>cheap</synthesis><confidence>0.9</confidence><dissent>{' '.join(['no'] * 60)}</dissent>"
+        result, models = self.orchestrate(reply, arbiter_dissent_words=None)
+        self.assertNotIn("strong", models.calls)
+
+    def test_async_cascade(self):
+        models = self.patch_models({"cheap": "<synthesis>x</synthesis><confidence>0.2</confidence>",
+                                    "strong": CONFIDENT})
+        config = ConsortiumConfig(models={"member": 1}, arbiters=["cheap", "strong"], max_iterations=1,
+                                  confidence_threshold=0.8, coalesce=False)
+        result = asyncio.run(AsyncConsortiumOrchestrator(config).orchestrate("question"))
+        self.assertEqual(result["synthesis"]["synthesis"], "strong answer")
+        self.assertEqual(models.calls.count("cheap"), 1)
+        self.assertEqual(result["metadata"]["arbiters"]["stats"]["strong"]["escalation_rate"], 0.0)
+
+    def test_single_arbiter(self):
+        self.patch_models({"arbiter": CONFIDENT})
+        config = ConsortiumConfig(models={"member": 1}, arbiter="arbiter", max_iterations=1, coalesce=False)
+        result = ConsortiumOrchestrator(config).orchestrate("question")
+        arbiters = result["metadata"]["arbiters"]
+        self.assertEqual(arbiters["cascade"], ["arbiter"])
+        self.assertEqual([c["escalated"] for c in arbiters["calls"]], [None])
+
+
+class TestEscalateToOption(unittest.TestCase):
+    @patch('llm_consortium._save_consortium_config')
+    def test_save_with_cascade(self, mock_save):
+        result = CliRunner().invoke(cli, ["consortium", "save", "team", "-m", "member", "--arbiter", "cheap",
+                                          "--escalate-to", "strong"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(mock_save.call_args[0][1].arbiters, ["cheap", "strong"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig
+
+ARBITER_TEXT = """
+<synthesis_output>
+    <synthesis>Async synthesis</synthesis>
+    <confidence>0.9</confidence>
+    <analysis>Looks good</analysis>
+    <dissent></dissent>
+    <needs_iteration>false</needs_iteration>
+    <refinement_areas></refinement_areas>
+</synthesis_output>
+"""
+
+
+class FakeAsyncResponse:
+    def __init__(self, text, delay=0.0):
+        self._text = text
+        self._delay = delay
+        self.response_json = None
+
+    async def text(self):
+        await asyncio.sleep(self._delay)
+        return self._text
+
+    def log_to_db(self, db):
+        pass
+
+
+class FakeAsyncModel:
+    def __init__(self, model_id, text, delay=0.0):
+        self.model_id = model_id
+        self.text = text
+        self.delay = delay
+        self.prompts = []
+
+    def prompt(self, prompt, stream=True):
+        self.prompts.append(prompt)
+        return FakeAsyncResponse(self.text, self.delay)
+
+
+class TestAsyncConsortiumOrchestrator(unittest.TestCase):
+    def setUp(self):
+        self.config = ConsortiumConfig(
+            models={"model1": 2, "model2": 1},
+            confidence_threshold=0.8,
+            max_iterations=2,
+            arbiter="arbiter_model",
+        )
+        self.models = {
+            "model1": FakeAsyncModel("model1", "Answer one <confidence>0.7</confidence>", delay=0.05),
+            "model2": FakeAsyncModel("model2", "Answer two <confidence>0.6</confidence>", delay=0.05),
+            "arbiter_model": FakeAsyncModel("arbiter_model", ARBITER_TEXT),
+        }
+
+    @patch('llm_consortium.log_response')
+    def test_orchestrate_fans_out_concurrently(self, mock_log_response):
+        orchestrator = AsyncConsortiumOrchestrator(self.config)
+
+        async def run_test():
+            with patch('llm_consortium.llm.get_async_model', side_effect=lambda name: self.models[name]):
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                result = await orchestrator.orchestrate("Test prompt")
+                return result, loop.time() - start
+
+        result, elapsed = asyncio.run(run_test())
+
+        self.assertEqual(result["synthesis"]["synthesis"], "Async synthesis")
+        self.assertEqual(result["metadata"]["iteration_count"], 1)
+        self.assertEqual(len(result["model_responses_final_iteration"]), 3)
+        self.assertEqual(len(self.models["model1"].prompts), 2)
+        # Three 50ms member calls run concurrently rather than back to back
+        self.assertLess(elapsed, 0.14)
+
+    @patch('llm_consortium.log_response')
+    def test_member_error_is_reported(self, mock_log_response):
+        orchestrator = AsyncConsortiumOrchestrator(self.config)
+
+        def get_async_model(name):
+            if name == "model2":
+                raise Exception("Unknown model: model2")
+            return self.models[name]
+
+        async def run_test():
+            with patch('llm_consortium.llm.get_async_model', side_effect=get_async_model):
+                return await orchestrator._get_model_responses("<prompt/>")
+
+        responses = asyncio.run(run_test())
+        errors = [r for r in responses if "error" in r]
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]["model"], "model2")
+
+
+if __name__ == '__main__':
+    unittest.main()
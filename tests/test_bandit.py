@@ -0,0 +1,116 @@
+import pathlib
+import re
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator, IterationContext
+from llm_consortium.strategies.bandit import BanditStore, get_bandit_store, iteration_rewards, prompt_category
+
+MODELS = {f"model{n}": 1 for n in range(1, 7)}
+
+
+class TestPromptCategory(unittest.TestCase):
+    def test_categories(self):
+        self.assertEqual(prompt_category("Human: Fix this Python function"), "code")
+        self.assertEqual(prompt_category("Human: Solve the equation x + 1 = 2"), "math")
+        self.assertEqual(prompt_category("Human: What is the capital of France?"), "general")
+        self.assertEqual(prompt_category("Human: tell me about cats", {"animals": ["cat", "dog"]}), "animals")
+
+    def test_only_the_latest_user_turn_counts(self):
+        prompt = "Human: write a python function\n\n[SYSTEM INSTRUCTIONS]code[/SYSTEM INSTRUCTIONS]\n\nHuman: Hello"
+        self.assertEqual(prompt_category(prompt), "general")
+
+
+class TestIterationRewards(unittest.TestCase):
+    responses = [{"model": "a", "id": 1, "response": "x"}, {"model": "b", "id": 2, "response": "y"},
+                 {"model": "b", "id": 3, "response": "z"}, {"model": "c", "error": "boom"}]
+
+    def test_overlap_scaled_by_confidence(self):
+        rewards = iteration_rewards(IterationContext({"confidence": 0.8, "synthesis": "x and y"}, self.responses))
+        self.assertEqual(rewards, {"a": 0.8 / 3, "b": 0.8 / 6, "c": 0.0})
+
+    def test_pick_one(self):
+        rewards = iteration_rewards(IterationContext({"confidence": 1.0, "chosen_id": 2}, self.responses))
+        self.assertEqual(rewards, {"a": 0.0, "b": 0.5, "c": 0.0})
+
+    def test_rank(self):
+        rewards = iteration_rewards(IterationContext({"confidence": 1.0, "ranking": [3, 1, 2]}, self.responses))
+        self.assertEqual(rewards, {"a": 0.5, "b": 0.5, "c": 0.0})
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = pathlib.Path(tmp.name) / "bandit.db"
+
+
+class TestBanditStore(StoreTestCase):
+    def test_updates_accumulate_across_connections(self):
+        BanditStore(self.path).update("code", {"a": 1.0, "b": 0.0})
+        BanditStore(self.path).update("code", {"a": 0.5})
+        store = BanditStore(self.path)
+        self.assertEqual(store.arms("code"), {"a": (2.5, 1.5), "b": (1.0, 2.0)})
+        self.assertEqual(store.arms("math"), {})
+        self.assertEqual(store.stats()["code"]["a"]["pulls"], 2)
+
+
+class TestBanditStrategy(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+        for patcher in (patch('llm_consortium.llm.get_model', side_effect=self.get_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_model(self, name):
+        def prompt(text, stream=True):
+            self.calls.append(name)
+            if name == "arbiter":
+                # Pick the answer from model2 whenever it took part
+                chosen = re.search(r"<id>(\d+)</id>\s*<model>model2</model>", text)
+                reply = f"<response_id>{chosen.group(1) if chosen else 1}</response_id>"
+            else:
+                reply = f"{name} answer"
+            return MagicMock(**{"text.return_value": reply, "response_json": None})
+
+        model = MagicMock()
+        model.prompt.side_effect = prompt
+        return model
+
+    def orchestrator(self, **params):
+        params = dict({"path": str(self.path), "models_per_run": 2}, **params)
+        return ConsortiumOrchestrator(ConsortiumConfig(models=MODELS, arbiter="arbiter", judging_method="pick-one",
+                                                       strategy="bandit", strategy_params=params, coalesce=False))
+
+    def run_once(self, orchestrator):
+        self.calls.clear()
+        result = orchestrator.orchestrate("question")
+        return result, [name for name in self.calls if name != "arbiter"]
+
+    def test_queries_a_subset(self):
+        result, members = self.run_once(self.orchestrator(seed=1))
+        self.assertEqual(len(members), 2)
+        self.assertEqual(result["metadata"]["strategy"]["selections"][0]["instances"], 2)
+
+    def test_learns_the_useful_model(self):
+        orchestrator = self.orchestrator(seed=3)
+        for _ in range(40):
+            self.run_once(orchestrator)
+        stats = get_bandit_store(self.path).stats()["general"]
+        self.assertGreater(stats["model2"]["mean_reward"], 0.8)
+        # Once learned, model2 is part of nearly every run
+        picked = sum("model2" in self.run_once(orchestrator)[1] for _ in range(20))
+        self.assertGreaterEqual(picked, 18)
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            self.orchestrator(models_per_run=0)
+        with self.assertRaises(ValueError):
+            self.orchestrator(categories={"code": "python"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import json
+import pathlib
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from llm_consortium import register_commands
+from llm_consortium.batch import BatchCheckpoint, read_items, run_batch
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+
+def write_lines(path, lines):
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = pathlib.Path(tmp.name)
+        self.input = self.dir / "prompts.jsonl"
+        self.output = self.dir / "results.jsonl"
+        write_lines(self.input, [{"id": "a", "prompt": "one"}, "two", {"prompt": "three"}])
+
+    def checkpoint(self):
+        checkpoint = BatchCheckpoint(self.dir / "checkpoint.db")
+        self.addCleanup(checkpoint.close)
+        return checkpoint
+
+    def run_all(self, run, **kwargs):
+        return run_batch(run, read_items(self.input), self.output, self.checkpoint(), **kwargs)
+
+    def test_reads_ids_and_bare_prompts(self):
+        self.assertEqual([(item.id, item.prompt) for item in read_items(self.input)],
+                         [("a", "one"), ("2", "two"), ("3", "three")])
+
+    def test_resume_skips_finished_prompts(self):
+        calls = []
+
+        def flaky(item):
+            calls.append(item.id)
+            if item.id == "2":
+                raise RuntimeError("boom")
+            return {"id": item.id, "synthesis": item.prompt.upper()}
+
+        self.assertEqual(self.run_all(flaky), {"run": 3, "failed": 1, "skipped": 0})
+        self.assertEqual(self.run_all(flaky), {"run": 0, "failed": 0, "skipped": 3})
+        self.assertEqual(self.run_all(flaky, retry_failed=True), {"run": 1, "failed": 1, "skipped": 2})
+        self.assertEqual(sorted(calls), ["2", "2", "3", "a"])
+        records = {record["id"]: record for record in read_records(self.output)}
+        self.assertEqual(records["a"]["synthesis"], "ONE")
+        self.assertEqual(records["2"]["error"], "boom")
+
+    def test_retried_prompts_keep_one_record(self):
+        failures = {"2"}
+
+        def run(item):
+            if item.id in failures:
+                raise RuntimeError("boom")
+            return {"id": item.id, "synthesis": item.prompt.upper()}
+
+        self.run_all(run)
+        self.run_all(run, retry_failed=True)
+        failures.clear()
+        self.assertEqual(self.run_all(run, retry_failed=True), {"run": 1, "failed": 0, "skipped": 2})
+        records = read_records(self.output)
+        self.assertEqual(sorted(record["id"] for record in records), ["2", "3", "a"])
+        self.assertEqual(next(r for r in records if r["id"] == "2")["synthesis"], "TWO")
+
+    def test_recovers_records_missing_from_checkpoint(self):
+        # A record written just before a crash, followed by a half-written line
+        self.output.write_text(json.dumps({"id": "a", "synthesis": "ONE"}) + "\n" + '{"id": "2", "synt')
+        summary = self.run_all(lambda item: {"id": item.id})
+        self.assertEqual(summary, {"run": 2, "failed": 0, "skipped": 1})
+        self.assertEqual(sorted(record["id"] for record in read_records(self.output)), ["2", "3", "a"])
+
+    def test_recovery_reads_back_across_blocks(self):
+        records = [{"id": "a", "synthesis": "x" * 50}, {"id": "2", "synthesis": "y" * 50}]
+        self.output.write_text("".join(json.dumps(r) + "\n" for r in records) + '{"id": "3", "synthesis": "zz')
+        checkpoint = self.checkpoint()
+        checkpoint.record("a")
+        with patch('llm_consortium.batch._TAIL_BLOCK', 16):
+            summary = run_batch(lambda item: {"id": item.id}, read_items(self.input), self.output, checkpoint)
+        self.assertEqual(summary, {"run": 1, "failed": 0, "skipped": 2})
+        self.assertEqual([record["id"] for record in read_records(self.output)], ["a", "2", "3"])
+
+    def test_concurrency_is_bounded(self):
+        write_lines(self.input, [f"prompt {n}" for n in range(20)])
+        lock = threading.Lock()
+        active = {"now": 0, "max": 0}
+
+        def run(item):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+            return {"id": item.id}
+
+        self.assertEqual(self.run_all(run, concurrency=4)["run"], 20)
+        self.assertEqual(active["max"], 4)
+
+    def test_duplicate_ids_are_rejected(self):
+        write_lines(self.input, [{"id": "x", "prompt": "one"}, {"id": "x", "prompt": "two"}])
+        with self.assertRaises(ValueError):
+            self.run_all(lambda item: {"id": item.id})
+
+
+class TestBatchCommand(unittest.TestCase):
+    def test_batch_command_writes_results(self):
+        def get_model(name):
+            model = MagicMock()
+            reply = "<synthesis>final</synthesis><confidence>0.9</confidence>" if name == "arbiter" else "answer"
+            model.prompt.return_value = MagicMock(**{"text.return_value": reply, "response_json": None})
+            return model
+
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            write_lines(pathlib.Path("prompts.jsonl"), ["one", "two"])
+            with patch('llm_consortium.llm.get_model', side_effect=get_model), \
+                 patch('llm_consortium.log_response'):
+                args = ["consortium", "batch", "prompts.jsonl", "-o", "out.jsonl", "-m", "model1", "--arbiter", "arbiter"]
+                first = runner.invoke(cli, args)
+                second = runner.invoke(cli, args)
+            self.assertEqual(first.exit_code, 0, first.output)
+            self.assertIn("Ran 0 prompt(s), 0 failed, 2 already finished", second.output)
+            records = read_records(pathlib.Path("out.jsonl"))
+            self.assertEqual(sorted(record["id"] for record in records), ["1", "2"])
+            self.assertEqual(records[0]["synthesis"], "final")
+
+    def test_requires_models_or_consortium(self):
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            write_lines(pathlib.Path("prompts.jsonl"), ["one"])
+            result = runner.invoke(cli, ["consortium", "batch", "prompts.jsonl", "-o", "out.jsonl"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("--consortium", result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
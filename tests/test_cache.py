@@ -0,0 +1,112 @@
+import pathlib
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.cache import ResponseCache, cache_key
+
+ARBITER_TEXT = "<synthesis>Cached answer</synthesis><confidence>0.9</confidence>"
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = pathlib.Path(tmp.name)
+
+
+class TestResponseCache(TempDirTestCase):
+    def test_key_normalizes_prompt_and_includes_options(self):
+        self.assertEqual(cache_key("m", "hello  \r\nworld\n"), cache_key("m", "hello\nworld"))
+        self.assertNotEqual(cache_key("m", "hello"), cache_key("other", "hello"))
+        self.assertNotEqual(cache_key("m", "hello", {"instance": 0}), cache_key("m", "hello", {"instance": 1}))
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(self.dir / "cache.db")
+        cache.put("k", "m", "value")
+        self.assertEqual(cache.get("k", ttl=60), "value")
+        with patch('llm_consortium.cache.time.time', return_value=time.time() + 120):
+            self.assertIsNone(cache.get("k", ttl=60))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_lru_eviction_by_size(self):
+        cache = ResponseCache(self.dir / "cache.db", max_bytes=25)
+        cache.put("a", "m", "x" * 10)
+        time.sleep(0.01)
+        cache.put("b", "m", "x" * 10)
+        time.sleep(0.01)
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("c", "m", "x" * 10)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_puts_below_the_limit_do_not_scan_the_table(self):
+        cache = ResponseCache(self.dir / "cache.db", max_bytes=1000)
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        for n in range(20):
+            cache.put(str(n), "m", "x" * 10)
+        cache.put("0", "m", "x" * 5)  # Replacing an entry adjusts the total by the difference
+        self.assertFalse([s for s in statements if "SUM(" in s])
+        self.assertEqual(cache._bytes, cache.stats()["bytes"])
+        self.assertEqual(ResponseCache(self.dir / "cache.db")._bytes, 195)
+
+
+class TestOrchestratorCache(TempDirTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch('llm_consortium.user_dir', return_value=self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.prompts = {"model1": [], "arbiter": []}
+
+    def get_model(self, name):
+        model = MagicMock()
+
+        def prompt(text, stream=True):
+            self.prompts[name].append(text)
+            reply = ARBITER_TEXT if name == "arbiter" else f"answer {len(self.prompts[name])}"
+            return MagicMock(**{"text.return_value": reply, "response_json": None})
+
+        model.prompt.side_effect = prompt
+        return model
+
+    def run_once(self, **config):
+        orchestrator = ConsortiumOrchestrator(
+            ConsortiumConfig(models={"model1": 2}, arbiter="arbiter", max_iterations=1, **config)
+        )
+        with patch('llm_consortium.llm.get_model', side_effect=self.get_model), \
+             patch('llm_consortium.log_response'):
+            return orchestrator.orchestrate("What is cached?")
+
+    def test_repeated_run_is_served_from_cache(self):
+        first = self.run_once(cache=True)
+        self.assertEqual(first["metadata"]["cache"], {"enabled": True, "hits": 0, "misses": 3})
+        self.assertTrue(all("<uuid>" not in p for p in self.prompts["model1"]))
+
+        second = self.run_once(cache=True)
+        self.assertEqual(second["metadata"]["cache"], {"enabled": True, "hits": 3, "misses": 0})
+        self.assertEqual(len(self.prompts["model1"]), 2)
+        self.assertEqual(len(self.prompts["arbiter"]), 1)
+        self.assertEqual(second["synthesis"]["synthesis"], "Cached answer")
+        # Each instance keeps its own cached answer
+        answers = sorted(r["response"] for r in second["model_responses_final_iteration"])
+        self.assertEqual(answers, sorted(r["response"] for r in first["model_responses_final_iteration"]))
+
+    def test_force_diversity_keeps_uuid(self):
+        self.run_once(cache=True, force_diversity=True)
+        self.assertTrue(all("<uuid>" in p for p in self.prompts["model1"]))
+
+    def test_cache_is_off_by_default(self):
+        result = self.run_once()
+        self.assertFalse(result["metadata"]["cache"]["enabled"])
+        self.assertTrue(all("<uuid>" in p for p in self.prompts["model1"]))
+        self.assertFalse((self.dir / "consortium_cache.db").exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -67,3 +67,17 @@ def test_save_command():
     ])
     assert result.exit_code == 0
     assert "test-consortium" in result.output.lower()
+
+def test_plugin_registers_commands():
+    from llm.plugins import pm
+    import llm_consortium
+    registered = pm.is_registered(llm_consortium)
+    if not registered:
+        pm.register(llm_consortium)
+    try:
+        group = click.Group()
+        pm.hook.register_commands(cli=group)
+        assert "consortium" in group.commands
+    finally:
+        if not registered:
+            pm.unregister(llm_consortium)
@@ -0,0 +1,124 @@
+import pathlib
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import llm_consortium
+from llm_consortium.db_writer import LogWriter
+
+
+class FakeResponse:
+    """Logs itself as one row, recording which thread did the write."""
+
+    def __init__(self, text, fail=False, gate=None):
+        self.text = text
+        self.fail = fail
+        self.gate = gate
+        self.response_json = None
+        self.thread = None
+
+    def log_to_db(self, db):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.thread = threading.current_thread().name
+        db["responses"].insert({"text": self.text})
+        if self.fail:
+            raise ValueError("bad row")
+
+
+class TestLogWriter(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = pathlib.Path(tmp.name) / "logs.db"
+
+    def rows(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            return sorted(row[0] for row in conn.execute("SELECT text FROM responses"))
+        finally:
+            conn.close()
+
+    def test_writes_from_single_background_thread_in_wal_mode(self):
+        writer = LogWriter(self.path)
+        self.addCleanup(writer.close)
+        responses = [FakeResponse(f"r{i}") for i in range(20)]
+        threads = [threading.Thread(target=writer.submit, args=(r, "model")) for r in responses]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(writer.flush(5))
+
+        self.assertEqual(self.rows(), sorted(f"r{i}" for i in range(20)))
+        self.assertEqual({r.thread for r in responses}, {"consortium-log-writer"})
+        conn = sqlite3.connect(self.path)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        conn.close()
+        stats = writer.stats()
+        self.assertEqual(stats["written"], 20)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_queued_responses_are_written_in_one_batch(self):
+        writer = LogWriter(self.path)
+        self.addCleanup(writer.close)
+        gate = threading.Event()
+        writer.submit(FakeResponse("first", gate=gate), "model")
+        for i in range(10):
+            writer.submit(FakeResponse(f"queued{i}"), "model")
+        gate.set()
+        writer.flush(5)
+        # Responses that queued up while the writer was busy share a transaction
+        stats = writer.stats()
+        self.assertEqual(stats["written"], 11)
+        self.assertLessEqual(stats["batches"], 2)
+
+    def test_failed_row_does_not_lose_batch(self):
+        writer = LogWriter(self.path)
+        self.addCleanup(writer.close)
+        gate = threading.Event()
+        writer.submit(FakeResponse("gate", gate=gate), "model")
+        writer.submit(FakeResponse("good"), "model")
+        writer.submit(FakeResponse("bad", fail=True), "model")
+        writer.submit(FakeResponse("also good"), "model")
+        gate.set()
+        writer.flush(5)
+        self.assertEqual(self.rows(), ["also good", "gate", "good"])
+        self.assertEqual(writer.stats()["failed"], 1)
+
+    def test_full_queue_drops_instead_of_blocking_forever(self):
+        writer = LogWriter(self.path, max_queue=1, put_timeout=0.05)
+        self.addCleanup(writer.close)
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        writer.submit(FakeResponse("in flight", gate=gate), "model")
+        while writer.stats()["queue_depth"]:
+            time.sleep(0.01)  # wait for the writer to pick up the first response
+        self.assertTrue(writer.submit(FakeResponse("queued"), "model"))
+        self.assertFalse(writer.submit(FakeResponse("dropped"), "model"))
+        self.assertEqual(writer.stats()["dropped"], 1)
+
+    def test_close_flushes_queue(self):
+        writer = LogWriter(self.path)
+        for i in range(5):
+            writer.submit(FakeResponse(f"r{i}"), "model")
+        writer.close()
+        self.assertEqual(len(self.rows()), 5)
+        self.assertFalse(writer.submit(FakeResponse("late"), "model"))
+
+
+class TestLogResponse(unittest.TestCase):
+    def test_log_response_only_enqueues(self):
+        response = FakeResponse("text")
+        with patch('llm_consortium.get_log_writer') as get_writer, \
+             patch('llm_consortium.DatabaseConnection.get_connection') as get_connection:
+            llm_consortium.log_response(response, "model1-1")
+        get_writer.return_value.submit.assert_called_once_with(response, "model1-1")
+        get_connection.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import click
+from click.testing import CliRunner
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, register_commands
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+ARBITER_TEXT = "<synthesis>combined</synthesis><confidence>0.5</confidence><needs_iteration>true</needs_iteration>"
+
+
+class SlowResponse:
+    def __init__(self, text, delay):
+        self._text = text
+        self.delay = delay
+        self.response_json = None
+
+    def text(self):
+        time.sleep(self.delay)
+        return self._text
+
+    def log_to_db(self, db):
+        pass
+
+
+class SlowModel:
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+
+    def prompt(self, prompt, stream=True):
+        text = ARBITER_TEXT if self.name == "arbiter" else f"{self.name} answer"
+        return SlowResponse(text, self.delay)
+
+
+class AsyncSlowResponse(SlowResponse):
+    cancelled = 0
+
+    async def text(self):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            AsyncSlowResponse.cancelled += 1
+            raise
+        return self._text
+
+
+class AsyncSlowModel(SlowModel):
+    def prompt(self, prompt, stream=True):
+        return AsyncSlowResponse(ARBITER_TEXT if self.name == "arbiter" else f"{self.name} answer", self.delay)
+
+
+class DeadlineTestCase(unittest.TestCase):
+    delays = {"fast": 0.01, "slow": 3.0, "arbiter": 0.01}
+
+    def setUp(self):
+        for patcher in (patch('llm_consortium.llm.get_model',
+                              side_effect=lambda name: SlowModel(name, self.delays[name])),
+                        patch('llm_consortium.llm.get_async_model',
+                              side_effect=lambda name: AsyncSlowModel(name, self.delays[name])),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def config(self, **kwargs):
+        kwargs.setdefault("models", {"fast": 1, "slow": 1})
+        kwargs.setdefault("max_iterations", 1)
+        return ConsortiumConfig(arbiter="arbiter", coalesce=False, **kwargs)
+
+
+class TestMemberTimeouts(DeadlineTestCase):
+    def test_model_timeout_drops_slow_member(self):
+        orchestrator = ConsortiumOrchestrator(self.config(model_timeouts={"slow": 0.2}))
+        start = time.monotonic()
+        result = orchestrator.orchestrate("question")
+        self.assertLess(time.monotonic() - start, 1.5)
+
+        responses = {r["model"]: r for r in result["model_responses_final_iteration"]}
+        self.assertEqual(responses["fast"]["response"], "fast answer")
+        self.assertTrue(responses["slow"]["timed_out"])
+        timed_out = result["metadata"]["timing"]["timed_out"]
+        self.assertEqual([(t["model"], t["reason"]) for t in timed_out], [("slow", "model_timeout")])
+        self.assertEqual(result["synthesis"]["synthesis"], "combined")
+
+    def test_default_timeout(self):
+        orchestrator = ConsortiumOrchestrator(self.config(model_timeouts={"default": 0.2}))
+        self.assertEqual(orchestrator._model_timeout("anything"), 0.2)
+        self.assertIsNone(ConsortiumOrchestrator(self.config())._model_timeout("anything"))
+
+    def test_deadline_arbitrates_on_what_arrived(self):
+        orchestrator = ConsortiumOrchestrator(self.config(deadline=0.6, max_iterations=3))
+        start = time.monotonic()
+        result = orchestrator.orchestrate("question")
+        self.assertLess(time.monotonic() - start, 1.5)
+
+        timing = result["metadata"]["timing"]
+        self.assertEqual(timing["deadline"], 0.6)
+        self.assertEqual([(t["model"], t["reason"]) for t in timing["timed_out"]], [("slow", "deadline")])
+        # No time is left for the further iterations the arbiter asked for
+        self.assertEqual(result["metadata"]["iteration_count"], 1)
+        self.assertEqual(timing["stopped_early"], "deadline")
+        self.assertEqual(len(timing["phases"]), 1)
+        self.assertGreater(timing["phases"][0]["members_seconds"], 0.3)
+
+    def test_phases_recorded_without_limits(self):
+        result = ConsortiumOrchestrator(self.config(models={"fast": 2})).orchestrate("question")
+        timing = result["metadata"]["timing"]
+        self.assertEqual(timing["timed_out"], [])
+        self.assertIsNone(timing["stopped_early"])
+        self.assertEqual(list(timing["phases"][0]), ["iteration", "members_seconds", "arbiter_seconds"])
+
+    def test_arbiter_timeout_falls_back_to_member_answer(self):
+        self.delays = dict(self.delays, arbiter=3.0)
+        orchestrator = ConsortiumOrchestrator(self.config(models={"fast": 1}, model_timeouts={"arbiter": 0.2}))
+        start = time.monotonic()
+        result = orchestrator.orchestrate("question")
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(result["synthesis"]["synthesis"], "fast answer")
+        self.assertEqual(result["metadata"]["timing"]["stopped_early"], "arbiter_timeout")
+        arbiters = result["metadata"]["arbiters"]
+        self.assertEqual([(c["arbiter"], c["timed_out"]) for c in arbiters["calls"]], [("arbiter", True)])
+        self.assertEqual(arbiters["stats"]["arbiter"]["timed_out"], 1)
+
+
+class TestAsyncDeadline(DeadlineTestCase):
+    def test_late_members_are_cancelled(self):
+        AsyncSlowResponse.cancelled = 0
+        orchestrator = AsyncConsortiumOrchestrator(self.config(deadline=0.6))
+        start = time.monotonic()
+        result = asyncio.run(orchestrator.orchestrate("question"))
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertEqual(AsyncSlowResponse.cancelled, 1)
+        self.assertEqual([t["model"] for t in result["metadata"]["timing"]["timed_out"]], ["slow"])
+        self.assertEqual(result["synthesis"]["synthesis"], "combined")
+
+    def test_arbiter_timeout(self):
+        self.delays = dict(self.delays, arbiter=3.0)
+        orchestrator = AsyncConsortiumOrchestrator(self.config(models={"fast": 1}, model_timeouts={"arbiter": 0.2}))
+        result = asyncio.run(orchestrator.orchestrate("question"))
+        self.assertEqual(result["synthesis"]["synthesis"], "fast answer")
+        self.assertEqual(result["metadata"]["timing"]["stopped_early"], "arbiter_timeout")
+        self.assertEqual([c["timed_out"] for c in result["metadata"]["arbiters"]["calls"]], [True])
+
+
+class TestTimeoutOptions(unittest.TestCase):
+    @patch('llm_consortium._save_consortium_config')
+    def test_save_with_deadline_and_timeouts(self, mock_save):
+        result = CliRunner().invoke(cli, ["consortium", "save", "team", "-m", "fast", "--arbiter", "arbiter",
+                                          "--deadline", "30", "--timeout", "10", "--timeout", "openai=5"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        config = mock_save.call_args[0][1]
+        self.assertEqual(config.deadline, 30)
+        self.assertEqual(config.model_timeouts, {"default": 10, "openai": 5})
+
+    def test_invalid_timeout(self):
+        result = CliRunner().invoke(cli, ["consortium", "save", "team", "-m", "fast", "--arbiter", "arbiter",
+                                          "--timeout", "slow=soon"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("Invalid --timeout", result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
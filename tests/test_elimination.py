@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator, IterationContext
+from llm_consortium.strategies import EliminationStrategy
+from llm_consortium.strategies.elimination import member_scores
+
+ANSWERS = {"good": "Paris is the capital of France", "fair": "It is Paris", "off": "Bananas are yellow"}
+
+
+class TestMemberScores(unittest.TestCase):
+    def test_overlap_with_synthesis(self):
+        responses = [{"model": name, "response": text} for name, text in ANSWERS.items()]
+        responses.append({"model": "broken", "error": "boom"})
+        scores = member_scores(IterationContext({"synthesis": "The capital of France is Paris."}, responses))
+        self.assertEqual(scores["good"], 1.0)
+        self.assertGreater(scores["fair"], scores["off"])
+        self.assertEqual((scores["off"], scores["broken"]), (0.0, 0.0))
+
+    def test_ranking_is_preferred(self):
+        responses = [{"model": "a", "id": 1, "response": "x"}, {"model": "b", "id": 2, "response": "x"}]
+        scores = member_scores(IterationContext({"synthesis": "x", "ranking": [2, 1]}, responses))
+        self.assertEqual(scores, {"a": 0.0, "b": 1.0})
+
+
+class TestEliminationStrategy(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        for patcher in (patch('llm_consortium.llm.get_model', side_effect=self.get_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_model(self, name):
+        def prompt(text, stream=True):
+            self.calls.append(name)
+            if name == "arbiter":
+                reply = "<synthesis>The capital of France is Paris.</synthesis><confidence>0.5</confidence>"
+            else:
+                reply = ANSWERS[name]
+            return MagicMock(**{"text.return_value": reply, "response_json": None})
+
+        model = MagicMock()
+        model.prompt.side_effect = prompt
+        return model
+
+    def test_later_iterations_query_the_survivors(self):
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(
+            models={"good": 2, "fair": 1, "off": 1}, arbiter="arbiter", max_iterations=3, confidence_threshold=0.9,
+            strategy="elimination", strategy_params={"keep": 2}, coalesce=False))
+        with self.assertLogs("llm_consortium", level="INFO") as logs:
+            result = orchestrator.orchestrate("What is the capital of France?")
+
+        selections = result["metadata"]["strategy"]["selections"]
+        self.assertEqual([s["models"] for s in selections],
+                         [{"good": 2, "fair": 1, "off": 1}, {"good": 2, "fair": 1}, {"good": 2, "fair": 1}])
+        self.assertEqual([s["instances"] for s in selections], [4, 3, 3])
+        self.assertEqual(self.calls.count("off"), 1)
+        self.assertTrue(any("Iteration 2: querying 3 instance(s) of 2 model(s)" in line for line in logs.output))
+        self.assertTrue(any("eliminated ['off']" in line for line in logs.output))
+
+    def test_keep_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            EliminationStrategy(None, {"keep": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, RunContext
+from llm_consortium.latency import HedgeBudget, LatencyTracker
+
+
+class TestLatencyTracker(unittest.TestCase):
+    def test_percentile_requires_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for value in (1, 2, 3, 4):
+            tracker.record("m", value)
+        self.assertIsNone(tracker.percentile("m", 90))
+        tracker.record("m", 10)
+        self.assertEqual(tracker.percentile("m", 90), 10)
+        self.assertEqual(tracker.percentile("m", 50), 3)
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=3, min_samples=1)
+        for value in (100, 1, 1, 1):
+            tracker.record("m", value)
+        self.assertEqual(tracker.percentile("m", 100), 1)
+
+
+class TestHedgeBudget(unittest.TestCase):
+    def test_budget_caps_hedges(self):
+        budget = HedgeBudget()
+        for _ in range(20):
+            budget.note_primary("m")
+        self.assertTrue(budget.try_hedge("m", 0.1))
+        self.assertTrue(budget.try_hedge("m", 0.1))
+        self.assertFalse(budget.try_hedge("m", 0.1))
+        self.assertFalse(budget.try_hedge("other", 0.1))
+
+
+class FirstCallSlowModel:
+    """The first prompt hangs; every later prompt answers quickly."""
+
+    def __init__(self, slow_delay=2.0):
+        self.calls = 0
+        self.slow_delay = slow_delay
+        self.lock = threading.Lock()
+
+    def prompt(self, prompt, stream=True):
+        with self.lock:
+            self.calls += 1
+            delay = self.slow_delay if self.calls == 1 else 0.01
+        return DelayedResponse(f"call {self.calls}", delay)
+
+
+class DelayedResponse:
+    def __init__(self, text, delay):
+        self._text = text
+        self.delay = delay
+        self.response_json = None
+
+    def text(self):
+        time.sleep(self.delay)
+        return self._text
+
+    def log_to_db(self, db):
+        pass
+
+
+class AsyncDelayedResponse(DelayedResponse):
+    async def text(self):
+        await asyncio.sleep(self.delay)
+        return self._text
+
+
+class StreamedResponse(DelayedResponse):
+    """Streams ``chunks`` chunks, one every ``delay`` seconds."""
+
+    def __init__(self, text, delay, chunks):
+        super().__init__(text, 0)
+        self.chunk_delay = delay
+        self.chunks = chunks
+        self.streamed = 0
+
+    def __iter__(self):
+        for _ in range(self.chunks):
+            time.sleep(self.chunk_delay)
+            self.streamed += 1
+            yield "chunk"
+
+
+class SlowStreamModel(FirstCallSlowModel):
+    """The first prompt streams slowly; every later prompt answers quickly."""
+
+    def prompt(self, prompt, stream=True):
+        response = super().prompt(prompt)
+        if self.calls == 1:
+            self.primary = StreamedResponse(response._text, 0.05, chunks=40)
+            return self.primary
+        return response
+
+
+class AsyncFirstCallSlowModel(FirstCallSlowModel):
+    def prompt(self, prompt, stream=True):
+        response = super().prompt(prompt)
+        return AsyncDelayedResponse(response._text, response.delay)
+
+
+def hedging_config():
+    return ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", hedge_percentile=90, hedge_budget=1.0)
+
+
+class TestHedgedRequests(unittest.TestCase):
+    def setUp(self):
+        self.tracker = LatencyTracker(min_samples=3)
+        for _ in range(3):
+            self.tracker.record("model1", 0.05)
+        self.budget = HedgeBudget()
+        patchers = [
+            patch('llm_consortium.latency_tracker', self.tracker),
+            patch('llm_consortium.hedge_budget', self.budget),
+            patch('llm_consortium.log_response'),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_sync_hedge_wins_over_slow_primary(self):
+        orchestrator = ConsortiumOrchestrator(hedging_config())
+        run = RunContext()
+        model = FirstCallSlowModel()
+
+        with patch('llm_consortium.llm.get_model', return_value=model):
+            start = time.monotonic()
+            result = orchestrator._get_model_response("model1", "prompt", 0, run)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(result["response"], "call 2")
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(run.stats["hedges_issued"], 1)
+        self.assertEqual(run.stats["hedges_won"], 1)
+
+    def test_sync_hedge_stops_streaming_primary(self):
+        orchestrator = ConsortiumOrchestrator(hedging_config())
+        run = RunContext()
+        model = SlowStreamModel()
+        self.budget.note_primary("model1")
+
+        with patch('llm_consortium.llm.get_model', return_value=model):
+            response, text = orchestrator._call_member_hedged("model1", "prompt", run, on_first_token=lambda: None)
+            self.assertEqual(text, "call 2")
+            time.sleep(0.2)
+            streamed = model.primary.streamed
+            time.sleep(0.3)
+        # The losing primary stopped reading its stream soon after the hedge won
+        self.assertEqual(model.primary.streamed, streamed)
+        self.assertLess(streamed, 10)
+        self.assertEqual(run.stats["model_calls"], 2)
+
+    def test_async_hedge_cancels_slow_primary(self):
+        orchestrator = AsyncConsortiumOrchestrator(hedging_config())
+        run = RunContext()
+        model = AsyncFirstCallSlowModel()
+
+        async def run_test():
+            with patch('llm_consortium.llm.get_async_model', return_value=model):
+                return await orchestrator._get_model_response("model1", "prompt", 0, run)
+
+        start = time.monotonic()
+        result = asyncio.run(run_test())
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(result["response"], "call 2")
+        self.assertEqual(run.stats["hedges_won"], 1)
+
+    def test_no_hedge_without_budget(self):
+        orchestrator = ConsortiumOrchestrator(
+            ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", hedge_percentile=90, hedge_budget=0.0)
+        )
+        run = RunContext()
+        model = FirstCallSlowModel(slow_delay=0.3)
+        with patch('llm_consortium.llm.get_model', return_value=model):
+            result = orchestrator._get_model_response("model1", "prompt", 0, run)
+        # The slow primary is waited out instead of being duplicated
+        self.assertEqual(result["response"], "call 1")
+        self.assertEqual(model.calls, 1)
+        self.assertEqual(run.stats["hedges_issued"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
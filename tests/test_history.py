@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator, IterationContext, RunContext
+
+LOW_CONFIDENCE = ("<synthesis>Draft</synthesis><confidence>0.1</confidence>"
+                  "<refinement_areas><area>detail</area></refinement_areas>")
+
+
+def iteration(n):
+    synthesis = {"synthesis": f"synthesis {n}", "confidence": 0.5, "refinement_areas": [f"area {n}"]}
+    return IterationContext(synthesis, [{"model": "model1", "response": f"long member answer {n} " * 50}])
+
+
+class TestIterationHistory(unittest.TestCase):
+    def setUp(self):
+        self.run = RunContext()
+        self.run.iteration_history = [iteration(n) for n in range(1, 5)]
+
+    def history(self, **config):
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", **config))
+        return orchestrator._format_iteration_history(self.run)
+
+    def test_full_history_by_default(self):
+        history = self.history()
+        for n in range(1, 5):
+            self.assertIn(f"<iteration_number>{n}</iteration_number>", history)
+            self.assertIn(f"long member answer {n}", history)
+
+    def test_iterations_rendered_once(self):
+        with patch.object(IterationContext, '_render', autospec=True, return_value="<iteration/>") as render:
+            self.history()
+            self.run.iteration_history.append(iteration(5))
+            self.history()
+        self.assertEqual(render.call_count, 5)
+
+    def test_window_drops_older_iterations(self):
+        history = self.history(history_window=2)
+        self.assertIn("2 earlier iteration(s) omitted", history)
+        self.assertNotIn("synthesis 2", history)
+        self.assertIn("long member answer 3", history)
+        self.assertIn("long member answer 4", history)
+
+    def test_compact_keeps_syntheses_of_older_iterations(self):
+        history = self.history(history_window=1, compact_history=True)
+        self.assertEqual(history.count('<iteration compact="true">'), 3)
+        self.assertIn("synthesis 1", history)
+        self.assertIn("<area>area 2</area>", history)
+        self.assertNotIn("long member answer 3", history)
+        self.assertIn("long member answer 4", history)
+
+    def test_empty_history(self):
+        self.run.iteration_history = []
+        self.assertIn("No previous iterations", self.history(history_window=1))
+
+
+class TestArbiterPromptTokens(unittest.TestCase):
+    def run_consortium(self, **config):
+        def get_model(name):
+            model = MagicMock()
+            reply = LOW_CONFIDENCE if name == "arbiter" else "member answer " * 200
+            model.prompt.return_value = MagicMock(**{"text.return_value": reply, "response_json": None})
+            return model
+
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(
+            models={"model1": 2}, arbiter="arbiter", max_iterations=4, **config))
+        with patch('llm_consortium.llm.get_model', side_effect=get_model), \
+             patch('llm_consortium.log_response'):
+            return orchestrator.orchestrate("question")["metadata"]["arbiter_prompt"]
+
+    def test_tokens_recorded_per_iteration(self):
+        full = self.run_consortium()
+        compact = self.run_consortium(history_window=1, compact_history=True)
+        self.assertEqual(len(full["tokens"]), 4)
+        self.assertEqual(full["history_tokens"][0], compact["history_tokens"][0])
+        # Full history grows with every member response; the compact one stays bounded
+        self.assertGreater(full["tokens"][3], compact["tokens"][3])
+        self.assertLess(compact["history_tokens"][3] - compact["history_tokens"][2],
+                        full["history_tokens"][3] - full["history_tokens"][2])
+        self.assertEqual(compact["history_window"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import pathlib
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from llm_consortium import register_commands
+from llm_consortium.jobs import JobQueue, run_worker
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+CONFIG = {"models": {"model1": 1}, "arbiter": "arbiter"}
+
+
+class QueueTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = pathlib.Path(tmp.name) / "jobs.db"
+        self.queue = self.open_queue()
+
+    def open_queue(self):
+        queue = JobQueue(self.path)
+        self.addCleanup(queue.close)
+        return queue
+
+
+class TestJobQueue(QueueTestCase):
+    def test_claim_and_complete(self):
+        job_id = self.queue.submit("question", CONFIG)
+        job = self.queue.claim("w1")
+        self.assertEqual((job.id, job.prompt, job.config, job.attempts), (job_id, "question", CONFIG, 1))
+        self.assertIsNone(self.queue.claim("w2"))
+        self.assertTrue(self.queue.complete(job_id, "w1", {"synthesis": {"synthesis": "answer"}}))
+        self.assertEqual(self.queue.status(job_id)["status"], "done")
+        self.assertEqual(self.queue.result(job_id), {"synthesis": {"synthesis": "answer"}})
+        self.assertEqual(self.queue.counts(), {"queued": 0, "running": 0, "done": 1, "failed": 0})
+
+    def test_expired_lease_is_reclaimed(self):
+        job_id = self.queue.submit("question", CONFIG)
+        self.queue.claim("w1", lease_seconds=-1)  # Already expired
+        job = self.queue.claim("w2")
+        self.assertEqual((job.id, job.attempts), (job_id, 2))
+        # The first worker's late result is ignored
+        self.assertFalse(self.queue.heartbeat(job_id, "w1"))
+        self.assertFalse(self.queue.complete(job_id, "w1", {}))
+        self.assertTrue(self.queue.complete(job_id, "w2", {}))
+
+    def test_attempts_are_limited(self):
+        job_id = self.queue.submit("question", CONFIG, max_attempts=2)
+        self.queue.claim("w1")
+        self.assertTrue(self.queue.fail(job_id, "w1", "boom"))
+        self.assertEqual(self.queue.status(job_id)["status"], "queued")
+        self.queue.claim("w1", lease_seconds=-1)
+        self.assertIsNone(self.queue.claim("w2"))
+        status = self.queue.status(job_id)
+        self.assertEqual((status["status"], status["error"], status["attempts"]), ("failed", "Lease expired", 2))
+        self.assertIsNone(self.queue.result(job_id))
+
+    def test_each_job_claimed_once_across_connections(self):
+        ids = {self.queue.submit(f"question {n}", CONFIG) for n in range(50)}
+        claimed = []
+        lock = threading.Lock()
+
+        def drain(name):
+            queue = self.open_queue()  # Its own connection, as a separate process would have
+            while True:
+                job = queue.claim(name)
+                if job is None:
+                    return
+                with lock:
+                    claimed.append(job.id)
+
+        threads = [threading.Thread(target=drain, args=(f"w{n}",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(claimed), sorted(ids))
+
+    def test_worker_runs_jobs_and_records_failures(self):
+        ok = self.queue.submit("fine", CONFIG)
+        bad = self.queue.submit("broken", CONFIG, max_attempts=1)
+
+        def handler(job):
+            if job.prompt == "broken":
+                raise RuntimeError("boom")
+            return {"answer": job.prompt}
+
+        self.assertEqual(run_worker(self.queue, handler, exit_when_empty=True), 2)
+        self.assertEqual(self.queue.result(ok), {"answer": "fine"})
+        self.assertEqual(self.queue.status(bad)["error"], "boom")
+
+
+class TestJobCommands(QueueTestCase):
+    def test_submit_worker_result(self):
+        def get_model(name):
+            model = MagicMock()
+            reply = "<synthesis>final</synthesis><confidence>0.9</confidence>" if name == "arbiter" else "answer"
+            model.prompt.return_value = MagicMock(**{"text.return_value": reply, "response_json": None})
+            return model
+
+        runner = CliRunner()
+        queue = ["--queue", str(self.path)]
+        submitted = runner.invoke(cli, ["consortium", "submit", "question", "-m", "model1", "--arbiter", "arbiter",
+                                        *queue])
+        self.assertEqual(submitted.exit_code, 0, submitted.output)
+        job_id = submitted.output.strip()
+
+        pending = runner.invoke(cli, ["consortium", "result", job_id, *queue])
+        self.assertIn("is queued", pending.output)
+
+        with patch('llm_consortium.llm.get_model', side_effect=get_model), \
+             patch('llm_consortium.log_response'), \
+             patch('llm_consortium.setup_logging'):
+            worker = runner.invoke(cli, ["consortium", "worker", "--exit-when-empty", *queue])
+        self.assertEqual(worker.exit_code, 0, worker.output)
+
+        result = runner.invoke(cli, ["consortium", "result", job_id, *queue])
+        self.assertEqual(result.output.strip(), "final")
+        status = runner.invoke(cli, ["consortium", "status", *queue])
+        self.assertIn("done: 1", status.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
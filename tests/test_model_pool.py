@@ -0,0 +1,115 @@
+import http.server
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm.default_plugins.openai_models import Chat
+
+from llm_consortium.model_pool import ClientPool, ModelCache, _pooled_model, warm
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible endpoint that counts the connections opened to it."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        data = json.dumps({
+            "id": "x", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class TestClientPooling(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        StandInHandler.connections = 0
+        self.pool = ClientPool()
+        self.addCleanup(self.pool.clear)
+
+    def model(self):
+        model = Chat("standin", api_base=f"http://127.0.0.1:{self.server.server_port}/v1")
+        model.needs_key = None
+        return model
+
+    def test_unpooled_model_reconnects_per_prompt(self):
+        model = self.model()
+        for _ in range(3):
+            model.prompt("hi", stream=False).text()
+        self.assertEqual(StandInHandler.connections, 3)
+
+    def test_pooled_models_share_one_connection(self):
+        first, second = _pooled_model(self.model(), self.pool), _pooled_model(self.model(), self.pool)
+        for model in (first, second, first):
+            self.assertEqual(model.prompt("hi", stream=False).text(), "hello")
+        self.assertEqual(StandInHandler.connections, 1)
+        self.assertEqual(self.pool.stats(), {"clients": 1, "created": 1, "reused": 2})
+
+    def test_pooling_leaves_the_resolved_model_alone(self):
+        model = self.model()
+        pooled = _pooled_model(model, self.pool)
+        self.assertIsInstance(pooled, Chat)
+        self.assertNotIn("get_client", vars(model))
+        self.assertIs(type(model), Chat)
+        model.prompt("hi", stream=False).text()
+        self.assertEqual(self.pool.stats()["created"], 0)
+
+    def test_warm_opens_the_connection(self):
+        cache = ModelCache(self.pool)
+        with patch('llm_consortium.model_pool.model_cache', cache), \
+             patch('llm.get_model', return_value=self.model()):
+            self.assertEqual(warm(["standin"]), {"standin": None})
+            cache.get("standin").prompt("hi", stream=False).text()
+        self.assertEqual(StandInHandler.connections, 1)
+
+
+class TestModelCache(unittest.TestCase):
+    def test_models_resolved_once(self):
+        cache = ModelCache(ClientPool())
+        with patch('llm.get_model', side_effect=lambda name: MagicMock(spec=["prompt"])) as get_model:
+            self.assertIs(cache.get("a"), cache.get("a"))
+            cache.get("b")
+        self.assertEqual(get_model.call_count, 2)
+        self.assertEqual(cache.stats(), {"models": 2, "hits": 1, "misses": 2})
+
+    def test_models_kept_until_cleared(self):
+        cache = ModelCache(ClientPool())
+        with patch('llm.get_model', return_value="first"):
+            self.assertEqual(cache.get("a"), "first")
+        with patch('llm.get_model', return_value="second"):
+            self.assertEqual(cache.get("a"), "first")
+            cache.clear()
+            self.assertEqual(cache.get("a"), "second")
+
+    def test_warm_reports_unknown_models(self):
+        with patch('llm_consortium.model_pool.model_cache', ModelCache(ClientPool())), \
+             patch('llm.get_model', side_effect=KeyError("missing")):
+            self.assertEqual(warm(["nope"], connect=False), {"nope": "'missing'"})
+
+
+if __name__ == '__main__':
+    unittest.main()
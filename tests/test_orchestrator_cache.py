@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumModel
+from llm_consortium.orchestrator_cache import OrchestratorCache, config_key
+
+RESULT = {"synthesis": {"synthesis": "answer", "analysis": "ok", "raw_arbiter_response": "<synthesis>answer</synthesis>"}}
+
+
+class TestOrchestratorCache(unittest.TestCase):
+    def test_key_ignores_dict_order(self):
+        self.assertEqual(config_key({"a": 1, "b": {"c": 2}}), config_key({"b": {"c": 2}, "a": 1}))
+        self.assertNotEqual(config_key({"a": 1}), config_key({"a": 2}))
+
+    def test_lru_eviction_and_stats(self):
+        cache = OrchestratorCache(max_size=2)
+        a = cache.get({"n": 1}, object)
+        cache.get({"n": 2}, object)
+        self.assertIs(cache.get({"n": 1}, object), a)  # {"n": 2} is now least recently used
+        cache.get({"n": 3}, object)
+        self.assertIs(cache.get({"n": 1}, object), a)
+        self.assertEqual(cache.stats(), {"size": 2, "max_size": 2, "hits": 2, "misses": 3, "evictions": 1})
+        cache.get({"n": 2}, object)
+        self.assertEqual(cache.stats()["misses"], 4)
+
+
+class TestSystemPromptOverride(unittest.TestCase):
+    def setUp(self):
+        cache = OrchestratorCache()
+        patcher = patch('llm_consortium.get_orchestrator_cache', return_value=cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = cache
+        self.model = ConsortiumModel("consortium", ConsortiumConfig(models={"model1": 1}, arbiter="arbiter"))
+
+    def run_prompt(self, system):
+        prompt = MagicMock(prompt="question", system=system)
+        with patch('llm_consortium.ConsortiumOrchestrator.orchestrate', autospec=True, return_value=RESULT) as orchestrate:
+            self.model._run(prompt, None)
+        return orchestrate.call_args[0][0]
+
+    def test_same_system_prompt_reuses_orchestrator(self):
+        first = self.run_prompt("Be brief")
+        self.assertIs(self.run_prompt("Be brief"), first)
+        self.assertEqual(first.system_prompt, "Be brief")
+        other = self.run_prompt("Be verbose")
+        self.assertIsNot(other, first)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+        # The consortium's own config is left untouched
+        self.assertIsNone(self.model.config.system_prompt)
+
+    def test_no_system_prompt_uses_model_orchestrator(self):
+        self.assertIs(self.run_prompt(None), self.model.get_orchestrator())
+        self.assertEqual(self.cache.stats()["misses"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
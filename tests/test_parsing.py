@@ -0,0 +1,80 @@
+import unittest
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.parsing import ARBITER_PATTERNS, ARBITER_TAGS, TagScanner, scan
+
+ARBITER_TEXT = """<think>I should answer with <confidence>[a number]</confidence>.</think>
+<synthesis_output>
+    <analysis>Both agree</analysis>
+    <dissent></dissent>
+    <synthesis>
+        The answer is 42.
+    </synthesis>
+    <confidence>0.85</confidence>
+    <refinement_areas><area>units</area><area>sources</area></refinement_areas>
+    <needs_iteration>TRUE</needs_iteration>
+</synthesis_output>"""
+
+
+class TestTagScanner(unittest.TestCase):
+    def test_chunked_feed_matches_single_scan(self):
+        expected = scan(ARBITER_TEXT, ARBITER_TAGS, ARBITER_PATTERNS)
+        for size in (1, 3, 7, 50):
+            scanner = TagScanner(ARBITER_TAGS, ARBITER_PATTERNS)
+            for i in range(0, len(ARBITER_TEXT), size):
+                scanner.feed(ARBITER_TEXT[i:i + size])
+            self.assertEqual(scanner.values, expected)
+            self.assertTrue(scanner.complete)
+
+    def test_constrained_tag_skips_malformed_occurrence(self):
+        values = scan(ARBITER_TEXT, ARBITER_TAGS, ARBITER_PATTERNS)
+        self.assertEqual(values["confidence"], "0.85")
+        self.assertEqual(values["needs_iteration"], "TRUE")
+        self.assertEqual(values["dissent"], "")
+
+    def test_tags_reported_as_soon_as_they_close(self):
+        seen = []
+        scanner = TagScanner(ARBITER_TAGS, ARBITER_PATTERNS, on_tag=lambda tag, value: seen.append(tag))
+        scanner.feed(ARBITER_TEXT[:ARBITER_TEXT.index("<confidence>0.85")])
+        self.assertEqual(seen, ["analysis", "dissent", "synthesis"])
+        scanner.feed(ARBITER_TEXT[ARBITER_TEXT.index("<confidence>0.85"):])
+        self.assertEqual(seen[3:], ["confidence", "refinement_areas", "needs_iteration"])
+
+    def test_streamed_content(self):
+        pieces = []
+        scanner = TagScanner(("synthesis",), stream=("synthesis",), on_content=lambda tag, text: pieces.append(text))
+        for chunk in ["a <synth", "esis>x < y", " <i>z</i></syn", "thesis> tail"]:
+            scanner.feed(chunk)
+        self.assertEqual("".join(pieces), "x < y <i>z</i>")
+        self.assertEqual(scanner.values["synthesis"], "x < y <i>z</i>")
+
+
+class TestOrchestratorParsing(unittest.TestCase):
+    def setUp(self):
+        self.orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"model1": 1}, arbiter="arbiter"))
+
+    def test_parse_arbiter_response(self):
+        result = self.orchestrator._parse_arbiter_response(ARBITER_TEXT)
+        self.assertEqual(result["synthesis"], "The answer is 42.")
+        self.assertEqual(result["confidence"], 0.85)
+        self.assertTrue(result["needs_iteration"])
+        self.assertEqual(result["refinement_areas"], ["units", "sources"])
+
+    def test_member_confidence(self):
+        parse = self.orchestrator._parse_confidence_value
+        self.assertEqual(parse("<CONFIDENCE> 85 </CONFIDENCE>"), 0.85)
+        self.assertEqual(parse("Reasoning...\nMy Confidence Level: 70%\nConfidence: 0.2"), 0.7)
+        self.assertEqual(parse("confidence: unknown\nconfidence: 0.4"), 0.4)
+        self.assertEqual(parse("no number here", 0.3), 0.3)
+
+    def test_pick_one_and_rank(self):
+        responses = [{"id": 1, "model": "a", "response": "first"}, {"id": 2, "model": "b", "response": "second"}]
+        picked = self.orchestrator._parse_pick_one_response("<winner><response_id> 2 </response_id></winner>", responses)
+        self.assertEqual(picked["synthesis"], "second")
+        ranked = self.orchestrator._parse_rank_response(
+            '<ranking><rank position="1">1</rank><rank position="2">2</rank></ranking>', responses)
+        self.assertEqual(ranked["ranking"], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
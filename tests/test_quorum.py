@@ -0,0 +1,127 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, RunContext
+
+
+class SlowResponse:
+    def __init__(self, text, delay):
+        self._text = text
+        self.delay = delay
+        self.response_json = None
+
+    def text(self):
+        time.sleep(self.delay)
+        return self._text
+
+    def log_to_db(self, db):
+        pass
+
+
+class SlowModel:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def prompt(self, prompt, stream=True):
+        return SlowResponse(f"answer after {self.delay}s", self.delay)
+
+
+class AsyncSlowResponse(SlowResponse):
+    async def text(self):
+        await asyncio.sleep(self.delay)
+        return self._text
+
+
+class AsyncSlowModel(SlowModel):
+    def prompt(self, prompt, stream=True):
+        return AsyncSlowResponse(f"answer after {self.delay}s", self.delay)
+
+
+MODELS = {"fast": 0.01, "medium": 0.05, "slow": 2.0}
+
+
+class TestQuorumSize(unittest.TestCase):
+    def test_count_and_fraction(self):
+        def size(quorum, total):
+            config = ConsortiumConfig(models={"m": total}, arbiter="a", quorum=quorum)
+            return ConsortiumOrchestrator(config)._quorum_size(total)
+
+        self.assertEqual(size(None, 5), 5)
+        self.assertEqual(size(2, 5), 2)
+        self.assertEqual(size(10, 5), 5)
+        self.assertEqual(size(0.6, 5), 3)
+        self.assertEqual(size(0.01, 5), 1)
+
+
+class TestQuorumGathering(unittest.TestCase):
+    def config(self, quorum):
+        return ConsortiumConfig(models={"fast": 1, "medium": 1, "slow": 1}, arbiter="arbiter", quorum=quorum)
+
+    @patch('llm_consortium.log_response')
+    def test_sync_returns_at_quorum_and_records_stragglers(self, mock_log_response):
+        orchestrator = ConsortiumOrchestrator(self.config(2))
+        run = RunContext()
+        run.stats["iterations"] = 1
+
+        with patch('llm_consortium.llm.get_model', side_effect=lambda name: SlowModel(MODELS[name])):
+            start = time.monotonic()
+            responses = orchestrator._get_model_responses("prompt", run)
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.0)
+        self.assertCountEqual([r["model"] for r in responses], ["fast", "medium"])
+        self.assertEqual(run.stats["stragglers"],
+                         [{"model": "slow", "instance": 1, "iteration": 1, "status": "ignored"}])
+
+    @patch('llm_consortium.log_response')
+    def test_async_cancels_stragglers(self, mock_log_response):
+        orchestrator = AsyncConsortiumOrchestrator(self.config(2))
+        run = RunContext()
+
+        async def run_test():
+            with patch('llm_consortium.llm.get_async_model', side_effect=lambda name: AsyncSlowModel(MODELS[name])):
+                return await orchestrator._get_model_responses("prompt", run)
+
+        start = time.monotonic()
+        responses = asyncio.run(run_test())
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(run.stats["stragglers"][0]["model"], "slow")
+        self.assertEqual(run.stats["stragglers"][0]["status"], "cancelled")
+
+    @patch('llm_consortium.log_response')
+    def test_errors_do_not_count_towards_quorum(self, mock_log_response):
+        orchestrator = ConsortiumOrchestrator(
+            ConsortiumConfig(models={"broken": 1, "fast": 1, "medium": 1}, arbiter="arbiter", quorum=2)
+        )
+        run = RunContext()
+
+        def get_model(name):
+            if name == "broken":
+                raise Exception("Unknown model: broken")
+            return SlowModel(MODELS[name])
+
+        with patch('llm_consortium.llm.get_model', side_effect=get_model):
+            responses = orchestrator._get_model_responses("prompt", run)
+
+        self.assertEqual(len(responses), 3)
+        self.assertEqual(run.stats["stragglers"], [])
+
+    @patch('llm_consortium.log_response')
+    def test_metadata_counts_the_selected_members(self, mock_log_response):
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(
+            models={"fast": 1, "medium": 1, "slow": 1}, arbiter="arbiter", quorum=0.6, max_iterations=1,
+            strategy="round_robin", strategy_params={"models_per_iteration": 1}, coalesce=False))
+
+        with patch('llm_consortium.llm.get_model', side_effect=lambda name: SlowModel(MODELS.get(name, 0.01))):
+            result = orchestrator.orchestrate("prompt")
+
+        quorum = result["metadata"]["quorum"]
+        self.assertEqual(quorum["required"], 1)
+        self.assertEqual(quorum["per_iteration"], [{"iteration": 1, "members": 1, "required": 1}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium import rate_limit
+from llm_consortium.rate_limit import (
+    AdaptiveLimiter, configure_limits, get_limiter, is_rate_limit_error,
+    limiter_stats, retry_after_from_error,
+)
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def test_request_bucket_queues_excess_calls(self):
+        limiter = AdaptiveLimiter("model", requests_per_minute=600)  # 10 per second, burst of 600
+        limiter.requests.tokens = 1
+        self.assertTrue(limiter.acquire())
+        limiter.release()
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.release()
+        # The second call waited for roughly one refill interval (0.1s) instead of failing
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+    def test_aimd_halves_on_rate_limit_and_recovers(self):
+        limiter = AdaptiveLimiter("model", max_concurrency=8)
+        limiter.acquire()
+        limiter.release(rate_limited=True, retry_after=0)
+        self.assertEqual(limiter.stats()["concurrency_limit"], 4)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release()
+        self.assertGreater(limiter.stats()["concurrency_limit"], 4)
+
+    def test_retry_after_blocks_all_callers(self):
+        limiter = AdaptiveLimiter("model")
+        limiter.acquire()
+        limiter.release(rate_limited=True, retry_after=0.2)
+        waited = []
+
+        def worker():
+            start = time.monotonic()
+            limiter.acquire()
+            waited.append(time.monotonic() - start)
+            limiter.release()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(w >= 0.15 for w in waited))
+
+    def test_concurrency_limit_queues_callers(self):
+        limiter = AdaptiveLimiter("model", max_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+            limiter.release()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        self.assertEqual(limiter.stats()["waiting"], 1)
+        limiter.release()
+        self.assertTrue(acquired.wait(1.0))
+        thread.join()
+
+    def test_cancel_stops_waiting(self):
+        limiter = AdaptiveLimiter("model", max_concurrency=1)
+        limiter.acquire()
+        cancel = threading.Event()
+        cancel.set()
+        self.assertFalse(limiter.acquire(cancel=cancel))
+
+    def test_release_wakes_async_waiters(self):
+        limiter = AdaptiveLimiter("model", max_concurrency=1)
+        limiter.acquire()
+        threading.Timer(0.1, limiter.release).start()
+
+        async def wait():
+            start = time.monotonic()
+            await limiter.acquire_async()
+            return time.monotonic() - start
+
+        self.assertLess(asyncio.run(asyncio.wait_for(wait(), 1.0)), 0.5)
+        self.assertEqual(limiter.stats()["in_flight"], 1)
+
+
+class TestErrorHelpers(unittest.TestCase):
+    def test_is_rate_limit_error(self):
+        self.assertTrue(is_rate_limit_error(RateLimitError("slow down")))
+        self.assertTrue(is_rate_limit_error(Exception("Error code: 429 - too many requests")))
+        self.assertFalse(is_rate_limit_error(Exception("Unknown model: gpt-4-0429")))
+
+    def test_retry_after_from_headers_and_message(self):
+        error = Exception("rate limited")
+        error.response = MagicMock(headers={"retry-after": "7"})
+        self.assertEqual(retry_after_from_error(error), 7.0)
+        self.assertEqual(retry_after_from_error(Exception("Please try again in 350ms")), 0.35)
+        self.assertIsNone(retry_after_from_error(Exception("boom")))
+
+
+class TestLimiterRegistry(unittest.TestCase):
+    def setUp(self):
+        rate_limit.reset_limiters()
+
+    def tearDown(self):
+        rate_limit.reset_limiters()
+
+    def test_limiters_are_shared_and_configured_by_provider(self):
+        configure_limits("openai", requests_per_minute=60, max_concurrency=5)
+        limiter = get_limiter("gpt-4o")
+        self.assertIs(limiter, get_limiter("gpt-4o"))
+        self.assertIs(limiter, get_limiter("gpt-4o-mini"))
+        self.assertEqual(limiter.max_concurrency, 5)
+        self.assertEqual(list(limiter_stats()), ["openai"])
+
+    def test_model_limits_get_their_own_limiter(self):
+        configure_limits("openai", max_concurrency=5)
+        configure_limits("gpt-4o", max_concurrency=2)
+        self.assertEqual(get_limiter("gpt-4o").max_concurrency, 2)
+        self.assertEqual(get_limiter("gpt-4o-mini").max_concurrency, 5)
+        self.assertIsNot(get_limiter("claude-3-haiku"), get_limiter("claude-3-opus"))
+
+    @patch('llm_consortium.log_response')
+    def test_orchestrator_requeues_rate_limited_calls(self, mock_log_response):
+        model = MagicMock()
+        error = RateLimitError("rate limit")
+        error.response = MagicMock(headers={"retry-after": "0.05"})
+        model.prompt.side_effect = [error, MagicMock(**{"text.return_value": "ok"})]
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"model1": 1}, arbiter="arbiter"))
+
+        with patch('llm_consortium.llm.get_model', return_value=model):
+            result = orchestrator._get_model_response("model1", "prompt", 0)
+
+        self.assertEqual(result["response"], "ok")
+        stats = limiter_stats()["model1"]
+        self.assertEqual(stats["rate_limited"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    @patch('llm_consortium.log_response')
+    def test_finished_run_stops_waiting_calls(self, mock_log_response):
+        configure_limits("slow", max_concurrency=1)
+        limiter = get_limiter("slow")
+        limiter.acquire()  # Held elsewhere for the whole run
+        self.addCleanup(limiter.release)
+        model = MagicMock()
+        model.prompt.return_value = MagicMock(**{"text.return_value": "<synthesis>ok</synthesis>"})
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(
+            models={"fast": 1, "slow": 1}, arbiter="arbiter", max_iterations=1, model_timeouts={"slow": 0.2},
+            coalesce=False))
+
+        with patch('llm_consortium.llm.get_model', return_value=model):
+            orchestrator.orchestrate("prompt")
+            # The abandoned call to "slow" gives up its place in the queue once the run is over
+            deadline = time.monotonic() + 2.0
+            while limiter.stats()["waiting"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+        self.assertEqual(limiter.stats()["waiting"], 0)
+        self.assertEqual(limiter.stats()["in_flight"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
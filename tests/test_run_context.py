@@ -0,0 +1,115 @@
+import asyncio
+import re
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, RunContext
+
+ORIGINAL_PROMPT = re.compile(r"<original_prompt>(.*?)</original_prompt>", re.DOTALL)
+
+
+class EchoModels:
+    """Members answer after a short delay; the arbiter echoes the question it was asked about."""
+
+    def __init__(self):
+        self.arbiter_prompts = []
+        self.lock = threading.Lock()
+
+    def reply(self, name, prompt):
+        if name != "arbiter":
+            time.sleep(0.01)
+            return "member answer"
+        with self.lock:
+            self.arbiter_prompts.append(prompt)
+        question = ORIGINAL_PROMPT.search(prompt).group(1)
+        return f"<synthesis>about {question}</synthesis><confidence>0.1</confidence>"
+
+    def get_model(self, name):
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(
+            **{"text.return_value": self.reply(name, prompt), "response_json": None})
+        return model
+
+    def get_async_model(self, name):
+        async def text(prompt):
+            await asyncio.sleep(0.01)
+            return self.reply(name, prompt)
+
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(text=lambda: text(prompt), response_json=None)
+        return model
+
+
+class TestRunContext(unittest.TestCase):
+    def setUp(self):
+        self.models = EchoModels()
+        for patcher in (patch('llm_consortium.llm.get_model', side_effect=self.models.get_model),
+                        patch('llm_consortium.llm.get_async_model', side_effect=self.models.get_async_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def config(self, **kwargs):
+        return ConsortiumConfig(models={"model1": 2}, arbiter="arbiter", max_iterations=2, **kwargs)
+
+    def test_runs_do_not_share_history(self):
+        orchestrator = ConsortiumOrchestrator(self.config())
+        orchestrator.orchestrate("first")
+        result = orchestrator.orchestrate("second", consortium_id="abc")
+        self.assertEqual(result["metadata"]["iteration_count"], 2)
+        self.assertEqual(result["metadata"]["consortium_id"], "abc")
+        # The second run's arbiter only ever sees its own earlier iteration
+        for prompt in self.models.arbiter_prompts[2:]:
+            self.assertNotIn("about first", prompt)
+        self.assertFalse(hasattr(orchestrator, "iteration_history"))
+
+    def test_judging_method_does_not_change_configured_iterations(self):
+        orchestrator = ConsortiumOrchestrator(self.config(judging_method="pick-one"))
+        orchestrator.orchestrate("question")
+        self.assertEqual(orchestrator.max_iterations, 2)
+
+    def test_concurrent_runs_share_one_orchestrator(self):
+        orchestrator = ConsortiumOrchestrator(self.config())
+        results = {}
+
+        def run(n):
+            results[n] = orchestrator.orchestrate(f"question {n}")
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for n, result in results.items():
+            self.assertEqual(result["synthesis"]["synthesis"], f"about question {n}")
+            self.assertEqual(result["metadata"]["iteration_count"], 2)
+            self.assertEqual(len(result["metadata"]["arbiter_prompt"]["tokens"]), 2)
+        for prompt in self.models.arbiter_prompts:
+            question = ORIGINAL_PROMPT.search(prompt).group(1)
+            self.assertEqual(set(re.findall(r"about (question \d)", prompt)) - {question}, set())
+
+    def test_concurrent_async_runs(self):
+        orchestrator = AsyncConsortiumOrchestrator(self.config())
+
+        async def run_all():
+            return await asyncio.gather(*(orchestrator.orchestrate(f"question {n}") for n in range(8)))
+
+        for n, result in enumerate(asyncio.run(run_all())):
+            self.assertEqual(result["synthesis"]["synthesis"], f"about question {n}")
+            self.assertEqual(result["metadata"]["iteration_count"], 2)
+
+    def test_counters_are_safe_across_threads(self):
+        run = RunContext()
+        threads = [threading.Thread(target=lambda: [run.count("model_calls") for _ in range(2000)]) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(run.stats["model_calls"], 16000)
+
+
+if __name__ == '__main__':
+    unittest.main()
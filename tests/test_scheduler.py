@@ -0,0 +1,85 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator, RunContext
+from llm_consortium.scheduler import DispatchScheduler, provider_for, dispatch_stats
+
+LONG_PROMPT = "x" * 8000  # ~2000 estimated tokens, above the cacheable minimum
+
+
+class FakeResponse:
+    def __init__(self, chunks, delay):
+        self.chunks = chunks
+        self.delay = delay
+        self.response_json = None
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            time.sleep(self.delay)
+            yield chunk
+
+    def text(self):
+        return "".join(self.chunks)
+
+
+class FakeModel:
+    def __init__(self):
+        self.sent_at = []
+
+    def prompt(self, prompt, stream=True):
+        self.sent_at.append(time.monotonic())
+        return FakeResponse(["first ", "second"], delay=0.05)
+
+
+class TestDispatchScheduler(unittest.TestCase):
+    def test_provider_for(self):
+        self.assertEqual(provider_for("claude-3-opus-20240229"), "anthropic")
+        self.assertEqual(provider_for("gpt-4o"), "openai")
+        self.assertEqual(provider_for("gemini-2.0-flash"), "gemini")
+        self.assertIsNone(provider_for("my-local-model"))
+
+    def test_plan_holds_only_caching_providers_with_followers(self):
+        scheduler = DispatchScheduler()
+        plan = scheduler.plan({"gpt-4o": 3, "claude-3-haiku": 1, "local": 2}, LONG_PROMPT)
+
+        self.assertEqual(list(plan.held), ["openai"])
+        leader, followers = plan.held["openai"]
+        self.assertEqual(leader, ("gpt-4o", 0))
+        self.assertEqual(followers, [("gpt-4o", 1), ("gpt-4o", 2)])
+        self.assertCountEqual(plan.immediate, [("claude-3-haiku", 0), ("local", 0), ("local", 1)])
+
+    def test_short_prompts_are_never_held(self):
+        plan = DispatchScheduler().plan({"gpt-4o": 3}, "short prompt")
+        self.assertEqual(plan.held, {})
+        self.assertEqual(len(plan.immediate), 3)
+
+    def test_dispatch_stats(self):
+        stats = dispatch_stats(0.5, iterations=2)
+        self.assertEqual(stats["legacy_warmup_seconds"], 10.0)
+        self.assertEqual(stats["saved_seconds"], 9.5)
+
+
+class TestOrchestratorDispatch(unittest.TestCase):
+    @patch('llm_consortium.log_response')
+    def test_followers_released_on_first_token(self, mock_log_response):
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"gpt-4o": 3}, arbiter="arbiter"))
+        run = RunContext()
+        model = FakeModel()
+
+        with patch('llm_consortium.llm.get_model', return_value=model):
+            start = time.monotonic()
+            responses = orchestrator._get_model_responses(LONG_PROMPT, run)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(len(responses), 3)
+        self.assertTrue(all(r["response"] == "first second" for r in responses))
+        leader_sent, *follower_sent = sorted(model.sent_at)
+        # Followers wait for the leader's first chunk, not for a fixed sleep
+        self.assertTrue(all(t - leader_sent >= 0.04 for t in follower_sent))
+        self.assertLess(elapsed, 1.0)
+        self.assertLess(run.stats["dispatch_held_seconds"], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
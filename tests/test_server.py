@@ -0,0 +1,162 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from llm_consortium import TRUNCATED_STREAM_NOTICE, ConsortiumConfig
+
+try:
+    from fastapi.testclient import TestClient
+    from llm_consortium.server import create_app, split_messages
+except ImportError:  # The server dependencies are optional
+    TestClient = None
+
+ARBITER_TEXT = "<synthesis>The answer is 42.</synthesis><confidence>0.9</confidence>"
+
+
+class StandInResponse:
+    """Local stand-in for an llm async response, streamed in small chunks."""
+
+    def __init__(self, text):
+        self._text = text
+        self.response_json = None
+
+    async def __aiter__(self):
+        for start in range(0, len(self._text), 8):
+            await asyncio.sleep(0)
+            yield self._text[start:start + 8]
+
+    async def text(self):
+        await asyncio.sleep(0)
+        return self._text
+
+
+class StandInModel:
+    def __init__(self, name, prompts):
+        self.name = name
+        self.prompts = prompts
+
+    def prompt(self, prompt, stream=True):
+        self.prompts.append((self.name, prompt))
+        return StandInResponse(ARBITER_TEXT if self.name == "arbiter" else "member answer")
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.prompts = []
+        for patcher in (patch('llm_consortium.llm.get_async_model',
+                              side_effect=lambda name: StandInModel(name, self.prompts)),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        configs = {"team": ConsortiumConfig(models={"model1": 2}, arbiter="arbiter", max_iterations=1)}
+        self.client = TestClient(create_app(lambda: configs))
+
+    def chat(self, **body):
+        body.setdefault("model", "team")
+        body.setdefault("messages", [{"role": "user", "content": "What is six times seven?"}])
+        return self.client.post("/v1/chat/completions", json=body)
+
+    def test_lists_consortiums_as_models(self):
+        self.assertEqual([m["id"] for m in self.client.get("/v1/models").json()["data"]], ["team"])
+
+    def test_chat_completion(self):
+        response = self.chat()
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["object"], "chat.completion")
+        self.assertEqual(data["choices"][0]["message"], {"role": "assistant", "content": "The answer is 42."})
+        self.assertEqual(data["consortium"]["consortium_id"], data["id"])
+        self.assertEqual(len([name for name, _ in self.prompts if name == "model1"]), 2)
+
+    def test_streamed_chat_completion(self):
+        with self.client.stream("POST", "/v1/chat/completions", json={
+                "model": "team", "stream": True, "messages": [{"role": "user", "content": "Question?"}]}) as response:
+            self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+            events = [line[len("data: "):] for line in response.iter_lines() if line.startswith("data: ")]
+        self.assertEqual(events[-1], "[DONE]")
+        chunks = [json.loads(event) for event in events[:-1]]
+        content = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks)
+        self.assertEqual(content, "The answer is 42.")
+        self.assertGreater(len(chunks), 3)  # Sent as the arbiter wrote it, not in one piece
+        self.assertEqual(chunks[-1]["choices"][0]["finish_reason"], "stop")
+
+    def test_arbiter_timeout_after_partial_stream(self):
+        class StalledResponse(StandInResponse):
+            async def __aiter__(self):
+                yield "<synthesis>The answer"
+                await asyncio.sleep(5)
+                yield " is 42.</synthesis>"
+
+        def get_async_model(name):
+            if name == "arbiter":
+                return SimpleNamespace(prompt=lambda prompt, stream=True: StalledResponse(ARBITER_TEXT))
+            return StandInModel(name, self.prompts)
+
+        configs = {"team": ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", max_iterations=1,
+                                            model_timeouts={"arbiter": 0.3})}
+        with patch('llm_consortium.llm.get_async_model', side_effect=get_async_model), \
+             TestClient(create_app(lambda: configs)) as client, \
+             client.stream("POST", "/v1/chat/completions", json={
+                 "model": "team", "stream": True, "messages": [{"role": "user", "content": "Question?"}]}) as response:
+            events = [line[len("data: "):] for line in response.iter_lines() if line.startswith("data: ")]
+        chunks = [json.loads(event) for event in events[:-1]]
+        content = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks)
+        self.assertEqual(content, "The answer" + TRUNCATED_STREAM_NOTICE + "member answer")
+        self.assertEqual(chunks[-1]["choices"][0]["finish_reason"], "length")
+
+    def test_configs_are_loaded_off_the_event_loop(self):
+        loops = []
+
+        def configs():
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return {"team": ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", max_iterations=1)}
+
+        client = TestClient(create_app(configs))
+        self.assertEqual(client.get("/v1/models").status_code, 200)
+        response = client.post("/v1/chat/completions", json={
+            "model": "team", "messages": [{"role": "user", "content": "Question?"}]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(loops, [None, None])
+
+    def test_system_message_and_history_reach_the_consortium(self):
+        self.chat(messages=[{"role": "system", "content": "Answer in French."},
+                            {"role": "user", "content": "Hi"},
+                            {"role": "assistant", "content": "Bonjour"},
+                            {"role": "user", "content": "Question?"}])
+        member_prompt = next(prompt for name, prompt in self.prompts if name == "model1")
+        self.assertIn("Answer in French.", member_prompt)
+        self.assertIn("Assistant: Bonjour", member_prompt)
+
+    def test_errors_use_openai_format(self):
+        response = self.chat(model="missing")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["error"]["code"], "model_not_found")
+        self.assertEqual(self.chat(messages=[]).status_code, 400)
+
+    def test_metrics(self):
+        self.chat()
+        text = self.client.get("/metrics").text
+        self.assertIn('consortium_requests_total{model="team",status="ok"} 1', text)
+        self.assertIn("consortium_requests_in_flight 0", text)
+        self.assertIn('consortium_limiter_acquired{model="arbiter"}', text)
+
+
+@unittest.skipIf(TestClient is None, "fastapi is not installed")
+class TestSplitMessages(unittest.TestCase):
+    def test_content_parts(self):
+        prompt, history, system = split_messages([{"role": "user", "content": [{"type": "text", "text": "Hi"}]}])
+        self.assertEqual((prompt, history, system), ("Hi", "", None))
+
+    def test_last_message_must_be_user(self):
+        with self.assertRaises(ValueError):
+            split_messages([{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
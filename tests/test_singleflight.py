@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.singleflight import SingleFlight
+
+ARBITER_TEXT = "<synthesis>shared answer</synthesis><confidence>0.9</confidence>"
+
+
+class CoalescingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.flights = SingleFlight()
+        self.calls = []
+        for patcher in (patch('llm_consortium.get_singleflight', return_value=self.flights),
+                        patch('llm_consortium.llm.get_model', side_effect=self.get_model),
+                        patch('llm_consortium.llm.get_async_model', side_effect=self.get_async_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def reply(self, name, prompt):
+        self.calls.append(name)
+        return ARBITER_TEXT if name == "arbiter" else f"answer to {prompt[-40:]}"
+
+    def get_model(self, name):
+        def prompt(text, stream=True):
+            time.sleep(0.05)
+            return MagicMock(**{"text.return_value": self.reply(name, text), "response_json": None})
+
+        model = MagicMock()
+        model.prompt.side_effect = prompt
+        return model
+
+    def get_async_model(self, name):
+        async def text(prompt):
+            await asyncio.sleep(0.05)
+            return self.reply(name, prompt)
+
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(text=lambda: text(prompt), response_json=None)
+        return model
+
+    def config(self, **kwargs):
+        kwargs.setdefault("coalesce", True)
+        return ConsortiumConfig(models={"model1": 2}, arbiter="arbiter", max_iterations=1, **kwargs)
+
+
+class TestSyncCoalescing(CoalescingTestCase):
+    def run_concurrently(self, orchestrator, prompts):
+        results = [None] * len(prompts)
+
+        def run(n):
+            results[n] = orchestrator.orchestrate(prompts[n])
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(len(prompts))]
+        for t in threads:
+            t.start()
+            time.sleep(0.005)  # Let the first call become the leader
+        for t in threads:
+            t.join()
+        return results
+
+    def test_identical_runs_share_one_run(self):
+        results = self.run_concurrently(ConsortiumOrchestrator(self.config()), ["same"] * 5)
+        self.assertEqual(sorted(self.calls), ["arbiter", "model1", "model1"])
+        self.assertTrue(all(r["synthesis"]["synthesis"] == "shared answer" for r in results))
+        self.assertEqual(sum(bool(r["metadata"].get("coalesced")) for r in results), 4)
+        self.assertEqual(results[0]["metadata"]["model_calls"], 3)
+        self.assertEqual(self.flights.stats(), {"in_flight": 0, "leaders": 1, "coalesced": 4, "saved_calls": 12})
+
+    def test_coalescing_is_opt_in(self):
+        self.assertFalse(ConsortiumConfig(models={"model1": 1}).coalesce)
+        self.run_concurrently(ConsortiumOrchestrator(ConsortiumConfig(
+            models={"model1": 2}, arbiter="arbiter", max_iterations=1)), ["same", "same"])
+        self.assertEqual(self.flights.stats()["coalesced"], 0)
+
+    def test_every_caller_gets_its_own_copy(self):
+        results = self.run_concurrently(ConsortiumOrchestrator(self.config()), ["same"] * 3)
+        self.assertEqual(len({id(r) for r in results}), 3)
+        self.assertEqual(len({id(r["synthesis"]) for r in results}), 3)
+
+    def test_different_prompts_and_disabled_coalescing_run_separately(self):
+        self.run_concurrently(ConsortiumOrchestrator(self.config()), ["one", "two"])
+        self.run_concurrently(ConsortiumOrchestrator(self.config(coalesce=False)), ["same", "same"])
+        self.assertEqual(len(self.calls), 12)
+        self.assertEqual(self.flights.stats()["coalesced"], 0)
+
+    def test_followers_receive_streamed_chunks_and_errors(self):
+        release = threading.Event()
+        received = []
+
+        def work(publish):
+            publish("first ")
+            release.wait()
+            publish("second")
+            return {"ok": True}
+
+        leader = threading.Thread(target=self.flights.do, args=("key", work))
+        leader.start()
+        time.sleep(0.01)
+        follower = threading.Thread(target=self.flights.do, args=("key", work), kwargs={"on_chunk": received.append})
+        follower.start()
+        time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+        self.assertEqual(received, ["first ", "second"])
+
+        def fail(publish):
+            time.sleep(0.02)
+            raise RuntimeError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                self.flights.do("bad", fail)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(errors), 3)
+
+
+class TestAsyncCoalescing(CoalescingTestCase):
+    def test_identical_async_runs_share_one_run(self):
+        orchestrator = AsyncConsortiumOrchestrator(self.config())
+
+        async def run_all():
+            return await asyncio.gather(*(orchestrator.orchestrate("same") for _ in range(4)))
+
+        results = asyncio.run(run_all())
+        self.assertEqual(sorted(self.calls), ["arbiter", "model1", "model1"])
+        self.assertEqual(sum(bool(r["metadata"].get("coalesced")) for r in results), 3)
+        self.assertEqual(self.flights.stats()["saved_calls"], 9)
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        orchestrator = AsyncConsortiumOrchestrator(self.config())
+
+        async def scenario():
+            leader = asyncio.ensure_future(orchestrator.orchestrate("same"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.ensure_future(orchestrator.orchestrate("same"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+
+        result = asyncio.run(scenario())
+        self.assertEqual(result["synthesis"]["synthesis"], "shared answer")
+        self.assertEqual(sorted(self.calls), ["arbiter", "model1", "model1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
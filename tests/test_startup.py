@@ -0,0 +1,122 @@
+import json
+import pathlib
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import click
+import sqlite_utils
+from click.testing import CliRunner
+
+import llm_consortium
+from llm_consortium import ConsortiumConfig, ConsortiumModel, register_commands
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+PROBE = """
+import builtins, logging, sys
+opened = []
+real_open = builtins.open
+def tracking_open(file, *args, **kwargs):
+    opened.append(str(file))
+    return real_open(file, *args, **kwargs)
+builtins.open = tracking_open
+import llm_consortium
+builtins.open = real_open
+print(sorted(m for m in ("llm.cli",) if m in sys.modules))
+print(len(logging.getLogger().handlers))
+print(any(path.endswith("system_prompt.txt") for path in opened))
+"""
+
+
+class TestImport(unittest.TestCase):
+    def test_import_does_no_startup_work(self):
+        output = subprocess.run([sys.executable, "-c", PROBE], check=True,
+                                capture_output=True, text=True).stdout.split("\n")
+        self.assertEqual(output[0], "[]")
+        self.assertEqual(output[1], "0")
+        self.assertEqual(output[2], "False")
+
+    def test_default_system_prompt_still_available(self):
+        expected = (pathlib.Path(llm_consortium.__file__).parent / "system_prompt.txt").read_text().strip()
+        self.assertEqual(llm_consortium.DEFAULT_SYSTEM_PROMPT, expected)
+
+
+class TestConfigIndex(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = pathlib.Path(tmp.name)
+        patcher = patch('llm_consortium.user_dir', return_value=self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Each test gets a fresh thread-local connection to its own logs.db
+        llm_consortium.DatabaseConnection._thread_local.__dict__.pop('db', None)
+        self.addCleanup(llm_consortium.DatabaseConnection._thread_local.__dict__.pop, 'db', None)
+
+    def registered(self):
+        models = {}
+        llm_consortium.register_models(lambda model, aliases=None: models.setdefault(model.model_id, model))
+        return models
+
+    def test_register_models_reads_index_without_database(self):
+        config = {"models": {"model1": 1}, "arbiter": "arbiter"}
+        llm_consortium.config_index_path().write_text(json.dumps({"fast": config, "broken": {"models": {}}}))
+        with patch('llm_consortium.DatabaseConnection.get_connection') as get_connection, \
+             patch('llm_consortium.ConsortiumConfig.from_dict') as from_dict:
+            models = self.registered()
+        get_connection.assert_not_called()
+        from_dict.assert_not_called()
+        self.assertIn("fast", models)
+        self.assertNotIn("broken", models)
+        # The config is parsed on first use
+        self.assertEqual(models["fast"].config.arbiter, "arbiter")
+        self.assertIsInstance(models["fast"].config, ConsortiumConfig)
+
+    def test_save_and_remove_invalidate_index(self):
+        self.assertEqual(self.registered().keys(), {"dummy"})
+        self.assertEqual(json.loads(llm_consortium.config_index_path().read_text()), {})
+
+        llm_consortium._save_consortium_config("saved", ConsortiumConfig(models={"model1": 1}, arbiter="arbiter"))
+        self.assertFalse(llm_consortium.config_index_path().exists())
+        self.assertIn("saved", self.registered())
+        self.assertIn("saved", json.loads(llm_consortium.config_index_path().read_text()))
+
+        with patch('llm_consortium.setup_logging'):
+            result = CliRunner().invoke(cli, ["consortium", "remove", "saved"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertNotIn("saved", self.registered())
+
+    def test_rebuilding_index_closes_its_connection(self):
+        llm_consortium._save_consortium_config("saved", ConsortiumConfig(models={"model1": 1}, arbiter="arbiter"))
+        opened, real_database = [], sqlite_utils.Database
+
+        def database(*args, **kwargs):
+            opened.append(real_database(*args, **kwargs))
+            return opened[-1]
+
+        with patch('llm_consortium.sqlite_utils.Database', side_effect=database):
+            thread = threading.Thread(target=lambda: opened.append(llm_consortium._get_consortium_configs()))
+            thread.start()
+            thread.join()
+        db, configs = opened
+        self.assertIn("saved", configs)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            db.execute("select 1")
+
+    def test_model_accepts_parsed_config(self):
+        config = ConsortiumConfig(models={"model1": 1}, arbiter="arbiter")
+        self.assertIs(ConsortiumModel("c", config).config, config)
+
+
+if __name__ == '__main__':
+    unittest.main()
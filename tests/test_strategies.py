@@ -0,0 +1,178 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from llm_consortium import AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, register_commands
+from llm_consortium.strategies import RoundRobinStrategy, create_strategy
+from llm_consortium.strategies import round_robin
+from llm_consortium.strategies.base import ConsortiumStrategy
+from llm_consortium.strategies.factory import _strategy_registry
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+ARBITER_TEXT = "<synthesis>combined</synthesis><confidence>0.1</confidence>"
+MODELS = {"a": 1, "b": 2, "c": 1}
+
+
+class RecordingModels:
+    def __init__(self):
+        self.prompts = []
+
+    def reply(self, name, prompt):
+        self.prompts.append((name, prompt))
+        return ARBITER_TEXT if name == "arbiter" else f"{name} answer"
+
+    def get_model(self, name):
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(
+            **{"text.return_value": self.reply(name, prompt), "response_json": None})
+        return model
+
+    def get_async_model(self, name):
+        async def text(prompt):
+            await asyncio.sleep(0)
+            return self.reply(name, prompt)
+
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(text=lambda: text(prompt), response_json=None)
+        return model
+
+    def members(self):
+        return [name for name, _ in self.prompts if name != "arbiter"]
+
+
+class OnlyModelA(ConsortiumStrategy):
+    """Queries everyone, but only shows model a's answers to the arbiter."""
+
+    def select_models(self, available_models, current_prompt, iteration):
+        return available_models
+
+    def process_responses(self, successful_responses, iteration):
+        return [r for r in successful_responses if r["model"] == "a"]
+
+    def update_state(self, iteration_context):
+        self.iteration_state.setdefault("seen", []).append(iteration_context.iteration)
+
+
+class StrategyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.models = RecordingModels()
+        for patcher in (patch('llm_consortium.llm.get_model', side_effect=self.models.get_model),
+                        patch('llm_consortium.llm.get_async_model', side_effect=self.models.get_async_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def config(self, **kwargs):
+        return ConsortiumConfig(models=MODELS, arbiter="arbiter", max_iterations=3, confidence_threshold=0.9,
+                                coalesce=False, **kwargs)
+
+
+class TestRoundRobinStrategy(unittest.TestCase):
+    def strategy(self, key, **params):
+        strategy = RoundRobinStrategy(MagicMock(config_key=key, max_iterations=2), params)
+        strategy.initialize_state()
+        return strategy
+
+    def test_rotates_over_iterations_and_runs(self):
+        first = self.strategy("rotation")
+        self.assertEqual(first.select_models(MODELS, "", 1), {"a": 1})
+        self.assertEqual(first.select_models(MODELS, "", 2), {"b": 2})
+        # The next run carries on where this one's iterations end
+        self.assertEqual(self.strategy("rotation").select_models(MODELS, "", 1), {"c": 1})
+
+    def test_rotations_are_bounded(self):
+        with patch('llm_consortium.strategies.round_robin.MAX_ROTATIONS', 2):
+            first = self.strategy("oldest")
+            self.strategy("middle")
+            self.strategy("newest")
+            self.assertEqual(list(round_robin._next_start)[-2:], ["middle", "newest"])
+            self.assertNotIn("oldest", round_robin._next_start)
+            # A forgotten consortium starts its rotation over
+            self.assertEqual(self.strategy("oldest").select_models(MODELS, "", 1), first.select_models(MODELS, "", 1))
+
+    def test_models_per_iteration(self):
+        strategy = self.strategy("pairs", models_per_iteration=2)
+        self.assertEqual(strategy.select_models(MODELS, "", 1), {"a": 1, "b": 2})
+        self.assertEqual(strategy.select_models(MODELS, "", 2), {"c": 1, "a": 1})
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            create_strategy("round_robin", None, {"models_per_iteration": 0})
+        with self.assertRaises(ValueError):
+            create_strategy("no_such_strategy", None)
+
+    def test_registered(self):
+        self.assertIs(_strategy_registry["round_robin"], RoundRobinStrategy)
+
+
+class TestOrchestratorStrategies(StrategyTestCase):
+    def test_default_strategy_queries_every_member(self):
+        result = ConsortiumOrchestrator(self.config()).orchestrate("question")
+        self.assertEqual(len(self.models.members()), 3 * 4)
+        selections = result["metadata"]["strategy"]["selections"]
+        self.assertEqual([s["instances"] for s in selections], [4, 4, 4])
+
+    def test_round_robin_makes_fewer_calls(self):
+        result = ConsortiumOrchestrator(self.config(strategy="round_robin")).orchestrate("question")
+        self.assertEqual(len(self.models.members()), 1 + 2 + 1)
+        metadata = result["metadata"]
+        self.assertEqual(metadata["strategy"]["name"], "round_robin")
+        self.assertEqual([s["models"] for s in metadata["strategy"]["selections"]], [{"a": 1}, {"b": 2}, {"c": 1}])
+        self.assertEqual(metadata["model_calls"], 4 + 3)
+
+    def test_async_round_robin(self):
+        orchestrator = AsyncConsortiumOrchestrator(self.config(strategy="round_robin",
+                                                               strategy_params={"models_per_iteration": 2}))
+        result = asyncio.run(orchestrator.orchestrate("question"))
+        # Pairs of models taking turns: every model is queried in two of the three iterations
+        self.assertEqual([len(s["models"]) for s in result["metadata"]["strategy"]["selections"]], [2, 2, 2])
+        self.assertEqual(sorted(set(self.models.members())), ["a", "b", "c"])
+        self.assertEqual(len(self.models.members()), 2 * 4)
+
+    def test_processed_responses_reach_the_arbiter(self):
+        _strategy_registry["only_a"] = OnlyModelA
+        self.addCleanup(_strategy_registry.pop, "only_a")
+        orchestrator = ConsortiumOrchestrator(self.config(strategy="only_a"))
+        run = orchestrator._new_run()
+        with patch.object(orchestrator, '_new_run', return_value=run):
+            result = orchestrator.orchestrate("question")
+
+        arbiter_prompt = next(prompt for name, prompt in self.models.prompts if name == "arbiter")
+        self.assertIn("a answer", arbiter_prompt)
+        self.assertNotIn("b answer", arbiter_prompt)
+        # Every answer is still reported
+        self.assertEqual(len(result["model_responses_final_iteration"]), 4)
+        self.assertEqual(run.strategy.iteration_state["seen"], [1, 2, 3])
+
+    def test_unknown_strategy_fails_early(self):
+        with self.assertRaises(ValueError):
+            ConsortiumOrchestrator(self.config(strategy="no_such_strategy"))
+
+
+class TestStrategyOptions(unittest.TestCase):
+    @patch('llm_consortium._save_consortium_config')
+    def test_save_with_strategy(self, mock_save):
+        result = CliRunner().invoke(cli, ["consortium", "save", "team", "-m", "a", "-m", "b", "--arbiter", "arbiter",
+                                          "--strategy", "round_robin", "--strategy-param", "models_per_iteration=2"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        config = mock_save.call_args[0][1]
+        self.assertEqual((config.strategy, config.strategy_params), ("round_robin", {"models_per_iteration": 2}))
+
+    def test_invalid_strategy_param(self):
+        result = CliRunner().invoke(cli, ["consortium", "save", "team", "-m", "a", "--arbiter", "arbiter",
+                                          "--strategy", "round_robin", "--strategy-param", "models_per_iteration=0"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("models_per_iteration", result.output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from llm_consortium import (TRUNCATED_STREAM_NOTICE, AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumModel,
+                            ConsortiumOrchestrator)
+from llm_consortium.streaming import SynthesisStreamer
+
+ARBITER_CHUNKS = [
+    "<think>weighing answers</think>\n<synthesis_output>\n<analysis>fine</analysis>\n<synth",
+    "esis>\n   Paris is the ",
+    "capital of France. ",
+    "</synth",
+    "esis>\n<confidence>0.9</confidence>\n<needs_iteration>false</needs_iteration>\n</synthesis_output>",
+]
+
+
+def stream(chunks):
+    emitted = []
+    streamer = SynthesisStreamer(emitted.append)
+    for chunk in chunks:
+        streamer.feed(chunk)
+    return emitted
+
+
+class TestSynthesisStreamer(unittest.TestCase):
+    def test_tags_split_across_chunks(self):
+        emitted = stream(ARBITER_CHUNKS)
+        self.assertEqual("".join(emitted), "Paris is the capital of France.")
+        self.assertGreater(len(emitted), 1)
+
+    def test_only_first_synthesis_is_streamed(self):
+        emitted = stream(["<SYNTHESIS>one</SYNTHESIS> <synthesis>two</synthesis>"])
+        self.assertEqual(emitted, ["one"])
+
+    def test_no_tag_emits_nothing(self):
+        self.assertEqual(stream(["<synthesis_output>no tag here", " < less than"]), [])
+
+    def test_inner_markup_is_kept(self):
+        emitted = stream(["<synthesis>use <b>bold</b", "> text</synthesis>"])
+        self.assertEqual("".join(emitted), "use <b>bold</b> text")
+
+
+class StreamingResponse:
+    """Yields its chunks one by one, optionally waiting on a gate after the first."""
+
+    def __init__(self, chunks, gate=None):
+        self.chunks = chunks
+        self.gate = gate
+        self.response_json = None
+
+    def __iter__(self):
+        for i, chunk in enumerate(self.chunks):
+            if i == 2 and self.gate is not None:
+                self.gate.wait(5)
+            yield chunk
+
+    def text(self):
+        return "".join(self.chunks)
+
+    def log_to_db(self, db):
+        pass
+
+
+class StreamingModel:
+    def __init__(self, chunks, gate=None):
+        self.chunks = chunks
+        self.gate = gate
+        self.calls = 0
+
+    def prompt(self, prompt, stream=True):
+        self.calls += 1
+        return StreamingResponse(self.chunks, self.gate)
+
+
+def member_responses(prompt, run=None):
+    return [{"model": "model1", "instance": 1, "response": "Paris", "confidence": 0.9}]
+
+
+class TestOrchestratorStreaming(unittest.TestCase):
+    @patch('llm_consortium.log_response')
+    def test_only_last_iteration_is_streamed(self, mock_log_response):
+        low_confidence = [c.replace("0.9", "0.1") for c in ARBITER_CHUNKS]
+        arbiter = StreamingModel(low_confidence)
+        orchestrator = ConsortiumOrchestrator(
+            ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", max_iterations=2, confidence_threshold=0.8)
+        )
+        emitted = []
+        with patch('llm_consortium.llm.get_model', return_value=arbiter), \
+             patch.object(orchestrator, '_get_model_responses', side_effect=member_responses):
+            result = orchestrator.orchestrate("capital?", on_synthesis_chunk=emitted.append)
+
+        self.assertEqual(arbiter.calls, 2)
+        self.assertEqual(result["metadata"]["iteration_count"], 2)
+        # Streamed exactly once, and matching the parsed synthesis
+        self.assertEqual("".join(emitted), result["synthesis"]["synthesis"])
+
+    @patch('llm_consortium.log_response')
+    def test_async_orchestrator_streams(self, mock_log_response):
+        class AsyncStreamingResponse(StreamingResponse):
+            async def __aiter__(self):
+                for chunk in self.chunks:
+                    yield chunk
+
+            async def text(self):
+                return "".join(self.chunks)
+
+        class AsyncStreamingModel(StreamingModel):
+            def prompt(self, prompt, stream=True):
+                return AsyncStreamingResponse(self.chunks)
+
+        orchestrator = AsyncConsortiumOrchestrator(
+            ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", max_iterations=1)
+        )
+        emitted = []
+
+        async def responses(prompt, run=None):
+            return member_responses(prompt)
+
+        async def run_test():
+            with patch('llm_consortium.llm.get_async_model', return_value=AsyncStreamingModel(ARBITER_CHUNKS)), \
+                 patch.object(orchestrator, '_get_model_responses', side_effect=responses):
+                return await orchestrator.orchestrate("capital?", on_synthesis_chunk=emitted.append)
+
+        result = asyncio.run(run_test())
+        self.assertEqual("".join(emitted), result["synthesis"]["synthesis"])
+
+    @patch('llm_consortium.log_response')
+    def test_arbiter_timeout_revokes_its_stream(self, mock_log_response):
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        orchestrator = ConsortiumOrchestrator(ConsortiumConfig(
+            models={"model1": 1}, arbiter="arbiter", max_iterations=1, model_timeouts={"arbiter": 0.3}))
+        emitted = []
+        with patch('llm_consortium.llm.get_model', return_value=StreamingModel(ARBITER_CHUNKS, gate)), \
+             patch.object(orchestrator, '_get_model_responses', side_effect=member_responses):
+            result = orchestrator.orchestrate("capital?", on_synthesis_chunk=emitted.append)
+        partial = "".join(emitted)
+        self.assertTrue(partial)
+        self.assertTrue(result["metadata"]["timing"]["stream_truncated"])
+        self.assertEqual(result["synthesis"]["synthesis"], "Paris")
+
+        # The abandoned arbiter call finishes its stream, but none of it reaches the caller
+        gate.set()
+        time.sleep(0.1)
+        self.assertEqual("".join(emitted), partial)
+
+
+class TestConsortiumModelStreaming(unittest.TestCase):
+    def setUp(self):
+        self.model = ConsortiumModel(
+            "test-consortium", ConsortiumConfig(models={"model1": 1}, arbiter="arbiter", max_iterations=1)
+        )
+        self.prompt = SimpleNamespace(prompt="capital?", system=None)
+
+    @patch('llm_consortium.log_response')
+    def test_first_chunk_arrives_before_arbiter_finishes(self, mock_log_response):
+        gate = threading.Event()
+        arbiter = StreamingModel(ARBITER_CHUNKS, gate)
+        response = SimpleNamespace(response_json=None)
+        with patch('llm_consortium.llm.get_model', return_value=arbiter), \
+             patch.object(ConsortiumOrchestrator, '_get_model_responses', side_effect=member_responses):
+            chunks = self.model.execute(self.prompt, True, response, None)
+            first = next(chunks)
+            # The arbiter is still blocked mid-stream, yet the caller already has text
+            self.assertFalse(gate.is_set())
+            self.assertIsNone(response.response_json)
+            gate.set()
+            rest = list(chunks)
+
+        self.assertEqual(first + "".join(rest), "Paris is the capital of France.")
+        self.assertEqual(response.response_json["synthesis"]["confidence"], 0.9)
+
+    @patch('llm_consortium.log_response')
+    def test_arbiter_timeout_after_partial_stream(self, mock_log_response):
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        model = ConsortiumModel("test-consortium", ConsortiumConfig(
+            models={"model1": 1}, arbiter="arbiter", max_iterations=1, model_timeouts={"arbiter": 0.3}))
+        response = SimpleNamespace(response_json=None)
+        with patch('llm_consortium.llm.get_model', return_value=StreamingModel(ARBITER_CHUNKS, gate)), \
+             patch.object(ConsortiumOrchestrator, '_get_model_responses', side_effect=member_responses):
+            text = "".join(model.execute(self.prompt, True, response, None))
+
+        partial, _, fallback = text.partition(TRUNCATED_STREAM_NOTICE)
+        self.assertTrue("Paris is the capital of France.".startswith(partial) and partial)
+        self.assertEqual(fallback, "Paris")
+        self.assertEqual(response.response_json["metadata"]["timing"]["stopped_early"], "arbiter_timeout")
+
+    @patch('llm_consortium.log_response')
+    def test_non_streaming_returns_full_text(self, mock_log_response):
+        response = SimpleNamespace(response_json=None)
+        with patch('llm_consortium.llm.get_model', return_value=StreamingModel(ARBITER_CHUNKS)), \
+             patch.object(ConsortiumOrchestrator, '_get_model_responses', side_effect=member_responses):
+            chunks = list(self.model.execute(self.prompt, False, response, None))
+
+        self.assertEqual(chunks, ["Paris is the capital of France."])
+        self.assertIsNotNone(response.response_json)
+
+
+if __name__ == '__main__':
+    unittest.main()
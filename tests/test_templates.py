@@ -0,0 +1,108 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumOrchestrator
+from llm_consortium.templates import PACKAGE_DIR, PromptTemplate, TemplateError, TemplateRegistry
+
+ARBITER = "<prompt>{original_prompt}</prompt><responses>{formatted_responses}</responses>"
+
+
+class TestPromptTemplate(unittest.TestCase):
+    def test_render_matches_str_format(self):
+        text = "{{literal}} {original_prompt!r} {formatted_responses:>8} {user_instructions}"
+        values = {"original_prompt": "q", "formatted_responses": "r", "user_instructions": "u"}
+        template = PromptTemplate("arbiter", text)
+        self.assertEqual(template.render(**values), text.format(**values))
+        self.assertEqual(template.placeholders, {"original_prompt", "formatted_responses", "user_instructions"})
+
+    def test_placeholders_validated_at_load(self):
+        with self.assertRaisesRegex(TemplateError, "unknown placeholder.*orignal_prompt"):
+            PromptTemplate("arbiter", "{orignal_prompt}", allowed=frozenset({"original_prompt"}))
+        with self.assertRaisesRegex(TemplateError, "missing required.*formatted_responses"):
+            PromptTemplate("arbiter", "{original_prompt}", required=frozenset({"formatted_responses"}))
+        with self.assertRaisesRegex(TemplateError, "malformed"):
+            PromptTemplate("arbiter", "unclosed {brace")
+
+    def test_bundled_templates_are_valid(self):
+        registry = TemplateRegistry()
+        for name in registry.specs:
+            self.assertEqual(registry.get(name).path.parent, PACKAGE_DIR)
+
+
+class TestTemplateRegistry(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = pathlib.Path(tmp.name)
+        self.registry = TemplateRegistry()
+
+    def write(self, text, mtime):
+        path = self.dir / "arbiter_prompt.xml"
+        path.write_text(text)
+        os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def test_user_dir_overrides_and_reloads_on_mtime_change(self):
+        self.write(ARBITER, 1_000_000_000)
+        self.registry.register_dir(self.dir)
+        first = self.registry.get("arbiter")
+        self.assertEqual(first.text, ARBITER)
+        with patch('pathlib.Path.read_text') as read_text:
+            self.assertIs(self.registry.get("arbiter"), first)
+        read_text.assert_not_called()
+
+        self.write("changed {formatted_responses}", 2_000_000_000)
+        self.assertEqual(self.registry.get("arbiter").text, "changed {formatted_responses}")
+        self.assertEqual(self.registry.loads, 2)
+        # Other templates still come from the package
+        self.assertEqual(self.registry.get("rank").path.parent, PACKAGE_DIR)
+
+    def test_bad_edit_keeps_previous_version(self):
+        self.write(ARBITER, 1_000_000_000)
+        self.registry.register_dir(self.dir)
+        self.registry.get("arbiter")
+        self.write("{typo}", 2_000_000_000)
+        self.assertEqual(self.registry.get("arbiter").text, ARBITER)
+
+    def test_invalid_override_fails_on_first_load(self):
+        self.write("{typo}", 1_000_000_000)
+        self.registry.register_dir(self.dir)
+        with self.assertRaises(TemplateError):
+            self.registry.get("arbiter")
+
+    def test_missing_dir_rejected(self):
+        with self.assertRaises(TemplateError):
+            self.registry.register_dir(self.dir / "missing")
+
+
+class TestOrchestratorTemplates(unittest.TestCase):
+    def setUp(self):
+        self.orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"model1": 1}, arbiter="arbiter"))
+
+    def test_arbiter_prompt_rendered_from_registry(self):
+        responses = [{"id": 1, "model": "model1", "response": "answer"}]
+        registry = TemplateRegistry()
+        with patch('llm_consortium.get_template', side_effect=registry.get):
+            self.orchestrator._build_arbiter_prompt("question", responses)
+            prompt = self.orchestrator._build_arbiter_prompt("question", responses)
+        self.assertIn("<original_prompt>question</original_prompt>", prompt)
+        self.assertIn("<response>answer</response>", prompt)
+        self.assertEqual(registry.loads, 1)
+
+    def test_iteration_prompt_falls_back_without_template(self):
+        with patch('llm_consortium.get_template', side_effect=TemplateError("missing")):
+            prompt = self.orchestrator._construct_iteration_prompt("question", {"synthesis": "draft"})
+        self.assertTrue(prompt.startswith("Refining response for original prompt:\nquestion"))
+
+    def test_iteration_prompt_includes_refinement_areas(self):
+        prompt = self.orchestrator._construct_iteration_prompt(
+            "question", {"synthesis": "draft", "refinement_areas": ["units", "sources"]})
+        self.assertIn("<original_prompt>question</original_prompt>", prompt)
+        self.assertIn("units\nsources", prompt)
+
+
+if __name__ == '__main__':
+    unittest.main()
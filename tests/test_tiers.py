@@ -0,0 +1,158 @@
+import asyncio
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from llm_consortium import (AsyncConsortiumOrchestrator, ConsortiumConfig, ConsortiumOrchestrator, parse_models,
+                            parse_tiers, register_commands)
+
+
+@click.group()
+def cli():
+    pass
+
+register_commands(cli)
+
+
+class TestParseTiers(unittest.TestCase):
+    def test_tier_prefix(self):
+        models = ["tier1:cheap", "tier1:cheaper:2", "tier2:expensive", "plain:3"]
+        self.assertEqual(parse_models(models, 1), {"cheap": 1, "cheaper": 2, "expensive": 1, "plain": 3})
+        self.assertEqual(parse_tiers(models), {"cheap": 1, "cheaper": 1, "expensive": 2})
+
+
+class CascadeModels:
+    """The arbiter is only confident once the expensive model has answered."""
+
+    def __init__(self, confident_without_expensive=False):
+        self.confident_without_expensive = confident_without_expensive
+        self.calls = []
+
+    def reply(self, name, prompt):
+        self.calls.append(name)
+        if name != "arbiter":
+            return f"{name} answer"
+        confident = self.confident_without_expensive or "expensive answer" in prompt
+        return f"<synthesis>answer</synthesis><confidence>{0.9 if confident else 0.4}</confidence>"
+
+    def get_model(self, name):
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(
+            **{"text.return_value": self.reply(name, prompt), "response_json": None})
+        return model
+
+    def get_async_model(self, name):
+        async def text(prompt):
+            return self.reply(name, prompt)
+
+        model = MagicMock()
+        model.prompt.side_effect = lambda prompt, stream=True: MagicMock(text=lambda: text(prompt), response_json=None)
+        return model
+
+
+class TestCascade(unittest.TestCase):
+    def patch_models(self, models):
+        for patcher in (patch('llm_consortium.llm.get_model', side_effect=models.get_model),
+                        patch('llm_consortium.llm.get_async_model', side_effect=models.get_async_model),
+                        patch('llm_consortium.log_response')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def config(self, **kwargs):
+        return ConsortiumConfig(models={"cheap": 2, "middle": 1, "expensive": 1}, arbiter="arbiter",
+                                tiers={"cheap": 1, "middle": 2, "expensive": 3}, max_iterations=3,
+                                confidence_threshold=0.8, coalesce=False, **kwargs)
+
+    def test_confident_cheap_tier_never_escalates(self):
+        models = CascadeModels(confident_without_expensive=True)
+        self.patch_models(models)
+        result = ConsortiumOrchestrator(self.config()).orchestrate("question")
+        self.assertEqual(sorted(set(models.calls) - {"arbiter"}), ["cheap"])
+        tiers = result["metadata"]["tiers"]
+        self.assertEqual((tiers["answered_by"], tiers["escalations"]), (1, []))
+
+    def test_low_confidence_escalates_one_tier_at_a_time(self):
+        models = CascadeModels()
+        self.patch_models(models)
+        result = ConsortiumOrchestrator(self.config()).orchestrate("question")
+        selections = result["metadata"]["strategy"]["selections"]
+        self.assertEqual([s["models"] for s in selections],
+                         [{"cheap": 2}, {"cheap": 2, "middle": 1}, {"cheap": 2, "middle": 1, "expensive": 1}])
+        self.assertEqual([s["tier"] for s in selections], [1, 2, 3])
+        tiers = result["metadata"]["tiers"]
+        self.assertEqual(tiers["answered_by"], 3)
+        self.assertEqual([(e["from_tier"], e["to_tier"]) for e in tiers["escalations"]], [(1, 2), (2, 3)])
+        self.assertEqual(result["synthesis"]["confidence"], 0.9)
+
+    def test_no_escalation_after_the_last_iteration(self):
+        models = CascadeModels()
+        self.patch_models(models)
+        config = self.config().model_copy(update={"max_iterations": 1})
+        result = ConsortiumOrchestrator(config).orchestrate("question")
+        self.assertEqual((result["metadata"]["tiers"]["answered_by"], result["metadata"]["tiers"]["escalations"]),
+                         (1, []))
+
+    def test_async_cascade(self):
+        models = CascadeModels()
+        self.patch_models(models)
+        result = asyncio.run(AsyncConsortiumOrchestrator(self.config()).orchestrate("question"))
+        self.assertEqual(result["metadata"]["tiers"]["answered_by"], 3)
+        self.assertEqual(models.calls.count("expensive"), 1)
+
+    def strategy_run(self, strategy, **params):
+        models = CascadeModels()
+        self.patch_models(models)
+        config = ConsortiumConfig(models={"cheap": 1, "cheap2": 1, "expensive": 1}, arbiter="arbiter",
+                                  tiers={"cheap": 1, "cheap2": 1, "expensive": 2}, max_iterations=3,
+                                  confidence_threshold=0.8, coalesce=False, strategy=strategy, strategy_params=params)
+        return ConsortiumOrchestrator(config).orchestrate("question"), models
+
+    def test_bandit_sees_the_escalated_tier(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        result, models = self.strategy_run("bandit", models_per_run=1, seed=1,
+                                           path=str(pathlib.Path(tmp.name) / "bandit.db"))
+        self.assertEqual(models.calls.count("expensive"), 1)
+        selections = result["metadata"]["strategy"]["selections"]
+        self.assertEqual(len(selections), 2)
+        self.assertIn("expensive", selections[1]["models"])
+        self.assertEqual(result["metadata"]["tiers"]["answered_by"], 2)
+
+    def test_elimination_sees_the_escalated_tier(self):
+        result, models = self.strategy_run("elimination", keep=1)
+        selections = result["metadata"]["strategy"]["selections"]
+        self.assertEqual([sorted(s["models"]) for s in selections], [["cheap", "cheap2"], ["cheap", "expensive"]])
+        self.assertEqual([s["tier"] for s in selections], [1, 2])
+        self.assertEqual(result["metadata"]["tiers"]["answered_by"], 2)
+
+    def test_answered_by_is_the_highest_tier_queried(self):
+        # Round robin over one model at a time stays in tier 1 on the iteration after the escalation
+        result, models = self.strategy_run("round_robin", models_per_iteration=1)
+        selections = result["metadata"]["strategy"]["selections"]
+        for selection in selections:
+            self.assertEqual(selection["tier"], 2 if "expensive" in selection["models"] else 1)
+        self.assertEqual(result["metadata"]["tiers"]["answered_by"], selections[-1]["tier"])
+
+    def test_without_tiers(self):
+        self.patch_models(CascadeModels())
+        result = ConsortiumOrchestrator(self.config().model_copy(update={"tiers": {}})).orchestrate("question")
+        self.assertIsNone(result["metadata"]["tiers"])
+
+
+class TestTierOptions(unittest.TestCase):
+    @patch('llm_consortium._save_consortium_config')
+    def test_save_with_tiers(self, mock_save):
+        result = CliRunner().invoke(cli, ["consortium", "save", "team", "-m", "tier1:cheap:2", "-m", "tier2:expensive",
+                                          "--arbiter", "arbiter"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        config = mock_save.call_args[0][1]
+        self.assertEqual(config.models, {"cheap": 2, "expensive": 1})
+        self.assertEqual(config.tiers, {"cheap": 1, "expensive": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()